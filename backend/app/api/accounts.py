@@ -1,12 +1,17 @@
 """
 Account management API endpoints.
 """
+import time
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.core.config import settings
+from app.core.exceptions import AWSServiceException
 from app.core.logging import logger
+from app.core.responses import FastJSONResponse
 from app.middleware.cognito_auth import get_current_user, require_admin, get_dev_user, get_dev_admin
 from app.schemas.account import (
     AccountCreate,
@@ -21,7 +26,11 @@ from app.services.account_service import AccountService
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 # 🚧 DEVELOPMENT MODE: Use mock authentication
-USE_DEV_AUTH = settings.environment == "development"
+USE_DEV_AUTH = settings.use_dev_auth
+
+# Validates account records once, straight from their attributes (FastAPI's
+# response_model step is skipped because the endpoint returns a response)
+_account_list_adapter = TypeAdapter(List[AccountResponse])
 
 
 def get_account_service() -> AccountService:
@@ -71,7 +80,7 @@ async def create_account(
         )
         return AccountResponse(**account)
     except Exception as e:
-        logger.error(f"Error creating account: {e}")
+        logger.error("Error creating account: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -103,7 +112,61 @@ async def list_accounts(
         user_id=current_user["user_id"],
         user_role=current_user["role"],
     )
-    return [AccountResponse(**acc) for acc in accounts]
+    return FastJSONResponse(
+        _account_list_adapter.validate_python(accounts, from_attributes=True)
+    )
+
+
+# Registered before /{account_id} so "export" is not taken as an account ID
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export Account Inventory",
+    description="Stream the account inventory as NDJSON or CSV. Admin exports all, users only their own.",
+    response_class=StreamingResponse,
+)
+async def export_accounts(
+    request: Request,
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv"
+    ),
+    current_user: dict = Depends(get_dev_user if USE_DEV_AUTH else get_current_user),
+    service: AccountService = Depends(get_account_service),
+):
+    """
+    Export the account inventory.
+
+    Columns: account_id, account_name, account_email, region, status,
+    billing_country, created_by, created_at, updated_at, then one TPM
+    column per enabled model in the quota config (and its 1M context TPM
+    column where the model has one). Accounts are read from the database
+    page by page while the response streams.
+
+    Filtering:
+    - Admin: All accounts
+    - User: Only accounts they created
+    """
+    try:
+        # Reads the first page, so a failing database is a 503, not a cut-off file
+        stream = await service.export_inventory(
+            user_id=current_user["user_id"],
+            user_role=current_user["role"],
+            export_format=export_format,
+            ip_address=request.client.host if request.client else None,
+        )
+    except AWSServiceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+        )
+
+    filename = f"accounts-{int(time.time())}.{export_format}"
+    media_type = "text/csv; charset=utf-8" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -145,7 +208,7 @@ async def get_account(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting account {account_id}: {e}")
+        logger.error("Error getting account %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Account not found: {account_id}",
@@ -189,7 +252,7 @@ async def export_credentials(
 
         return CredentialsResponse(**credentials)
     except Exception as e:
-        logger.error(f"Error exporting credentials for {account_id}: {e}")
+        logger.error("Error exporting credentials for %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -218,7 +281,7 @@ async def get_billing_address(
         billing = await service.get_billing_address(account_id)
         return BillingAddress(**billing)
     except Exception as e:
-        logger.error(f"Error getting billing address for {account_id}: {e}")
+        logger.error("Error getting billing address for %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
@@ -261,7 +324,7 @@ async def update_billing_address(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating billing address for {account_id}: {e}")
+        logger.error("Error updating billing address for %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -293,7 +356,7 @@ async def get_quota(
         # QuotaResponse has extra="allow" to accept dynamic fields
         return QuotaResponse(**quota)
     except Exception as e:
-        logger.error(f"Error getting quota for {account_id}: {e}")
+        logger.error("Error getting quota for %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
@@ -331,7 +394,7 @@ async def refresh_quota(
             "quota": quota,
         }
     except Exception as e:
-        logger.error(f"Error refreshing quota for {account_id}: {e}")
+        logger.error("Error refreshing quota for %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -379,7 +442,7 @@ async def delete_account(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting account {account_id}: {e}")
+        logger.error("Error deleting account %s: %s", account_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
@@ -1,24 +1,52 @@
 """
-Admin API endpoints for configuration management.
+Admin API endpoints for configuration management and audit logs.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
 
 from app.core.config import settings
-from app.core.exceptions import PermissionDeniedException
+from app.core.exceptions import AWSServiceException, PermissionDeniedException
 from app.core.logging import logger
-from app.db.quota_config_manager import QuotaConfigManager
+from app.core.responses import FastJSONResponse
+from app.db.repositories import (
+    AuditLogRepository,
+    QuotaConfigRepository,
+    get_audit_log_repository,
+    get_quota_config_repository,
+)
 from app.middleware.cognito_auth import get_current_user, get_dev_user
-from app.schemas.admin import QuotaConfigResponse, QuotaConfigUpdate
+from app.schemas.admin import ProfileInfo, QuotaConfigResponse, QuotaConfigUpdate
+from app.schemas.audit import AuditLogPage
+from app.services.audit_export import AuditLogExporter, ExportCheckpoint, gzip_stream
+from app.services.profiling import ProfileStore, get_profile_store
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 # 🚧 DEVELOPMENT MODE: Use mock authentication
-USE_DEV_AUTH = settings.environment == "development"
+USE_DEV_AUTH = settings.use_dev_auth
+
+
+def get_quota_config_manager() -> QuotaConfigRepository:
+    """Dependency injection for the quota config repository."""
+    return get_quota_config_repository()
+
 
+def get_audit_log_manager() -> AuditLogRepository:
+    """Dependency injection for the audit log repository."""
+    return get_audit_log_repository()
 
-def get_quota_config_manager() -> QuotaConfigManager:
-    """Dependency injection for QuotaConfigManager."""
-    return QuotaConfigManager()
+
+def _to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """Convert a query datetime to epoch seconds (naive values are UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
 
 
 def require_admin(
@@ -42,7 +70,7 @@ def require_admin(
 )
 async def get_quota_config(
     current_user: dict = Depends(require_admin),
-    manager: QuotaConfigManager = Depends(get_quota_config_manager),
+    manager: QuotaConfigRepository = Depends(get_quota_config_manager),
 ):
     """
     Get quota configuration.
@@ -55,18 +83,18 @@ async def get_quota_config(
 
     Requires: Admin role
     """
-    logger.info(f"[get_quota_config] Admin {current_user['user_id']} requested quota configuration")
+    logger.info("[get_quota_config] Admin %s requested quota configuration", current_user["user_id"])
 
     config = manager.get_config()
-    logger.debug(f"[get_quota_config] Config from manager: {config}")
+    logger.debug("[get_quota_config] Config from manager: %s", config)
 
     # If no config exists, initialize default
     if not config:
         logger.info("[get_quota_config] No quota configuration found, initializing default")
         config = manager.initialize_default_config(current_user["user_id"])
-        logger.debug(f"[get_quota_config] Initialized config: {config}")
+        logger.debug("[get_quota_config] Initialized config: %s", config)
     else:
-        logger.info(f"[get_quota_config] Found existing config with {len(config.get('models', []))} models")
+        logger.info("[get_quota_config] Found existing config with %s models", len(config.get("models", [])))
 
     return config
 
@@ -81,7 +109,7 @@ async def get_quota_config(
 async def update_quota_config(
     config_update: QuotaConfigUpdate,
     current_user: dict = Depends(require_admin),
-    manager: QuotaConfigManager = Depends(get_quota_config_manager),
+    manager: QuotaConfigRepository = Depends(get_quota_config_manager),
 ):
     """
     Update quota configuration.
@@ -97,7 +125,9 @@ async def update_quota_config(
     Requires: Admin role
     """
     logger.info(
-        f"Admin {current_user['user_id']} updating quota configuration with {len(config_update.models)} models"
+        "Admin %s updating quota configuration with %s models",
+        current_user["user_id"],
+        len(config_update.models),
     )
 
     # Validate: at most 2 models can have show_in_dashboard=True
@@ -119,5 +149,215 @@ async def update_quota_config(
             detail="Failed to update quota configuration",
         )
 
-    logger.info(f"Quota configuration updated by {current_user['user_id']}")
+    logger.info("Quota configuration updated by %s", current_user["user_id"])
     return config
+
+
+@router.get(
+    "/audit-logs",
+    response_model=AuditLogPage,
+    status_code=status.HTTP_200_OK,
+    summary="Query Audit Logs",
+    description="Query audit logs by user, action, resource and time range (Admin only).",
+)
+async def list_audit_logs(
+    user_id: Optional[str] = Query(None, description="Filter by acting user"),
+    action: Optional[str] = Query(None, description="Filter by action type"),
+    resource_id: Optional[str] = Query(None, description="Filter by resource ID"),
+    start: Optional[datetime] = Query(
+        None, description="Inclusive start (ISO 8601 or epoch seconds, UTC if naive)"
+    ),
+    end: Optional[datetime] = Query(
+        None, description="Inclusive end (ISO 8601 or epoch seconds, UTC if naive)"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    current_user: dict = Depends(require_admin),
+    manager: AuditLogRepository = Depends(get_audit_log_manager),
+):
+    """
+    Query audit logs.
+
+    Filtering by resource_id or user_id uses a timestamp-sorted index
+    (newest first). Other queries scan the table and are unordered.
+
+    Returns:
+    - Page of audit log entries and an opaque next_cursor
+
+    Requires: Admin role
+    """
+    start_time = _to_epoch(start)
+    end_time = _to_epoch(end)
+    if start_time is not None and end_time is not None and start_time > end_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+
+    logger.info(
+        "Admin %s querying audit logs (user_id=%s, action=%s, resource_id=%s)",
+        current_user["user_id"],
+        user_id,
+        action,
+        resource_id,
+    )
+
+    try:
+        items, next_cursor = manager.query_logs(
+            user_id=user_id,
+            action=action,
+            resource_id=resource_id,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {e}",
+        )
+    except AWSServiceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+        )
+
+    # Validated once here; returning the response skips the response_model pass
+    return FastJSONResponse(
+        AuditLogPage(items=items, count=len(items), next_cursor=next_cursor)
+    )
+
+
+@router.get(
+    "/audit-logs/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export Audit Logs",
+    description="Stream audit logs as NDJSON, optionally gzipped and resumable (Admin only).",
+)
+async def export_audit_logs(
+    request: Request,
+    user_id: Optional[str] = Query(None, description="Filter by acting user"),
+    action: Optional[str] = Query(None, description="Filter by action type"),
+    resource_id: Optional[str] = Query(None, description="Filter by resource ID"),
+    start: Optional[datetime] = Query(
+        None, description="Inclusive start (default: 90 days before end)"
+    ),
+    end: Optional[datetime] = Query(None, description="Inclusive end (default: now)"),
+    gzip: bool = Query(False, description="Gzip the stream"),
+    resume: Optional[str] = Query(
+        None, description="Checkpoint token from an interrupted export (filters are ignored)"
+    ),
+    current_user: dict = Depends(require_admin),
+    manager: AuditLogRepository = Depends(get_audit_log_manager),
+):
+    """
+    Export audit logs.
+
+    Streams one JSON object per line. A {"_checkpoint": token} line follows
+    every page, and the stream ends with {"_complete": true}. Pass the last
+    token as 'resume' to continue an interrupted export.
+
+    Requires: Admin role
+    """
+    exporter = AuditLogExporter(manager)
+    try:
+        if resume:
+            checkpoint = ExportCheckpoint.decode(resume)
+        else:
+            checkpoint = exporter.plan(
+                user_id=user_id,
+                action=action,
+                resource_id=resource_id,
+                start_time=_to_epoch(start),
+                end_time=_to_epoch(end),
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    manager.log_action(
+        user_id=current_user["user_id"],
+        action="export_audit_logs",
+        resource_type="audit_logs",
+        resource_id="*",
+        details={
+            "user_id": checkpoint.user_id,
+            "action": checkpoint.action,
+            "resource_id": checkpoint.resource_id,
+            "start_time": checkpoint.start_time,
+            "end_time": checkpoint.end_time,
+            "resumed": bool(resume),
+        },
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+    )
+
+    stream = exporter.iter_chunks(checkpoint)
+    filename = f"audit-logs-{checkpoint.start_time}-{checkpoint.end_time}.ndjson"
+    media_type = "application/x-ndjson"
+    if gzip:
+        stream = gzip_stream(stream)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/profiles",
+    response_model=List[ProfileInfo],
+    status_code=status.HTTP_200_OK,
+    summary="List Request Profiles",
+    description="List recent request profiles, newest first (Admin only).",
+)
+async def list_profiles(
+    limit: int = Query(50, ge=1, le=500, description="Maximum profiles to return"),
+    current_user: dict = Depends(require_admin),
+    store: ProfileStore = Depends(get_profile_store),
+):
+    """
+    List stored request profiles.
+
+    Profile a request by sending X-Profile: 1 (or ?profile=1) as an admin
+    while PROFILING_ENABLED=true; its ID is returned in X-Profile-Id.
+
+    Requires: Admin role
+    """
+    return await asyncio.to_thread(store.list, limit=limit)
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Download Request Profile",
+    description="Download a profile (speedscope JSON or pstats) (Admin only).",
+)
+async def download_profile(
+    profile_id: str,
+    current_user: dict = Depends(require_admin),
+    store: ProfileStore = Depends(get_profile_store),
+):
+    """
+    Download a stored profile.
+
+    speedscope JSON opens at https://www.speedscope.app; pstats files work
+    with snakeviz or python -m pstats.
+
+    Requires: Admin role
+    """
+    found = await asyncio.to_thread(store.get, profile_id)
+    if found is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile not found: {profile_id}",
+        )
+
+    path, meta = found
+    media_type = (
+        "application/json" if meta["profiler"] == "pyinstrument" else "application/octet-stream"
+    )
+    return FileResponse(path, media_type=media_type, filename=meta["filename"])
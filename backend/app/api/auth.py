@@ -10,7 +10,7 @@ from app.schemas.auth import CognitoConfig, UserInfo
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 # 🚧 DEVELOPMENT MODE: Use mock authentication
-USE_DEV_AUTH = settings.environment == "development"
+USE_DEV_AUTH = settings.use_dev_auth
 
 
 @router.get(
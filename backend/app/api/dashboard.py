@@ -1,17 +1,20 @@
 """
 Dashboard API endpoints.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
 from app.core.config import settings
+from app.core.responses import FastJSONResponse
 from app.middleware.cognito_auth import get_current_user, get_dev_user
-from app.schemas.dashboard import DashboardStats, DashboardModelQuota, QuotaSummary
+from app.schemas.dashboard import DashboardStats
 from app.services.account_service import AccountService
+from app.services.event_bus import DashboardEvent, get_event_bus
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 # 🚧 DEVELOPMENT MODE: Use mock authentication
-USE_DEV_AUTH = settings.environment == "development"
+USE_DEV_AUTH = settings.use_dev_auth
 
 
 def get_account_service() -> AccountService:
@@ -44,8 +47,8 @@ async def get_dashboard_stats(
     - User: Statistics for accounts they created
     """
     # Get quota config to determine which models to show in dashboard
-    from app.db.quota_config_manager import QuotaConfigManager
-    quota_config_manager = QuotaConfigManager()
+    from app.db.repositories import get_quota_config_repository
+    quota_config_manager = get_quota_config_repository()
     quota_config = quota_config_manager.get_config()
 
     # Get models marked for dashboard display (max 2)
@@ -118,7 +121,7 @@ async def get_dashboard_stats(
 
         # Include account if it has any quota
         if has_quota:
-            accounts_with_quota.append(QuotaSummary(**quota_summary_data))
+            accounts_with_quota.append(quota_summary_data)
 
     # Build model_quotas list with appropriate icons and gradients
     model_quotas = []
@@ -145,20 +148,75 @@ async def get_dashboard_stats(
             gradient = "from-gray-500 to-gray-600"
             bg_color = "bg-gray-50 dark:bg-gray-800/50"
 
-        model_quotas.append(DashboardModelQuota(
-            model_id=model_id,
-            display_name=display_name,
-            total_tpm=model_totals.get(model_id, 0),
-            icon_name=icon_name,
-            gradient=gradient,
-            bg_color=bg_color,
-        ))
-
-    return DashboardStats(
-        total_accounts=total_accounts,
-        active_accounts=active_accounts,
-        total_sonnet_tpm=total_sonnet_tpm,
-        total_opus_tpm=total_opus_tpm,
-        model_quotas=model_quotas,
-        accounts_with_quota=accounts_with_quota,
+        model_quotas.append({
+            "model_id": model_id,
+            "display_name": display_name,
+            "total_tpm": model_totals.get(model_id, 0),
+            "icon_name": icon_name,
+            "gradient": gradient,
+            "bg_color": bg_color,
+        })
+
+    # Validate the whole response once (returning a response skips FastAPI's
+    # second response_model validation)
+    stats = DashboardStats.model_validate({
+        "total_accounts": total_accounts,
+        "active_accounts": active_accounts,
+        "total_sonnet_tpm": total_sonnet_tpm,
+        "total_opus_tpm": total_opus_tpm,
+        "model_quotas": model_quotas,
+        "accounts_with_quota": accounts_with_quota,
+    })
+    return FastJSONResponse(stats)
+
+
+@router.get(
+    "/events",
+    status_code=status.HTTP_200_OK,
+    summary="Stream Dashboard Events",
+    description="Server-Sent Events stream of account, quota and dashboard totals changes.",
+    response_class=StreamingResponse,
+)
+async def stream_dashboard_events(
+    request: Request,
+    current_user: dict = Depends(get_dev_user if USE_DEV_AUTH else get_current_user),
+):
+    """
+    Stream dashboard events.
+
+    Event types:
+    - ready: Stream established, client should load /dashboard/stats once
+    - account_created: New account (full account payload)
+    - account_deactivated: Account soft-deleted
+    - quota_refreshed: New bedrock_quota for an account
+    - totals_changed: Deltas for total_accounts, active_accounts and per-field TPM
+    - resync: Events were dropped, client should reload /dashboard/stats
+
+    Filtering:
+    - Admin: Events for all accounts
+    - User: Events for accounts they created
+    """
+    bus = get_event_bus()
+
+    async def event_stream():
+        subscription = bus.subscribe(
+            user_id=current_user["user_id"],
+            user_role=current_user["role"],
+        )
+        try:
+            yield DashboardEvent(id=0, type="ready", data={}).to_sse()
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=settings.sse_heartbeat_interval)
+                if event is None:
+                    # Comment line keeps proxies (ALB/CloudFront) from timing out
+                    yield ": keep-alive\n\n"
+                else:
+                    yield event.to_sse()
+        finally:
+            bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -1,7 +1,11 @@
 """
 Health check endpoint.
 """
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
+from fastapi.responses import JSONResponse
+
+from app.core.metrics import render_metrics
+from app.services.readiness import get_readiness_checker
 
 router = APIRouter()
 
@@ -25,3 +29,57 @@ async def health_check():
         "service": "Account Platform API",
         "version": "1.0.0",
     }
+
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    summary="Readiness Check",
+    description=(
+        "Report whether DynamoDB, KMS and the JWKS signing keys are reachable, "
+        "from cached background probes. Returns 503 when any dependency is down."
+    ),
+    tags=["health"],
+    responses={503: {"description": "A dependency is unavailable"}},
+)
+async def readiness_check():
+    """
+    Readiness check endpoint.
+
+    Only reads cached probe results, so it never calls the dependencies.
+
+    Returns:
+        JSONResponse: Overall status and per-dependency status, latency and error
+    """
+    checker = get_readiness_checker()
+    if checker is None:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting", "checks": {}},
+        )
+
+    return JSONResponse(
+        status_code=(
+            status.HTTP_200_OK if checker.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content=checker.snapshot(),
+    )
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="Prometheus Metrics",
+    description="Expose process metrics in Prometheus text format.",
+    tags=["health"],
+    include_in_schema=False,
+)
+async def metrics():
+    """
+    Metrics endpoint for Prometheus scraping.
+
+    Returns:
+        Response: Metrics in Prometheus exposition format
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
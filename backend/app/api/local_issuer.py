@@ -0,0 +1,52 @@
+"""
+Local Cognito stand-in endpoints (load testing only).
+
+Mounted only when LOCAL_ISSUER_ENABLED=true, which is rejected outside the
+development environment: /token mints tokens for any user and role.
+"""
+from fastapi import APIRouter, status
+
+from app.middleware.local_issuer import get_local_issuer
+from app.schemas.auth import LocalTokenRequest, LocalTokenResponse
+
+router = APIRouter(prefix="/local-issuer", tags=["local-issuer"])
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    status_code=status.HTTP_200_OK,
+    summary="Local Issuer JWKS",
+    description="Public keys of the local token issuer (same shape as Cognito's JWKS).",
+)
+async def get_jwks():
+    """
+    Get the local issuer's JSON Web Key Set.
+
+    Returns:
+        JWKS document
+    """
+    return get_local_issuer().jwks
+
+
+@router.post(
+    "/token",
+    response_model=LocalTokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Mint Local Token",
+    description="Mint a signed ID token with the requested sub, email and role.",
+)
+async def mint_token(request_data: LocalTokenRequest):
+    """
+    Mint a token from the local issuer.
+
+    Returns:
+        Signed ID token accepted by get_current_user/require_admin
+    """
+    token = get_local_issuer().mint(
+        sub=request_data.sub,
+        email=request_data.email,
+        role=request_data.role,
+        username=request_data.username,
+        expires_in=request_data.expires_in,
+    )
+    return LocalTokenResponse(id_token=token, expires_in=request_data.expires_in)
@@ -6,7 +6,7 @@ Loads configuration from environment variables with validation and type safety.
 from functools import lru_cache
 from typing import List, Union
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,10 +25,39 @@ class Settings(BaseSettings):
     app_version: str = Field(default="1.0.0", alias="APP_VERSION")
     environment: str = Field(default="development", alias="ENVIRONMENT")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    log_format: str = Field(default="text", alias="LOG_FORMAT")
+    # Records buffered for the background log writer (0 = write synchronously)
+    log_queue_size: int = Field(default=10000, alias="LOG_QUEUE_SIZE")
+    # Comma-separated child logger sample rates, e.g. "aws=0.1,request=0.5"
+    log_sample_rates: str = Field(default="", alias="LOG_SAMPLE_RATES")
 
     # Server Settings
     host: str = Field(default="0.0.0.0", alias="HOST")
     port: int = Field(default=8000, alias="PORT")
+    # Expose per-request AWS call timings in a Server-Timing response header
+    server_timing_enabled: bool = Field(default=True, alias="SERVER_TIMING_ENABLED")
+    loop_lag_interval: float = Field(default=0.5, alias="LOOP_LAG_INTERVAL")
+    # Background dependency probes behind /ready
+    readiness_interval: float = Field(default=10.0, alias="READINESS_INTERVAL")
+    readiness_timeout: float = Field(default=2.0, alias="READINESS_TIMEOUT")
+    # Debug: log a stack trace whenever the event loop stalls over the threshold
+    loop_block_detection: bool = Field(default=False, alias="LOOP_BLOCK_DETECTION")
+    loop_block_threshold: float = Field(default=0.1, alias="LOOP_BLOCK_THRESHOLD")
+
+    # Response compression (gzip; br/zstd with the compression extra)
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_encodings: str = Field(default="zstd,br,gzip", alias="COMPRESSION_ENCODINGS")
+    compression_min_size: int = Field(default=1024, alias="COMPRESSION_MIN_SIZE")
+    compression_offload_size: int = Field(default=262144, alias="COMPRESSION_OFFLOAD_SIZE")
+    compression_gzip_level: int = Field(default=6, alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(default=4, alias="COMPRESSION_BROTLI_QUALITY")
+    compression_zstd_level: int = Field(default=3, alias="COMPRESSION_ZSTD_LEVEL")
+
+    # Admin request profiling (X-Profile: 1 or ?profile=1)
+    profiling_enabled: bool = Field(default=False, alias="PROFILING_ENABLED")
+    profiler: str = Field(default="auto", alias="PROFILER")
+    profile_dir: str = Field(default=".profiles", alias="PROFILE_DIR")
+    profile_max_files: int = Field(default=50, alias="PROFILE_MAX_FILES")
 
     # API Settings
     api_prefix: str = Field(default="/api", alias="API_PREFIX")
@@ -43,6 +72,11 @@ class Settings(BaseSettings):
     aws_region: str = Field(default="us-east-1", alias="AWS_REGION")
     aws_access_key_id: str | None = Field(default=None, alias="AWS_ACCESS_KEY_ID")
     aws_secret_access_key: str | None = Field(default=None, alias="AWS_SECRET_ACCESS_KEY")
+    # Fake AWS API endpoint for benchmarks (rejected in production)
+    aws_api_endpoint_url: str | None = Field(default=None, alias="AWS_API_ENDPOINT_URL")
+
+    # Storage Settings
+    storage_backend: str = Field(default="dynamodb", alias="STORAGE_BACKEND")
 
     # DynamoDB Settings
     dynamodb_endpoint_url: str | None = Field(default=None, alias="DYNAMODB_ENDPOINT_URL")
@@ -59,6 +93,21 @@ class Settings(BaseSettings):
         default="account-platform-quota-config", alias="QUOTA_CONFIG_TABLE_NAME"
     )
 
+    # Audit Log Settings
+    audit_buffer_enabled: bool = Field(default=True, alias="AUDIT_BUFFER_ENABLED")
+    audit_flush_size: int = Field(default=25, alias="AUDIT_FLUSH_SIZE")
+    audit_flush_interval: float = Field(default=1.0, alias="AUDIT_FLUSH_INTERVAL")
+    audit_buffer_max_size: int = Field(default=10000, alias="AUDIT_BUFFER_MAX_SIZE")
+    # Write credential exports synchronously and fail the export if the write fails
+    audit_export_must_persist: bool = Field(default=True, alias="AUDIT_EXPORT_MUST_PERSIST")
+    audit_details_compress_threshold: int = Field(
+        default=512, alias="AUDIT_DETAILS_COMPRESS_THRESHOLD"
+    )
+    audit_export_partitions: int = Field(default=8, alias="AUDIT_EXPORT_PARTITIONS")
+    audit_export_concurrency: int = Field(default=4, alias="AUDIT_EXPORT_CONCURRENCY")
+    audit_export_page_size: int = Field(default=500, alias="AUDIT_EXPORT_PAGE_SIZE")
+    account_export_page_size: int = Field(default=500, alias="ACCOUNT_EXPORT_PAGE_SIZE")
+
     # KMS Settings
     kms_key_id: str = Field(default="", alias="KMS_KEY_ID")
 
@@ -66,6 +115,27 @@ class Settings(BaseSettings):
     cognito_user_pool_id: str = Field(default="", alias="COGNITO_USER_POOL_ID")
     cognito_client_id: str = Field(default="", alias="COGNITO_CLIENT_ID")
     cognito_region: str = Field(default="us-east-1", alias="COGNITO_REGION")
+    jwks_cache_ttl: float = Field(default=3600.0, alias="JWKS_CACHE_TTL")
+    jwks_min_refresh_interval: float = Field(default=30.0, alias="JWKS_MIN_REFRESH_INTERVAL")
+    jwks_fetch_timeout: float = Field(default=5.0, alias="JWKS_FETCH_TIMEOUT")
+    token_cache_size: int = Field(default=10000, alias="TOKEN_CACHE_SIZE")
+    jwt_backend: str = Field(default="jose", alias="JWT_BACKEND")
+    # Override the derived Cognito issuer / JWKS URLs (e.g. for a stand-in IdP)
+    cognito_issuer_url: str | None = Field(default=None, alias="COGNITO_ISSUER_URL")
+    cognito_jwks_url: str | None = Field(default=None, alias="COGNITO_JWKS_URL")
+
+    # Local Issuer Settings (load testing only, development environment only)
+    local_issuer_enabled: bool = Field(default=False, alias="LOCAL_ISSUER_ENABLED")
+    local_issuer_url: str = Field(
+        default="http://localhost:8000/local-issuer", alias="LOCAL_ISSUER_URL"
+    )
+    local_issuer_key_file: str | None = Field(
+        default=".local-issuer-key.pem", alias="LOCAL_ISSUER_KEY_FILE"
+    )
+
+    # Dashboard Event Stream Settings
+    event_queue_size: int = Field(default=100, alias="EVENT_QUEUE_SIZE")
+    sse_heartbeat_interval: float = Field(default=15.0, alias="SSE_HEARTBEAT_INTERVAL")
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -85,6 +155,57 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v
 
+    @field_validator("log_format")
+    @classmethod
+    def validate_log_format(cls, v):
+        """Validate log format."""
+        valid_formats = ["text", "json"]
+        v = v.lower()
+        if v not in valid_formats:
+            raise ValueError(f"Log format must be one of {valid_formats}")
+        return v
+
+    @field_validator("profiler")
+    @classmethod
+    def validate_profiler(cls, v):
+        """Validate profiler choice."""
+        valid_profilers = ["auto", "pyinstrument", "cprofile"]
+        v = v.lower()
+        if v not in valid_profilers:
+            raise ValueError(f"Profiler must be one of {valid_profilers}")
+        return v
+
+    @field_validator("compression_encodings")
+    @classmethod
+    def validate_compression_encodings(cls, v):
+        """Validate compression encodings (comma-separated, most preferred first)."""
+        valid_encodings = ["zstd", "br", "gzip"]
+        encodings = [e.strip().lower() for e in v.split(",") if e.strip()]
+        for encoding in encodings:
+            if encoding not in valid_encodings:
+                raise ValueError(f"Compression encodings must be among {valid_encodings}")
+        return ",".join(encodings)
+
+    @field_validator("jwt_backend")
+    @classmethod
+    def validate_jwt_backend(cls, v):
+        """Validate JWT verification backend."""
+        valid_backends = ["jose", "pyjwt"]
+        v = v.lower()
+        if v not in valid_backends:
+            raise ValueError(f"JWT backend must be one of {valid_backends}")
+        return v
+
+    @field_validator("storage_backend")
+    @classmethod
+    def validate_storage_backend(cls, v):
+        """Validate storage backend."""
+        valid_backends = ["dynamodb", "memory"]
+        v = v.lower()
+        if v not in valid_backends:
+            raise ValueError(f"Storage backend must be one of {valid_backends}")
+        return v
+
     @field_validator("environment")
     @classmethod
     def validate_environment(cls, v):
@@ -95,6 +216,47 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of {valid_envs}")
         return v
 
+    @model_validator(mode="after")
+    def validate_local_issuer(self):
+        """Only trust the local token issuer in development (it mints admin tokens for anyone)."""
+        if self.local_issuer_enabled and self.environment != "development":
+            raise ValueError("LOCAL_ISSUER_ENABLED is only allowed in development")
+        return self
+
+    @model_validator(mode="after")
+    def validate_storage(self):
+        """Refuse process-local storage in production."""
+        if self.storage_backend == "memory" and self.environment == "production":
+            raise ValueError("STORAGE_BACKEND=memory must not be used in production")
+        return self
+
+    @model_validator(mode="after")
+    def validate_aws_api_endpoint(self):
+        """Refuse to redirect customer-credential AWS calls in production."""
+        if self.aws_api_endpoint_url and self.environment == "production":
+            raise ValueError("AWS_API_ENDPOINT_URL must not be set in production")
+        return self
+
+    @property
+    def use_dev_auth(self) -> bool:
+        """
+        Whether routes use the mock development user instead of JWT auth.
+
+        Disabled when the local issuer is enabled, so load tests exercise the
+        real token verification path.
+        """
+        return self.environment == "development" and not self.local_issuer_enabled
+
+    @property
+    def use_mock_aws(self) -> bool:
+        """
+        Whether STS, KMS, Service Quotas, Account and Bedrock calls are mocked.
+
+        Disabled when AWS_API_ENDPOINT_URL points at a stand-in server, so
+        the real clients and code paths run in development.
+        """
+        return self.environment == "development" and not self.aws_api_endpoint_url
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -35,3 +35,13 @@ class PermissionDeniedException(AccountPlatformException):
 class AWSServiceException(AccountPlatformException):
     """Raised when AWS service call fails."""
     pass
+
+
+class InvalidTokenException(AccountPlatformException):
+    """Raised when a JWT fails signature or claims verification."""
+    pass
+
+
+class AuditLogException(AccountPlatformException):
+    """Raised when a must-persist audit log entry cannot be written."""
+    pass
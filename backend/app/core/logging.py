@@ -1,17 +1,157 @@
 """
 Structured logging configuration.
+
+Records are handed to a bounded in-memory queue by the calling thread and
+formatted and written to stdout by a ``QueueListener`` thread, so request
+handlers never block on log I/O. When the queue is full, records are dropped
+(and counted) instead of stalling the event loop.
+
+- ``LOG_FORMAT=json`` emits one JSON object per line; extras such as the
+  ``request_timing`` dict from ``ServerTimingMiddleware`` become fields
+- ``LOG_QUEUE_SIZE=0`` disables the queue and writes synchronously
+- ``LOG_SAMPLE_RATES`` keeps a fraction of DEBUG/INFO records from chatty
+  child loggers, e.g. ``aws=0.1,request=0.5`` (warnings are never sampled)
+
+Log with %-style arguments, not f-strings, so messages that are filtered out
+by level or sampling are never formatted::
+
+    logger.debug("DynamoDB response: %s", response)
 """
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
 
 from app.core.config import settings
+from app.core.metrics import LOG_RECORDS_DROPPED
+
+ROOT_LOGGER = "account_platform"
+
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Render a record, merging ``extra`` attributes as top-level fields."""
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fixed fraction of DEBUG/INFO records."""
+
+    def __init__(self, rate: float):
+        """
+        Initialize filter.
+
+        Args:
+            rate: Fraction of records to keep (0.0 - 1.0)
+        """
+        super().__init__()
+        self.rate = rate
+        self._credit = 0.0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Deterministically keep every 1/rate-th record below WARNING."""
+        if record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            self._credit += self.rate
+            if self._credit >= 1.0:
+                self._credit -= 1.0
+                return True
+        return False
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records when the queue is full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshot a record for the listener thread.
+
+        Merges the message arguments (they may be mutated after the call
+        returns) and renders the traceback, but leaves formatting to the
+        listener's handler.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """Put a record on the queue without blocking."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """
+    Parse ``LOG_SAMPLE_RATES``.
+
+    Args:
+        value: Comma-separated ``name=rate`` pairs; names are relative to
+            the application logger (``aws`` -> ``account_platform.aws``)
+
+    Returns:
+        Dict of full logger name to rate
+
+    Raises:
+        ValueError: If an entry is malformed or a rate is outside 0-1
+    """
+    rates = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        name, _, rate = entry.partition("=")
+        rate_value = float(rate)
+        if not 0.0 <= rate_value <= 1.0:
+            raise ValueError(f"Sample rate for {name.strip()} must be between 0 and 1")
+        rates[f"{ROOT_LOGGER}.{name.strip()}"] = rate_value
+    return rates
+
+
+# Global listener instance
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging():
     """Configure structured logging for the application."""
+    global _listener
 
     # Create logger
-    logger = logging.getLogger("account_platform")
+    logger = logging.getLogger(ROOT_LOGGER)
     logger.setLevel(getattr(logging, settings.log_level))
 
     # Create console handler
@@ -19,17 +159,65 @@ def setup_logging():
     handler.setLevel(getattr(logging, settings.log_level))
 
     # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if settings.log_format == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(handler)
+    # Write from a background thread unless the queue is disabled
+    if settings.log_queue_size > 0:
+        queue_handler = DroppingQueueHandler(queue.Queue(settings.log_queue_size))
+        _listener = logging.handlers.QueueListener(
+            queue_handler.queue, handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(stop_logging)
+        logger.addHandler(queue_handler)
+    else:
+        logger.addHandler(handler)
+
+    # Sample chatty child loggers
+    for name, rate in parse_sample_rates(settings.log_sample_rates).items():
+        if rate < 1.0:
+            logging.getLogger(name).addFilter(SamplingFilter(rate))
 
     return logger
 
 
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a child of the application logger.
+
+    Child loggers share its handlers; use them for chatty call sites so they
+    can be sampled with ``LOG_SAMPLE_RATES``.
+
+    Args:
+        name: Child name, e.g. 'aws' for 'account_platform.aws'
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+_warned = set()
+
+
+def warn_once(message: str, *args):
+    """Log a warning only the first time it is seen in this process."""
+    if message not in _warned:
+        _warned.add(message)
+        logger.warning(message, *args)
+
+
 # Export logger instance
 logger = setup_logging()
@@ -0,0 +1,211 @@
+"""
+Event loop lag monitor.
+
+A background task sleeps for a fixed interval and records how late it woke
+up. Sustained lag means something is blocking the loop (synchronous I/O,
+CPU-heavy work) and every concurrent request is being delayed.
+
+With ``LOOP_BLOCK_DETECTION=true`` a watchdog thread also pings the loop
+every ``LOOP_BLOCK_THRESHOLD / 2`` seconds. When a ping is not answered
+within the threshold, it samples the loop thread's stack and, once the loop
+recovers, logs the stall with the route being served and the botocore
+operation in progress (both read from the sampled frames) and counts it in
+``event_loop_blocks_total``. The sample shows whatever was running when the
+threshold was crossed, so a stall made of many short callbacks is attributed
+to the one caught in the act.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from types import FrameType
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import (
+    EVENT_LOOP_BLOCKED_SECONDS,
+    EVENT_LOOP_BLOCKS,
+    EVENT_LOOP_LAG_SECONDS,
+)
+from app.middleware.metrics import route_template
+
+# Innermost frames included in a blocked-loop report
+_STACK_LIMIT = 20
+
+
+@dataclass
+class LoopBlock:
+    """A detected event loop stall."""
+
+    duration: float
+    route: str
+    operation: str
+    stack: List[str]
+
+
+def describe_frames(frame: Optional[FrameType]) -> LoopBlock:
+    """
+    Attribute a sampled loop thread stack to a route and AWS operation.
+
+    The route comes from the innermost ASGI ``scope`` local that has been
+    routed; the operation from botocore's ``BaseClient._make_api_call``.
+
+    Args:
+        frame: Innermost frame of the loop thread
+
+    Returns:
+        LoopBlock with duration 0
+    """
+    route = "none"
+    operation = "none"
+    current = frame
+    while current is not None:
+        code = current.f_code
+        local_vars = current.f_locals
+        if operation == "none" and code.co_name == "_make_api_call":
+            client = local_vars.get("self")
+            model = getattr(client, "_service_model", None)
+            if model is not None and "operation_name" in local_vars:
+                operation = f"{model.endpoint_prefix}.{local_vars['operation_name']}"
+        scope = local_vars.get("scope")
+        if route == "none" and isinstance(scope, dict) and "route" in scope:
+            route = route_template(scope)
+        if route != "none" and operation != "none":
+            break
+        current = current.f_back
+
+    stack = traceback.format_list(traceback.extract_stack(frame)[-_STACK_LIMIT:])
+    return LoopBlock(duration=0.0, route=route, operation=operation, stack=stack)
+
+
+class LoopLagMonitor:
+    """Measure event loop scheduling lag."""
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        block_threshold: Optional[float] = None,
+        detect_blocking: Optional[bool] = None,
+    ):
+        """
+        Initialize loop lag monitor.
+
+        Args:
+            interval: Seconds between probes (defaults to settings.loop_lag_interval)
+            block_threshold: Seconds without a loop response that count as a
+                stall (defaults to settings.loop_block_threshold)
+            detect_blocking: Run the blocking-call watchdog (defaults to
+                settings.loop_block_detection)
+        """
+        self.interval = interval or settings.loop_lag_interval
+        self.block_threshold = block_threshold or settings.loop_block_threshold
+        self.detect_blocking = (
+            settings.loop_block_detection if detect_blocking is None else detect_blocking
+        )
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.last_block: Optional[LoopBlock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    async def start(self):
+        """Start probing on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+            logger.info("Event loop lag monitor started (interval=%ss)", self.interval)
+
+        if self.detect_blocking and self._watchdog is None:
+            self._stopping.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(asyncio.get_running_loop(), threading.get_ident()),
+                name="loop-block-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+            logger.info(
+                "Event loop blocking detector started (threshold=%ss)", self.block_threshold
+            )
+
+    async def stop(self):
+        """Stop probing."""
+        if self._watchdog is not None:
+            self._stopping.set()
+            await asyncio.to_thread(self._watchdog.join, self.block_threshold * 2)
+            self._watchdog = None
+
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - scheduled)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            EVENT_LOOP_LAG_SECONDS.observe(lag)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int):
+        answered = threading.Event()
+        while not self._stopping.wait(self.block_threshold / 2):
+            answered.clear()
+            sent = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                return  # loop closed
+            if answered.wait(self.block_threshold):
+                continue
+
+            # Blocked: sample the loop thread while it is still stuck
+            block = describe_frames(sys._current_frames().get(loop_thread_id))
+            while not answered.wait(self.block_threshold):
+                if self._stopping.is_set():
+                    return
+            block.duration = time.perf_counter() - sent
+            self._report(block)
+
+    def _report(self, block: LoopBlock):
+        self.last_block = block
+        EVENT_LOOP_BLOCKS.labels(route=block.route, operation=block.operation).inc()
+        EVENT_LOOP_BLOCKED_SECONDS.labels(
+            route=block.route, operation=block.operation
+        ).inc(block.duration)
+        logger.warning(
+            "Event loop blocked for %.0fms (route=%s, operation=%s)\n%s",
+            block.duration * 1000,
+            block.route,
+            block.operation,
+            "".join(block.stack).rstrip(),
+            extra={
+                "loop_block": {
+                    "duration_ms": round(block.duration * 1000, 1),
+                    "route": block.route,
+                    "operation": block.operation,
+                }
+            },
+        )
+
+
+# Global monitor instance
+_loop_monitor = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """Get or create the loop lag monitor."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopLagMonitor()
+    return _loop_monitor
@@ -0,0 +1,150 @@
+"""
+Prometheus metrics definitions.
+
+Metrics are module-level singletons shared by the whole process and exposed
+on ``/metrics``.
+
+With several uvicorn workers, set ``PROMETHEUS_MULTIPROC_DIR`` in the process
+environment (an empty, writable directory) before starting the server. Each
+worker then writes its samples there and ``/metrics`` aggregates all of them,
+whichever worker serves the scrape.
+
+Cache hit ratios are derived from ``cache_requests_total``, e.g.
+``sum by (cache) (rate(cache_requests_total{result="hit"}[5m]))
+/ sum by (cache) (rate(cache_requests_total[5m]))``.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# ===================================================================
+# HTTP requests
+# ===================================================================
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by method, route template and status code.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# ===================================================================
+# AWS API calls (botocore)
+# ===================================================================
+
+AWS_CALL_SECONDS = Histogram(
+    "aws_call_duration_seconds",
+    "AWS API call latency (including retries) by service and operation.",
+    ["service", "operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+AWS_CALL_ERRORS = Counter(
+    "aws_call_errors_total",
+    "AWS API calls that failed, by service, operation and error code.",
+    ["service", "operation", "code"],
+)
+
+AWS_CALL_THROTTLES = Counter(
+    "aws_call_throttles_total",
+    "Throttled AWS API attempts (each retry counts), by service and operation.",
+    ["service", "operation"],
+)
+
+# ===================================================================
+# Caches
+# ===================================================================
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss).",
+    ["cache", "result"],
+)
+
+# ===================================================================
+# Event loop
+# ===================================================================
+
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled event loop wake-up and when it actually ran.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# Only recorded with LOOP_BLOCK_DETECTION enabled
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total",
+    "Event loop stalls over LOOP_BLOCK_THRESHOLD by route and AWS operation in progress.",
+    ["route", "operation"],
+)
+
+EVENT_LOOP_BLOCKED_SECONDS = Counter(
+    "event_loop_blocked_seconds_total",
+    "Time the event loop spent stalled, by route and AWS operation in progress.",
+    ["route", "operation"],
+)
+
+# ===================================================================
+# Audit logs
+# ===================================================================
+
+AUDIT_LOG_ITEMS = Counter(
+    "audit_log_items_total",
+    "Buffered audit log items by outcome (written/retried/dropped).",
+    ["result"],
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full.",
+)
+
+# ===================================================================
+# Authentication
+# ===================================================================
+
+TOKEN_VERIFICATION_SECONDS = Histogram(
+    "auth_token_verification_seconds",
+    "Time spent on full JWT verification (token cache misses only).",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+def multiprocess_enabled() -> bool:
+    """Whether metrics are shared across worker processes."""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render all metrics in Prometheus text exposition format.
+
+    Returns:
+        Tuple of (body, content type)
+    """
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead():
+    """Drop this worker's live gauges from the multiprocess directory."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,83 @@
+"""
+Fast JSON responses.
+
+``FastJSONResponse`` renders:
+
+- pydantic models and lists of models with their own (typed) pydantic-core
+  serializer, straight to bytes, with no ``model_dump`` dicts and no
+  ``jsonable_encoder``
+- any other content with orjson when it is installed (``pip install
+  '.[orjson]'``), otherwise with ``json.dumps``
+
+DynamoDB Decimals become JSON numbers in both cases: int when integral,
+float otherwise, as elsewhere in the app.
+
+Endpoints with large payloads return ``FastJSONResponse(content)``
+themselves, after validating once, while the declared response_model still
+documents the schema. It is deliberately not set as a router's
+``default_response_class``: FastAPI only uses its own Rust-side
+``dump_json`` path for response_model endpoints that keep the default
+class.
+"""
+import json
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional extra
+    orjson = None
+
+# List[Model] serializers by model class (typed dumping beats inference)
+_list_adapters: Dict[type, TypeAdapter] = {}
+
+
+def _default(value: Any) -> Any:
+    """Serialize types the JSON encoders don't handle."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _list_adapter(model_class: type) -> TypeAdapter:
+    """Cached List[model_class] adapter."""
+    adapter = _list_adapters.get(model_class)
+    if adapter is None:
+        adapter = _list_adapters[model_class] = TypeAdapter(List[model_class])
+    return adapter
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize response content to compact UTF-8 JSON."""
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        model_class = type(content[0])
+        if all(type(item) is model_class for item in content):
+            return _list_adapter(model_class).dump_json(content)
+        return pydantic_core.to_json(content)
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by ``dumps``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,196 @@
+"""
+Request-scoped timing of AWS API calls.
+
+``instrument_session`` registers botocore event handlers on a boto3 session,
+so every client created from it is timed per service and operation without
+touching call sites. Every call feeds the ``aws_call_*`` Prometheus metrics;
+calls made while serving a request are also added to that request's
+``RequestTimings`` (held in a contextvar set by ``ServerTimingMiddleware``).
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import boto3
+
+from app.core.metrics import AWS_CALL_ERRORS, AWS_CALL_SECONDS, AWS_CALL_THROTTLES
+
+_CONTEXT_KEY = "account_platform_call_start"
+
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "BandwidthLimitExceeded",
+        "LimitExceededException",
+        "SlowDown",
+    }
+)
+
+
+@dataclass
+class AWSCall:
+    """A single timed AWS API call."""
+
+    service: str
+    operation: str
+    duration: float
+    error: bool = False
+
+
+@dataclass
+class RequestTimings:
+    """AWS calls made while serving one request."""
+
+    calls: List[AWSCall] = field(default_factory=list)
+
+    def record(self, service: str, operation: str, duration: float, error: bool = False):
+        """Add a timed call (list.append is atomic, so worker threads may record)."""
+        self.calls.append(AWSCall(service, operation, duration, error))
+
+    def by_service(self) -> Dict[str, Tuple[int, float]]:
+        """Call count and total seconds per service."""
+        totals: Dict[str, Tuple[int, float]] = {}
+        for call in self.calls:
+            count, total = totals.get(call.service, (0, 0.0))
+            totals[call.service] = (count + 1, total + call.duration)
+        return totals
+
+    def by_operation(self) -> Dict[str, Tuple[int, float]]:
+        """Call count and total seconds per 'service.Operation'."""
+        totals: Dict[str, Tuple[int, float]] = {}
+        for call in self.calls:
+            key = f"{call.service}.{call.operation}"
+            count, total = totals.get(key, (0, 0.0))
+            totals[key] = (count + 1, total + call.duration)
+        return totals
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """
+        Render a Server-Timing header value.
+
+        Args:
+            total: Total request time in seconds, emitted as 'app'
+        """
+        metrics = [
+            f'{service};dur={seconds * 1000:.1f};desc="{count} call{"s" if count != 1 else ""}"'
+            for service, (count, seconds) in sorted(self.by_service().items())
+        ]
+        if total is not None:
+            metrics.append(f"app;dur={total * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timings() -> Tuple[RequestTimings, Any]:
+    """
+    Start collecting AWS call timings for the current request.
+
+    Returns:
+        Tuple of (timings, token for end_request_timings)
+    """
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def end_request_timings(token: Any):
+    """Stop collecting timings for the current request."""
+    _current_timings.reset(token)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """Get the timings of the request being served, if any."""
+    return _current_timings.get()
+
+
+# ===================================================================
+# botocore event handlers
+# ===================================================================
+
+
+def _before_call(model, context, **kwargs):
+    context[_CONTEXT_KEY] = (time.perf_counter(), model)
+
+
+def _record(context, error_code: Optional[str]):
+    started = context.pop(_CONTEXT_KEY, None)
+    if started is None:
+        return
+    start, model = started
+    duration = time.perf_counter() - start
+    service = model.service_model.endpoint_prefix
+
+    AWS_CALL_SECONDS.labels(service=service, operation=model.name).observe(duration)
+    if error_code is not None:
+        AWS_CALL_ERRORS.labels(
+            service=service, operation=model.name, code=error_code
+        ).inc()
+
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.record(service, model.name, duration, error_code is not None)
+
+
+def _after_call(context, http_response=None, parsed=None, **kwargs):
+    status = getattr(http_response, "status_code", 200)
+    error_code = None
+    if status >= 400:
+        error_code = (parsed or {}).get("Error", {}).get("Code") or str(status)
+    _record(context, error_code)
+
+
+def _after_call_error(context, exception=None, **kwargs):
+    # Connection errors etc.; this event carries no operation model
+    _record(context, type(exception).__name__ if exception else "Unknown")
+
+
+def _needs_retry(response=None, operation=None, **kwargs):
+    # Called after every attempt; returning None leaves the retry decision alone
+    if response is None or operation is None:
+        return None
+    code = (response[1] or {}).get("Error", {}).get("Code")
+    if code in THROTTLE_ERROR_CODES:
+        AWS_CALL_THROTTLES.labels(
+            service=operation.service_model.endpoint_prefix, operation=operation.name
+        ).inc()
+    return None
+
+
+def instrument_session(session: boto3.Session) -> boto3.Session:
+    """
+    Time every API call made by clients created from a session.
+
+    Safe to call repeatedly; handlers are registered once per session.
+
+    Args:
+        session: boto3 session to instrument
+
+    Returns:
+        The same session
+    """
+    events = session.events
+    events.register("before-call", _before_call, unique_id="request-timing-before")
+    events.register("after-call", _after_call, unique_id="request-timing-after")
+    events.register(
+        "after-call-error", _after_call_error, unique_id="request-timing-error"
+    )
+    events.register("needs-retry", _needs_retry, unique_id="request-timing-retry")
+    return session
+
+
+def instrument_default_session() -> boto3.Session:
+    """Instrument the default session used by boto3.client()/boto3.resource()."""
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    return instrument_session(boto3.DEFAULT_SESSION)
@@ -0,0 +1,110 @@
+"""
+Compact encoding for audit log details.
+
+Two techniques keep audit rows (and their ALL-projected index copies) small:
+
+- ``diff_values`` records only what changed between a previous and a new
+  value, as ``{"old": {...}, "new": {...}}`` holding just the changed leaves
+  (nested dicts are compared recursively).
+- ``encode_details`` stores details whose JSON form exceeds a threshold as
+  zlib-compressed JSON in the binary ``details_z`` attribute. ``decode_item``
+  reverses this on read, so callers always see a plain ``details`` dict.
+"""
+import json
+import zlib
+from decimal import Decimal
+from typing import Any, Dict
+
+from boto3.dynamodb.types import Binary
+
+COMPRESSED_ATTRIBUTE = "details_z"
+
+_MISSING = object()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize DynamoDB Decimals."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def diff_values(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Diff two dicts, keeping only changed leaves.
+
+    Removed keys appear only under 'old', added keys only under 'new'.
+
+    Args:
+        old: Previous value
+        new: New value
+
+    Returns:
+        Dict with 'old' and 'new' sub-dicts (both empty if nothing changed)
+    """
+    old_changes: Dict[str, Any] = {}
+    new_changes: Dict[str, Any] = {}
+
+    for key in old.keys() | new.keys():
+        before = old.get(key, _MISSING)
+        after = new.get(key, _MISSING)
+        if before == after:
+            continue
+        if isinstance(before, dict) and isinstance(after, dict):
+            nested = diff_values(before, after)
+            if nested["old"]:
+                old_changes[key] = nested["old"]
+            if nested["new"]:
+                new_changes[key] = nested["new"]
+            continue
+        if before is not _MISSING:
+            old_changes[key] = before
+        if after is not _MISSING:
+            new_changes[key] = after
+
+    return {"old": old_changes, "new": new_changes}
+
+
+def encode_details(details: Dict[str, Any], threshold: int) -> Dict[str, Any]:
+    """
+    Build the details attribute(s) for an audit item.
+
+    Args:
+        details: Details dict
+        threshold: JSON size in bytes above which details are compressed
+            (0 disables compression)
+
+    Returns:
+        Attributes to merge into the item
+    """
+    if threshold <= 0 or not details:
+        return {"details": details}
+
+    raw = json.dumps(details, default=_json_default, separators=(",", ":")).encode()
+    if len(raw) <= threshold:
+        return {"details": details}
+
+    compressed = zlib.compress(raw, 6)
+    if len(compressed) >= len(raw):
+        return {"details": details}
+
+    return {"details": {}, COMPRESSED_ATTRIBUTE: Binary(compressed)}
+
+
+def decode_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Restore compressed details in an audit item read from DynamoDB.
+
+    Numbers come back as Decimal, matching uncompressed items.
+    """
+    payload = item.pop(COMPRESSED_ATTRIBUTE, None)
+    if payload is None:
+        return item
+
+    data = payload.value if isinstance(payload, Binary) else bytes(payload)
+    item["details"] = json.loads(
+        zlib.decompress(data), parse_float=Decimal, parse_int=Decimal
+    )
+    return item
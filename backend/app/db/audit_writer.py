@@ -0,0 +1,214 @@
+"""
+Buffered audit log writer.
+
+``AuditLogManager.log_action`` hands items to a process-wide writer instead
+of doing a synchronous ``put_item`` on the request path. A background thread
+flushes them with ``BatchWriteItem`` (25 items per call) when a batch fills
+up or ``settings.audit_flush_interval`` elapses, retrying ``UnprocessedItems``
+with exponential backoff. The writer is started and drained in the
+application lifespan.
+"""
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.metrics import AUDIT_LOG_ITEMS
+from app.db.dynamodb import DynamoDBClient
+
+# DynamoDB BatchWriteItem limit
+MAX_BATCH_SIZE = 25
+
+_STOP = object()
+
+
+class AuditLogWriter:
+    """Background BatchWriteItem writer for audit log items."""
+
+    def __init__(
+        self,
+        dynamodb_client: DynamoDBClient,
+        flush_size: int = MAX_BATCH_SIZE,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        max_retries: int = 5,
+    ):
+        """
+        Initialize audit log writer.
+
+        Args:
+            dynamodb_client: DynamoDB client wrapper
+            flush_size: Items per BatchWriteItem call (max 25)
+            flush_interval: Max seconds an item waits before being flushed
+            max_queue_size: Pending items before submit() starts refusing
+            max_retries: Retries for UnprocessedItems and throttling errors
+        """
+        self.table_name = dynamodb_client.audit_logs_table_name
+        self.client = dynamodb_client.dynamodb.meta.client
+        self.flush_size = max(1, min(flush_size, MAX_BATCH_SIZE))
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        # Orders submit() against stop(): nothing is queued behind _STOP
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued items."""
+        return self._queue.qsize()
+
+    def start(self):
+        """Start the background flush thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-writer", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Audit log writer started (batch=%s, interval=%ss)",
+            self.flush_size,
+            self.flush_interval,
+        )
+
+    def submit(self, item: Dict[str, Any]) -> bool:
+        """
+        Queue an item for writing without blocking.
+
+        Returns:
+            False if the writer is stopped or full; the caller should then
+            write the item synchronously.
+        """
+        with self._lock:
+            if self._closed or self._thread is None:
+                return False
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                pass
+        logger.warning("Audit log buffer full, falling back to synchronous write")
+        return False
+
+    def stop(self, timeout: float = 30.0):
+        """Stop accepting items, flush everything queued and join the thread."""
+        if self._thread is None:
+            return
+        with self._lock:
+            self._closed = True
+        # Every accepted item is already queued, so it is written before _STOP
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            logger.error("Audit log writer did not drain within %ss", timeout)
+        else:
+            logger.info("Audit log writer drained and stopped")
+        self._thread = None
+
+    def _run(self):
+        """Collect batches by size or time and write them."""
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            deadline: Optional[float] = None
+
+            while len(batch) < self.flush_size:
+                # Block indefinitely for the first item, then until the deadline
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    AUDIT_LOG_ITEMS.labels(result="dropped").inc(len(batch))
+                    logger.error("Error writing audit log batch (%s items): %s", len(batch), e)
+
+    def _write_batch(self, items: List[Dict[str, Any]]):
+        """Write up to 25 items, retrying unprocessed ones with backoff."""
+        request_items = {
+            self.table_name: [{"PutRequest": {"Item": item}} for item in items]
+        }
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                if error_code not in (
+                    "ProvisionedThroughputExceededException",
+                    "ThrottlingException",
+                    "RequestLimitExceeded",
+                ):
+                    raise
+
+            remaining = len(request_items.get(self.table_name, []))
+            AUDIT_LOG_ITEMS.labels(result="written").inc(len(items) - remaining)
+            items = [r["PutRequest"]["Item"] for r in request_items.get(self.table_name, [])]
+            if not items:
+                return
+
+            if attempt < self.max_retries:
+                AUDIT_LOG_ITEMS.labels(result="retried").inc(len(items))
+                # Exponential backoff with full jitter: 50ms, 100ms, 200ms, ...
+                time.sleep(random.uniform(0, 0.05 * (2**attempt)))
+
+        AUDIT_LOG_ITEMS.labels(result="dropped").inc(len(items))
+        logger.error(
+            "Dropped %s audit log items after %s retries: %s",
+            len(items),
+            self.max_retries,
+            [item.get("log_id") for item in items],
+        )
+
+
+# Global writer instance (None when buffering is disabled or not started)
+_audit_writer: Optional[AuditLogWriter] = None
+
+
+def get_audit_writer() -> Optional[AuditLogWriter]:
+    """Get the running audit log writer, if any."""
+    return _audit_writer
+
+
+def start_audit_writer(dynamodb_client: DynamoDBClient) -> Optional[AuditLogWriter]:
+    """Create and start the process-wide audit log writer."""
+    global _audit_writer
+    if not settings.audit_buffer_enabled or _audit_writer is not None:
+        return _audit_writer
+
+    _audit_writer = AuditLogWriter(
+        dynamodb_client,
+        flush_size=settings.audit_flush_size,
+        flush_interval=settings.audit_flush_interval,
+        max_queue_size=settings.audit_buffer_max_size,
+    )
+    _audit_writer.start()
+    return _audit_writer
+
+
+def stop_audit_writer():
+    """Drain and stop the process-wide audit log writer."""
+    global _audit_writer
+    if _audit_writer is None:
+        return
+    writer, _audit_writer = _audit_writer, None
+    writer.stop()
@@ -0,0 +1,146 @@
+"""
+Wire-format codec for the low-level DynamoDB client.
+
+The boto3 resource layer runs ``TypeDeserializer`` on every attribute and
+returns every number as Decimal. The account repository talks to the
+low-level client instead and decodes with these functions, which are tuned
+for our item shapes (flat strings and numbers, plus the ``billing_address``,
+``bedrock_quota`` and ``metadata`` maps):
+
+- integral numbers decode to ``int`` (timestamps and quota values are always
+  integral); anything with a fraction or exponent stays ``Decimal``
+- attributes the caller does not need are skipped before they are decoded;
+  listed accounts decode straight into ``AccountRecord`` slots
+- encoding accepts what the resource layer accepts and rejects floats
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable
+
+from boto3.dynamodb.types import Binary
+
+from app.db.records import ACCOUNT_FIELDS, AccountRecord
+
+
+def _number(text: str) -> Any:
+    """Decode an N value: int when integral, Decimal otherwise."""
+    try:
+        return int(text)
+    except ValueError:
+        return Decimal(text)
+
+
+def deserialize_value(value: Dict[str, Any]) -> Any:
+    """
+    Decode one wire-format attribute value ({"S": "..."}, {"N": "..."}, ...).
+
+    Raises:
+        TypeError: For an unknown type descriptor
+    """
+    for type_code, data in value.items():
+        # Ordered by how often the type occurs in our items
+        if type_code == "S":
+            return data
+        if type_code == "N":
+            return _number(data)
+        if type_code == "M":
+            return {key: deserialize_value(item) for key, item in data.items()}
+        if type_code == "BOOL":
+            return data
+        if type_code == "NULL":
+            return None
+        if type_code == "L":
+            return [deserialize_value(item) for item in data]
+        if type_code == "SS":
+            return set(data)
+        if type_code == "NS":
+            return {_number(item) for item in data}
+        if type_code == "B":
+            return Binary(data)
+        if type_code == "BS":
+            return {Binary(item) for item in data}
+        raise TypeError("Unknown DynamoDB type descriptor: %s" % type_code)
+    raise TypeError("Empty DynamoDB attribute value")
+
+
+def deserialize_item(
+    item: Dict[str, Dict[str, Any]], skip: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    Decode a wire-format item.
+
+    Args:
+        item: Item as returned by the low-level client
+        skip: Attribute names to leave out (not decoded at all)
+
+    Returns:
+        Plain item dict
+    """
+    if skip:
+        return {
+            key: deserialize_value(value)
+            for key, value in item.items()
+            if key not in skip
+        }
+    return {key: deserialize_value(value) for key, value in item.items()}
+
+
+def deserialize_account(item: Dict[str, Dict[str, Any]]) -> AccountRecord:
+    """Decode a wire-format account item straight into an AccountRecord."""
+    record = AccountRecord()
+    for name in ACCOUNT_FIELDS:
+        value = item.get(name)
+        if value is not None:
+            setattr(record, name, deserialize_value(value))
+    return record
+
+
+def serialize_value(value: Any) -> Dict[str, Any]:
+    """
+    Encode a Python value into wire format.
+
+    Raises:
+        TypeError: For floats (as with boto3) and unsupported types
+    """
+    if isinstance(value, str):
+        return {"S": value}
+    if isinstance(value, bool):
+        return {"BOOL": value}
+    if isinstance(value, (int, Decimal)):
+        return {"N": str(value)}
+    if value is None:
+        return {"NULL": True}
+    if isinstance(value, dict):
+        return {"M": {key: serialize_value(item) for key, item in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {"L": [serialize_value(item) for item in value]}
+    if isinstance(value, Binary):
+        return {"B": value.value}
+    if isinstance(value, (bytes, bytearray)):
+        return {"B": bytes(value)}
+    if isinstance(value, float):
+        raise TypeError("Float types are not supported. Use Decimal types instead.")
+    if isinstance(value, (set, frozenset)) and value:
+        sample = next(iter(value))
+        if isinstance(sample, str):
+            return {"SS": list(value)}
+        if isinstance(sample, (int, Decimal)) and not isinstance(sample, bool):
+            return {"NS": [str(item) for item in value]}
+        if isinstance(sample, (bytes, bytearray, Binary)):
+            return {"BS": [getattr(item, "value", item) for item in value]}
+    raise TypeError("Unsupported type for DynamoDB: %s" % type(value).__name__)
+
+
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Encode a plain item dict into wire format."""
+    return {key: serialize_value(value) for key, value in item.items()}
+
+
+def plain_numbers(value: Any) -> Any:
+    """Convert resource-layer Decimals to what ``deserialize_value`` returns."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else value
+    if isinstance(value, dict):
+        return {key: plain_numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [plain_numbers(item) for item in value]
+    return value
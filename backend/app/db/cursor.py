@@ -0,0 +1,64 @@
+"""
+Opaque pagination cursors.
+
+DynamoDB's ``LastEvaluatedKey`` is wrapped in url-safe base64 JSON so API
+clients treat it as an opaque string. Each cursor records the index (or
+scan) it came from, so it cannot be replayed against a different query.
+"""
+import base64
+import binascii
+import json
+from decimal import Decimal
+from typing import Any, Dict
+
+
+def _json_default(value: Any) -> Any:
+    """Encode DynamoDB numbers."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in cursor")
+
+
+def encode_cursor(last_key: Dict[str, Any], source: str) -> str:
+    """
+    Encode a LastEvaluatedKey as an opaque cursor.
+
+    Args:
+        last_key: DynamoDB LastEvaluatedKey
+        source: Index name (or 'scan') the key belongs to
+
+    Returns:
+        Url-safe base64 cursor string
+    """
+    payload = json.dumps(
+        {"s": source, "k": last_key}, default=_json_default, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, source: str) -> Dict[str, Any]:
+    """
+    Decode a cursor back into an ExclusiveStartKey.
+
+    Args:
+        cursor: Cursor returned by encode_cursor
+        source: Index name (or 'scan') the current query uses
+
+    Returns:
+        ExclusiveStartKey for the next request
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key = payload["k"]
+        cursor_source = payload["s"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise ValueError("Malformed cursor")
+
+    if cursor_source != source or not isinstance(key, dict):
+        raise ValueError("Cursor does not match this query")
+
+    return key
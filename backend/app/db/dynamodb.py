@@ -4,12 +4,38 @@ DynamoDB client and table management.
 Provides interfaces for interacting with DynamoDB tables for accounts,
 users, and audit logs.
 """
+import threading
+from typing import Any, Dict, Tuple
+
 import boto3
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
 from app.core.logging import logger
 
+_low_level_clients: Dict[Tuple, Any] = {}
+_low_level_clients_lock = threading.Lock()
+
+
+def get_low_level_client(connection_kwargs: Dict[str, Any]) -> Any:
+    """
+    Shared low-level DynamoDB client for a set of connection settings.
+
+    Works with wire-format values (see ``app.db.codec``). The resource's
+    ``meta.client`` cannot be used for that, since the resource registers
+    its own serialization handlers on it. Clients are thread safe, so one
+    per configuration is created and reused across requests.
+    """
+    key = tuple(sorted(connection_kwargs.items()))
+    client = _low_level_clients.get(key)
+    if client is None:
+        with _low_level_clients_lock:
+            client = _low_level_clients.get(key)
+            if client is None:
+                client = boto3.client("dynamodb", **connection_kwargs)
+                _low_level_clients[key] = client
+    return client
+
 
 class DynamoDBClient:
     """DynamoDB client for managing tables and operations."""
@@ -32,15 +58,21 @@ class DynamoDBClient:
             resource_kwargs["aws_access_key_id"] = settings.aws_access_key_id
             resource_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
 
+        self.connection_kwargs = resource_kwargs
         self.dynamodb = boto3.resource("dynamodb", **resource_kwargs)
 
         self.accounts_table_name = settings.dynamodb_accounts_table
         self.users_table_name = settings.dynamodb_users_table
         self.audit_logs_table_name = settings.dynamodb_audit_logs_table
 
-        logger.info(f"DynamoDB client initialized for region: {settings.aws_region}")
+        logger.info("DynamoDB client initialized for region: %s", settings.aws_region)
         if settings.dynamodb_endpoint_url:
-            logger.info(f"Using custom endpoint: {settings.dynamodb_endpoint_url}")
+            logger.info("Using custom endpoint: %s", settings.dynamodb_endpoint_url)
+
+    @property
+    def client(self) -> Any:
+        """Shared low-level client (wire-format values) for these settings."""
+        return get_low_level_client(self.connection_kwargs)
 
     def create_tables(self):
         """Create all required DynamoDB tables if they don't exist (for local development)."""
@@ -73,10 +105,10 @@ class DynamoDBClient:
                 BillingMode="PAY_PER_REQUEST",
             )
             table.wait_until_exists()
-            logger.info(f"Created table: {self.accounts_table_name}")
+            logger.info("Created table: %s", self.accounts_table_name)
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceInUseException":
-                logger.info(f"Table already exists: {self.accounts_table_name}")
+                logger.info("Table already exists: %s", self.accounts_table_name)
             else:
                 raise
 
@@ -104,10 +136,10 @@ class DynamoDBClient:
                 BillingMode="PAY_PER_REQUEST",
             )
             table.wait_until_exists()
-            logger.info(f"Created table: {self.users_table_name}")
+            logger.info("Created table: %s", self.users_table_name)
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceInUseException":
-                logger.info(f"Table already exists: {self.users_table_name}")
+                logger.info("Table already exists: %s", self.users_table_name)
             else:
                 raise
 
@@ -124,6 +156,7 @@ class DynamoDBClient:
                     {"AttributeName": "log_id", "AttributeType": "S"},
                     {"AttributeName": "timestamp", "AttributeType": "N"},
                     {"AttributeName": "user_id", "AttributeType": "S"},
+                    {"AttributeName": "resource_id", "AttributeType": "S"},
                 ],
                 GlobalSecondaryIndexes=[
                     {
@@ -133,15 +166,23 @@ class DynamoDBClient:
                             {"AttributeName": "timestamp", "KeyType": "RANGE"},
                         ],
                         "Projection": {"ProjectionType": "ALL"},
-                    }
+                    },
+                    {
+                        "IndexName": "resource_id-timestamp-index",
+                        "KeySchema": [
+                            {"AttributeName": "resource_id", "KeyType": "HASH"},
+                            {"AttributeName": "timestamp", "KeyType": "RANGE"},
+                        ],
+                        "Projection": {"ProjectionType": "ALL"},
+                    },
                 ],
                 BillingMode="PAY_PER_REQUEST",
             )
             table.wait_until_exists()
-            logger.info(f"Created table: {self.audit_logs_table_name}")
+            logger.info("Created table: %s", self.audit_logs_table_name)
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceInUseException":
-                logger.info(f"Table already exists: {self.audit_logs_table_name}")
+                logger.info("Table already exists: %s", self.audit_logs_table_name)
             else:
                 raise
 
@@ -160,9 +201,9 @@ class DynamoDBClient:
                 BillingMode="PAY_PER_REQUEST",
             )
             table.wait_until_exists()
-            logger.info(f"Created table: {settings.quota_config_table_name}")
+            logger.info("Created table: %s", settings.quota_config_table_name)
         except ClientError as e:
             if e.response["Error"]["Code"] == "ResourceInUseException":
-                logger.info(f"Table already exists: {settings.quota_config_table_name}")
+                logger.info("Table already exists: %s", settings.quota_config_table_name)
             else:
                 raise
@@ -0,0 +1,541 @@
+"""
+In-memory storage backend (STORAGE_BACKEND=memory).
+
+Process-local stand-ins for the DynamoDB tables, keeping the behaviour the
+repositories and their callers rely on:
+
+- items are copied on the way in and out, numbers come back as Decimal and
+  floats are rejected, as with boto3; account items come back with int
+  numbers, as from the client-based ``AWSAccountManager``
+- GSIs are sparse and ordered by sort key; queries take sort key bounds,
+  direction, Limit and ExclusiveStartKey
+- scans run in partition-hash order (unordered for callers) and support
+  Segment/TotalSegments
+- a read stops at Limit items or 1 MB of item data, whichever comes first,
+  and returns a LastEvaluatedKey with the table and index keys, so cursors
+  look the same as with DynamoDB
+
+Every uvicorn worker has its own store; use it for tests, CI and
+benchmarks, never for real data.
+"""
+import copy
+import json
+import threading
+import time
+import zlib
+from bisect import bisect_left, bisect_right, insort
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from boto3.dynamodb.types import Binary
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.audit_codec import decode_item
+from app.db.codec import plain_numbers
+from app.db.cursor import decode_cursor, encode_cursor
+from app.db.records import AccountRecord
+from app.db.repositories import (
+    AccountRepository,
+    AuditLogRepository,
+    QuotaConfigRepository,
+    strip_credentials,
+)
+
+# DynamoDB returns at most 1 MB of data per Query/Scan call
+MAX_PAGE_BYTES = 1024 * 1024
+
+_HASH_SPACE = 2**32
+
+
+class _Top:
+    """Sorts after every other value (upper bisect bound)."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_TOP = _Top()
+
+
+def to_dynamo(value: Any) -> Any:
+    """
+    Copy a value into the types boto3 returns (Decimal numbers, Binary bytes).
+
+    Raises:
+        TypeError: For floats, which boto3 refuses to serialize
+    """
+    if value is None or isinstance(value, (bool, str, Binary)):
+        return value
+    if isinstance(value, (int, Decimal)):
+        return Decimal(value)
+    if isinstance(value, float):
+        raise TypeError("Float types are not supported. Use Decimal types instead.")
+    if isinstance(value, (bytes, bytearray)):
+        return Binary(bytes(value))
+    if isinstance(value, dict):
+        return {key: to_dynamo(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_dynamo(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {to_dynamo(item) for item in value}
+    raise TypeError(f"Unsupported type for DynamoDB: {type(value).__name__}")
+
+
+def _partition_hash(value: Any) -> int:
+    return zlib.crc32(str(value).encode())
+
+
+def _item_size(item: Dict[str, Any]) -> int:
+    """Approximate stored size of an item in bytes."""
+    return len(json.dumps(item, default=str))
+
+
+class MemoryTable:
+    """One DynamoDB-like table with optional GSIs."""
+
+    def __init__(
+        self,
+        name: str,
+        hash_key: str,
+        range_key: Optional[str] = None,
+        indexes: Optional[Dict[str, Tuple[str, Optional[str]]]] = None,
+    ):
+        """
+        Initialize memory table.
+
+        Args:
+            name: Table name
+            hash_key: Partition key attribute
+            range_key: Sort key attribute, if any
+            indexes: GSI name -> (partition key attribute, sort key attribute or None)
+        """
+        self.name = name
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.indexes = indexes or {}
+
+        self._items: Dict[tuple, Tuple[Dict[str, Any], int]] = {}
+        self._scan_order: List[tuple] = []
+        self._index_entries: Dict[str, Dict[Any, List[tuple]]] = {
+            index: {} for index in self.indexes
+        }
+        self._lock = threading.RLock()
+
+    @property
+    def item_count(self) -> int:
+        """Number of items."""
+        return len(self._items)
+
+    def _key(self, item: Dict[str, Any]) -> tuple:
+        if self.range_key:
+            return (item[self.hash_key], item[self.range_key])
+        return (item[self.hash_key],)
+
+    def _key_dict(self, key: tuple) -> Dict[str, Any]:
+        attributes = [self.hash_key] + ([self.range_key] if self.range_key else [])
+        return dict(zip(attributes, key))
+
+    def clear(self):
+        """Remove every item."""
+        with self._lock:
+            self._items.clear()
+            self._scan_order.clear()
+            for entries in self._index_entries.values():
+                entries.clear()
+
+    def get(self, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Copy of the item with this primary key, or None."""
+        with self._lock:
+            stored = self._items.get(self._key(to_dynamo(key)))
+            return copy.deepcopy(stored[0]) if stored else None
+
+    def put(self, item: Dict[str, Any]):
+        """Insert or replace an item."""
+        item = to_dynamo(item)
+        key = self._key(item)
+        with self._lock:
+            previous = self._items.get(key)
+            if previous:
+                self._unindex(key, previous[0])
+            else:
+                insort(self._scan_order, (_partition_hash(key[0]), key))
+            self._items[key] = (item, _item_size(item))
+            self._index(key, item)
+
+    def update(self, key: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Set attributes, creating the item if it does not exist (like UpdateItem).
+
+        Returns:
+            Previous values of the changed attributes that existed (UPDATED_OLD)
+        """
+        with self._lock:
+            stored = self._items.get(self._key(to_dynamo(key)))
+            item = dict(stored[0]) if stored else dict(key)
+            old = {name: copy.deepcopy(item[name]) for name in changes if name in item}
+            item.update(changes)
+            self.put(item)
+            return old
+
+    def _index(self, key: tuple, item: Dict[str, Any]):
+        for index, (hash_attr, range_attr) in self.indexes.items():
+            if hash_attr not in item or (range_attr and range_attr not in item):
+                continue  # GSIs are sparse
+            sort_value = item[range_attr] if range_attr else None
+            entries = self._index_entries[index].setdefault(item[hash_attr], [])
+            insort(entries, (sort_value, key))
+
+    def _unindex(self, key: tuple, item: Dict[str, Any]):
+        for index, (hash_attr, range_attr) in self.indexes.items():
+            if hash_attr not in item or (range_attr and range_attr not in item):
+                continue
+            entries = self._index_entries[index].get(item[hash_attr], [])
+            entry = (item[range_attr] if range_attr else None, key)
+            position = bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+
+    def _page(
+        self, keys, limit: Optional[int], last_key_for
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Read items for ``keys`` until Limit or 1 MB; returns (items, LastEvaluatedKey)."""
+        items = []
+        read_bytes = 0
+        for entry in keys:
+            item, size = self._items[entry[1]]
+            items.append(copy.deepcopy(item))
+            read_bytes += size
+            if (limit is not None and len(items) >= limit) or read_bytes >= MAX_PAGE_BYTES:
+                return items, last_key_for(entry)
+        return items, None
+
+    def query(
+        self,
+        index: str,
+        hash_value: Any,
+        low: Any = None,
+        high: Any = None,
+        forward: bool = True,
+        limit: Optional[int] = None,
+        start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Query a GSI by partition key with optional inclusive sort key bounds.
+
+        Returns:
+            Tuple of (items, LastEvaluatedKey or None)
+        """
+        hash_attr, range_attr = self.indexes[index]
+        hash_value = to_dynamo(hash_value)
+
+        def last_key_for(entry):
+            last_key = self._key_dict(entry[1])
+            last_key[hash_attr] = hash_value
+            if range_attr:
+                last_key[range_attr] = entry[0]
+            return last_key
+
+        with self._lock:
+            entries = self._index_entries[index].get(hash_value, [])
+            lo = bisect_left(entries, (to_dynamo(low),)) if low is not None else 0
+            hi = bisect_right(entries, (to_dynamo(high), _TOP)) if high is not None else len(entries)
+            if start_key:
+                start_key = to_dynamo(start_key)
+                position = (start_key.get(range_attr) if range_attr else None, self._key(start_key))
+                if forward:
+                    lo = max(lo, bisect_right(entries, position, lo, hi))
+                else:
+                    hi = min(hi, bisect_left(entries, position, lo, hi))
+            selected = range(lo, hi) if forward else range(hi - 1, lo - 1, -1)
+            return self._page((entries[i] for i in selected), limit, last_key_for)
+
+    def scan(
+        self,
+        limit: Optional[int] = None,
+        start_key: Optional[Dict[str, Any]] = None,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Scan the table (or one parallel scan segment) in partition-hash order.
+
+        Returns:
+            Tuple of (items, LastEvaluatedKey or None)
+        """
+        with self._lock:
+            order = self._scan_order
+            lo, hi = 0, len(order)
+            if total_segments:
+                lo = bisect_left(order, (-(-segment * _HASH_SPACE // total_segments),))
+                hi = bisect_left(order, (-(-(segment + 1) * _HASH_SPACE // total_segments),))
+            if start_key:
+                key = self._key(to_dynamo(start_key))
+                lo = max(lo, bisect_right(order, (_partition_hash(key[0]), key), lo, hi))
+            return self._page(
+                (order[i] for i in range(lo, hi)),
+                limit,
+                lambda entry: self._key_dict(entry[1]),
+            )
+
+
+class MemoryStore:
+    """The application's tables, held in process memory."""
+
+    def __init__(self):
+        """Initialize memory store with empty tables."""
+        self.accounts = MemoryTable(
+            settings.dynamodb_accounts_table,
+            "account_id",
+            indexes={"created_by-index": ("created_by", None)},
+        )
+        self.audit_logs = MemoryTable(
+            settings.dynamodb_audit_logs_table,
+            "log_id",
+            "timestamp",
+            indexes={
+                AuditLogRepository.USER_INDEX: ("user_id", "timestamp"),
+                AuditLogRepository.RESOURCE_INDEX: ("resource_id", "timestamp"),
+            },
+        )
+        self.quota_config = MemoryTable(settings.quota_config_table_name, "config_id")
+
+    def clear(self):
+        """Empty every table."""
+        for table in (self.accounts, self.audit_logs, self.quota_config):
+            table.clear()
+
+
+# Global store instance
+_memory_store = None
+
+
+def get_memory_store() -> MemoryStore:
+    """Get or create the process-wide memory store."""
+    global _memory_store
+    if _memory_store is None:
+        _memory_store = MemoryStore()
+    return _memory_store
+
+
+# ===================================================================
+# Repositories
+# ===================================================================
+
+
+class InMemoryAccountRepository(AccountRepository):
+    """Memory repository for AWS account operations."""
+
+    def __init__(self, store: MemoryStore):
+        """Initialize memory account repository."""
+        self.table = store.accounts
+
+    def _put_account(self, item: Dict[str, Any]):
+        """Write a full account item."""
+        self.table.put(item)
+
+    def get_account(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """Get account by ID (without credentials), or None if not found."""
+        item = self.table.get({"account_id": account_id})
+        return plain_numbers(strip_credentials(item)) if item else None
+
+    def get_account_credentials(self, account_id: str) -> Optional[Dict[str, str]]:
+        """Get the encrypted credentials of an account, or None."""
+        item = self.table.get({"account_id": account_id})
+        if not item:
+            return None
+        return {
+            "account_id": account_id,
+            "access_key_encrypted": item.get("access_key_encrypted", ""),
+            "secret_key_encrypted": item.get("secret_key_encrypted", ""),
+            "encryption_key_id": item.get("encryption_key_id", ""),
+        }
+
+    def list_accounts(
+        self, user_id: Optional[str] = None, user_role: str = "user"
+    ) -> List[AccountRecord]:
+        """List accounts visible to a user (one read, as with DynamoDB)."""
+        if user_role == "admin":
+            items, _ = self.table.scan()
+        elif user_id:
+            items, _ = self.table.query("created_by-index", user_id)
+        else:
+            return []
+        return [AccountRecord.from_item(plain_numbers(item)) for item in items]
+
+    def read_accounts_page(
+        self,
+        user_id: Optional[str] = None,
+        user_role: str = "user",
+        limit: int = 500,
+        start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[AccountRecord], Optional[Dict[str, Any]]]:
+        """Read one page of the accounts visible to a user."""
+        if user_role == "admin":
+            items, last_key = self.table.scan(limit=limit, start_key=start_key)
+        elif user_id:
+            items, last_key = self.table.query(
+                "created_by-index", user_id, limit=limit, start_key=start_key
+            )
+        else:
+            return [], None
+        return [AccountRecord.from_item(plain_numbers(item)) for item in items], last_key
+
+    def update_billing_address(
+        self, account_id: str, billing_address: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Replace the billing address; returns the previous one ({} if unset)."""
+        old = self.table.update(
+            {"account_id": account_id},
+            {"billing_address": billing_address, "updated_at": int(time.time())},
+        )
+        logger.info("Updated billing address for account: %s", account_id)
+        return plain_numbers(old.get("billing_address") or {})
+
+    def update_bedrock_quota(self, account_id: str, quota_data: Dict[str, Any]) -> bool:
+        """Replace the Bedrock quota information of an account."""
+        self.table.update(
+            {"account_id": account_id},
+            {"bedrock_quota": quota_data, "updated_at": int(time.time())},
+        )
+        logger.info("Updated Bedrock quota for account: %s", account_id)
+        return True
+
+    def delete_account(self, account_id: str) -> bool:
+        """Soft delete an account (status becomes inactive)."""
+        self.table.update(
+            {"account_id": account_id},
+            {"status": "inactive", "updated_at": int(time.time())},
+        )
+        logger.info("Deleted (deactivated) account: %s", account_id)
+        return True
+
+
+class InMemoryAuditLogRepository(AuditLogRepository):
+    """Memory repository for audit log operations."""
+
+    def __init__(self, store: MemoryStore, compress_threshold: Optional[int] = None):
+        """Initialize memory audit log repository."""
+        super().__init__(compress_threshold)
+        self.table = store.audit_logs
+
+    def _store(self, item: Dict[str, Any], must_persist: bool) -> bool:
+        """Write an audit item (always synchronously; there is no writer to queue for)."""
+        self.table.put(item)
+        logger.info(
+            "Audit log: %s on %s:%s by %s",
+            item["action"],
+            item["resource_type"],
+            item["resource_id"],
+            item["user_id"],
+        )
+        return True
+
+    def get_user_logs(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent audit logs of a user."""
+        items, _ = self.table.query(self.USER_INDEX, user_id, forward=False, limit=limit)
+        return [decode_item(item) for item in items]
+
+    def query_logs(
+        self,
+        user_id: Optional[str] = None,
+        action: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        max_reads: int = 10,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Query audit logs; same index choice, filtering and cursors as AuditLogManager."""
+        source, hash_value, filters = self._log_filters(
+            user_id, action, resource_id, start_time, end_time
+        )
+        if hash_value is None and total_segments:
+            source = f"scan:{segment}/{total_segments}"
+        start_key = decode_cursor(cursor, source) if cursor else None
+
+        items: List[Dict[str, Any]] = []
+        last_key = None
+        # Limit applies before filtering, as in DynamoDB
+        for _ in range(max_reads):
+            if hash_value is not None:
+                page, last_key = self.table.query(
+                    source,
+                    hash_value,
+                    low=start_time,
+                    high=end_time,
+                    forward=False,  # Most recent first
+                    limit=limit - len(items),
+                    start_key=start_key,
+                )
+            else:
+                page, last_key = self.table.scan(
+                    limit=limit - len(items),
+                    start_key=start_key,
+                    segment=segment,
+                    total_segments=total_segments,
+                )
+
+            items.extend(
+                decode_item(item) for item in page if all(match(item) for match in filters)
+            )
+            if not last_key or len(items) >= limit:
+                break
+            start_key = last_key
+
+        return items, encode_cursor(last_key, source) if last_key else None
+
+    def _log_filters(
+        self,
+        user_id: Optional[str],
+        action: Optional[str],
+        resource_id: Optional[str],
+        start_time: Optional[int],
+        end_time: Optional[int],
+    ) -> Tuple[str, Optional[str], List[Callable[[Dict[str, Any]], bool]]]:
+        """(index name or "scan", index hash value, item filters) for query_logs."""
+        filters = []
+        if resource_id:
+            source, hash_value = self.RESOURCE_INDEX, resource_id
+            if user_id:
+                filters.append(lambda item: item.get("user_id") == user_id)
+        elif user_id:
+            source, hash_value = self.USER_INDEX, user_id
+        else:
+            source, hash_value = "scan", None
+            if start_time is not None:
+                filters.append(lambda item: item["timestamp"] >= start_time)
+            if end_time is not None:
+                filters.append(lambda item: item["timestamp"] <= end_time)
+        if action:
+            filters.append(lambda item: item.get("action") == action)
+        return source, hash_value, filters
+
+
+class InMemoryQuotaConfigRepository(QuotaConfigRepository):
+    """Memory repository for quota configuration operations."""
+
+    def __init__(self, store: MemoryStore):
+        """Initialize memory quota config repository."""
+        self.table = store.quota_config
+
+    def get_config(self) -> Optional[Dict[str, Any]]:
+        """Get quota configuration, or None if not found."""
+        return self.table.get({"config_id": self.CONFIG_ID})
+
+    def update_config(self, models: list, updated_by: str) -> Optional[Dict[str, Any]]:
+        """Replace the quota configuration."""
+        config = {
+            "config_id": self.CONFIG_ID,
+            "models": models,
+            "updated_at": int(time.time()),
+            "updated_by": updated_by,
+        }
+        self.table.put(config)
+        return config
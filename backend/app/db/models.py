@@ -2,83 +2,48 @@
 Data Manager classes for DynamoDB operations.
 """
 import time
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import Any, Dict, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 
+from app.core.exceptions import AWSServiceException
 from app.core.logging import logger
+from app.db.audit_codec import decode_item
+from app.db.audit_writer import get_audit_writer
+from app.db.codec import (
+    deserialize_account,
+    deserialize_item,
+    deserialize_value,
+    serialize_item,
+    serialize_value,
+)
+from app.db.cursor import decode_cursor, encode_cursor
 from app.db.dynamodb import DynamoDBClient
+from app.db.records import AccountRecord
+from app.db.repositories import (
+    CREDENTIAL_FIELDS,
+    AccountRepository,
+    AuditLogRepository,
+)
 
 
-class AWSAccountManager:
-    """Manager for AWS account operations."""
+class AWSAccountManager(AccountRepository):
+    """
+    DynamoDB repository for AWS account operations.
+
+    Uses the low-level client with ``app.db.codec`` rather than the resource
+    layer: quota numbers and timestamps come back as int, and credential
+    attributes are never decoded outside get_account_credentials.
+    """
 
     def __init__(self, dynamodb_client: DynamoDBClient):
         """Initialize AWS account manager."""
-        self.dynamodb = dynamodb_client.dynamodb
-        self.table = self.dynamodb.Table(dynamodb_client.accounts_table_name)
+        self.client = dynamodb_client.client
+        self.table_name = dynamodb_client.accounts_table_name
 
-    def create_account(
-        self,
-        account_id: str,
-        account_name: str,
-        encrypted_access_key: str,
-        encrypted_secret_key: str,
-        encryption_key_id: str,
-        created_by: str,
-        region: str = "us-east-1",
-        account_email: Optional[str] = None,
-        billing_address: Optional[Dict[str, Any]] = None,
-        bedrock_quota: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """
-        Create a new AWS account record.
-
-        Args:
-            account_id: AWS account ID
-            account_name: Display name for the account
-            encrypted_access_key: KMS-encrypted access key (Base64)
-            encrypted_secret_key: KMS-encrypted secret key (Base64)
-            encryption_key_id: KMS key ID used for encryption
-            created_by: User ID who created this account
-            region: AWS region for Bedrock quota (default: us-east-1)
-            account_email: Optional account email
-            billing_address: Optional billing address dict
-            bedrock_quota: Optional Bedrock quota information
-
-        Returns:
-            Created account item
-        """
-        timestamp = int(time.time())
-
-        item = {
-            "account_id": account_id,
-            "account_name": account_name,
-            "account_email": account_email or "",
-            "region": region,
-            "access_key_encrypted": encrypted_access_key,
-            "secret_key_encrypted": encrypted_secret_key,
-            "encryption_key_id": encryption_key_id,
-            "billing_address": billing_address or {},
-            "bedrock_quota": bedrock_quota or {},
-            "status": "active",
-            "created_at": timestamp,
-            "updated_at": timestamp,
-            "created_by": created_by,
-            "metadata": {},
-        }
-
-        self.table.put_item(Item=item)
-        logger.info(f"Created account: {account_id} by user: {created_by}")
-
-        # Remove encrypted credentials from return value
-        return_item = item.copy()
-        return_item.pop("access_key_encrypted", None)
-        return_item.pop("secret_key_encrypted", None)
-        return_item.pop("encryption_key_id", None)
-
-        return return_item
+    def _put_account(self, item: Dict[str, Any]):
+        """Write a full account item."""
+        self.client.put_item(TableName=self.table_name, Item=serialize_item(item))
 
     def get_account(self, account_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -91,18 +56,17 @@ class AWSAccountManager:
             Account item or None if not found
         """
         try:
-            response = self.table.get_item(Key={"account_id": account_id})
+            response = self.client.get_item(
+                TableName=self.table_name, Key={"account_id": {"S": account_id}}
+            )
             item = response.get("Item")
+            if not item:
+                return None
 
-            if item:
-                # Remove encrypted credentials from response
-                item.pop("access_key_encrypted", None)
-                item.pop("secret_key_encrypted", None)
-                item.pop("encryption_key_id", None)
-
-            return item
+            # Encrypted credentials are dropped without being decoded
+            return deserialize_item(item, skip=CREDENTIAL_FIELDS)
         except ClientError as e:
-            logger.error(f"Error getting account {account_id}: {e}")
+            logger.error("Error getting account %s: %s", account_id, e)
             return None
 
     def get_account_credentials(
@@ -118,12 +82,17 @@ class AWSAccountManager:
             Dict with encrypted credentials or None
         """
         try:
-            response = self.table.get_item(Key={"account_id": account_id})
+            response = self.client.get_item(
+                TableName=self.table_name,
+                Key={"account_id": {"S": account_id}},
+                ProjectionExpression=", ".join(("account_id",) + CREDENTIAL_FIELDS),
+            )
             item = response.get("Item")
 
             if not item:
                 return None
 
+            item = deserialize_item(item)
             return {
                 "account_id": account_id,
                 "access_key_encrypted": item.get("access_key_encrypted", ""),
@@ -131,12 +100,12 @@ class AWSAccountManager:
                 "encryption_key_id": item.get("encryption_key_id", ""),
             }
         except ClientError as e:
-            logger.error(f"Error getting credentials for {account_id}: {e}")
+            logger.error("Error getting credentials for %s: %s", account_id, e)
             return None
 
     def list_accounts(
         self, user_id: Optional[str] = None, user_role: str = "user"
-    ) -> List[Dict[str, Any]]:
+    ) -> List[AccountRecord]:
         """
         List accounts based on user role.
 
@@ -145,156 +114,193 @@ class AWSAccountManager:
             user_role: User role ('admin' or 'user')
 
         Returns:
-            List of account items
+            List of account records
         """
         try:
             if user_role == "admin":
                 # Admin can see all accounts
-                response = self.table.scan()
-                items = response.get("Items", [])
+                response = self.client.scan(TableName=self.table_name)
             else:
                 # Regular users only see accounts they created
                 if not user_id:
                     return []
 
-                response = self.table.query(
+                response = self.client.query(
+                    TableName=self.table_name,
                     IndexName="created_by-index",
                     KeyConditionExpression="created_by = :user_id",
-                    ExpressionAttributeValues={":user_id": user_id},
+                    ExpressionAttributeValues={":user_id": {"S": user_id}},
                 )
-                items = response.get("Items", [])
-
-            # Remove encrypted credentials from all items
-            for item in items:
-                item.pop("access_key_encrypted", None)
-                item.pop("secret_key_encrypted", None)
-                item.pop("encryption_key_id", None)
 
-            return items
+            return [deserialize_account(item) for item in response.get("Items", [])]
         except ClientError as e:
-            logger.error(f"Error listing accounts: {e}")
+            logger.error("Error listing accounts: %s", e)
             return []
 
+    def read_accounts_page(
+        self,
+        user_id: Optional[str] = None,
+        user_role: str = "user",
+        limit: int = 500,
+        start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[AccountRecord], Optional[Dict[str, Any]]]:
+        """
+        Read one page of the accounts visible to a user.
+
+        Args:
+            user_id: User ID (required for non-admin users)
+            user_role: User role ('admin' or 'user')
+            limit: Maximum items to read
+            start_key: LastEvaluatedKey of the previous page
+
+        Returns:
+            Tuple of (account records, LastEvaluatedKey or None)
+
+        Raises:
+            AWSServiceException: If DynamoDB rejects the request
+        """
+        params: Dict[str, Any] = {"TableName": self.table_name, "Limit": limit}
+        if start_key:
+            params["ExclusiveStartKey"] = start_key
+        try:
+            if user_role == "admin":
+                response = self.client.scan(**params)
+            elif user_id:
+                response = self.client.query(
+                    IndexName="created_by-index",
+                    KeyConditionExpression="created_by = :user_id",
+                    ExpressionAttributeValues={":user_id": {"S": user_id}},
+                    **params,
+                )
+            else:
+                return [], None
+        except ClientError as e:
+            logger.error("Error reading accounts page: %s", e)
+            raise AWSServiceException("Failed to read accounts", {"error": str(e)})
+
+        records = [deserialize_account(item) for item in response.get("Items", [])]
+        return records, response.get("LastEvaluatedKey")
+
     def update_billing_address(
         self, account_id: str, billing_address: Dict[str, str]
-    ) -> bool:
-        """Update billing address for an account."""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update billing address for an account.
+
+        Returns:
+            Previous billing address ({} if none was set), or None on failure
+        """
         try:
-            self.table.update_item(
-                Key={"account_id": account_id},
+            response = self.client.update_item(
+                TableName=self.table_name,
+                Key={"account_id": {"S": account_id}},
                 UpdateExpression="SET billing_address = :addr, updated_at = :updated",
                 ExpressionAttributeValues={
-                    ":addr": billing_address,
-                    ":updated": int(time.time()),
+                    ":addr": serialize_value(billing_address),
+                    ":updated": serialize_value(int(time.time())),
                 },
+                ReturnValues="UPDATED_OLD",
             )
-            logger.info(f"Updated billing address for account: {account_id}")
-            return True
+            logger.info("Updated billing address for account: %s", account_id)
+            old = response.get("Attributes", {}).get("billing_address")
+            return deserialize_value(old) if old else {}
         except ClientError as e:
-            logger.error(f"Error updating billing address: {e}")
-            return False
+            logger.error("Error updating billing address: %s", e)
+            return None
 
     def update_bedrock_quota(
         self, account_id: str, quota_data: Dict[str, Any]
     ) -> bool:
         """Update Bedrock quota information for an account."""
         try:
-            self.table.update_item(
-                Key={"account_id": account_id},
+            self.client.update_item(
+                TableName=self.table_name,
+                Key={"account_id": {"S": account_id}},
                 UpdateExpression="SET bedrock_quota = :quota, updated_at = :updated",
                 ExpressionAttributeValues={
-                    ":quota": quota_data,
-                    ":updated": int(time.time()),
+                    ":quota": serialize_value(quota_data),
+                    ":updated": serialize_value(int(time.time())),
                 },
             )
-            logger.info(f"Updated Bedrock quota for account: {account_id}")
+            logger.info("Updated Bedrock quota for account: %s", account_id)
             return True
         except ClientError as e:
-            logger.error(f"Error updating Bedrock quota: {e}")
+            logger.error("Error updating Bedrock quota: %s", e)
             return False
 
     def delete_account(self, account_id: str) -> bool:
         """Delete an account (soft delete by setting status to inactive)."""
         try:
-            self.table.update_item(
-                Key={"account_id": account_id},
+            self.client.update_item(
+                TableName=self.table_name,
+                Key={"account_id": {"S": account_id}},
                 UpdateExpression="SET #status = :status, updated_at = :updated",
                 ExpressionAttributeNames={"#status": "status"},
                 ExpressionAttributeValues={
-                    ":status": "inactive",
-                    ":updated": int(time.time()),
+                    ":status": {"S": "inactive"},
+                    ":updated": serialize_value(int(time.time())),
                 },
             )
-            logger.info(f"Deleted (deactivated) account: {account_id}")
+            logger.info("Deleted (deactivated) account: %s", account_id)
             return True
         except ClientError as e:
-            logger.error(f"Error deleting account: {e}")
+            logger.error("Error deleting account: %s", e)
             return False
 
 
-class AuditLogManager:
-    """Manager for audit log operations."""
+class AuditLogManager(AuditLogRepository):
+    """DynamoDB repository for audit log operations."""
 
-    def __init__(self, dynamodb_client: DynamoDBClient):
-        """Initialize audit log manager."""
+    def __init__(
+        self, dynamodb_client: DynamoDBClient, compress_threshold: Optional[int] = None
+    ):
+        """
+        Initialize audit log manager.
+
+        Args:
+            dynamodb_client: DynamoDB client wrapper
+            compress_threshold: Details JSON size (bytes) above which details
+                are stored compressed (defaults to settings; 0 disables)
+        """
+        super().__init__(compress_threshold)
         self.dynamodb = dynamodb_client.dynamodb
         self.table = self.dynamodb.Table(dynamodb_client.audit_logs_table_name)
 
-    def log_action(
-        self,
-        user_id: str,
-        action: str,
-        resource_type: str,
-        resource_id: str,
-        details: Optional[Dict[str, Any]] = None,
-        ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None,
-        status: str = "success",
-    ) -> bool:
+    def _store(self, item: Dict[str, Any], must_persist: bool) -> bool:
         """
-        Log an action to the audit log.
+        Write an audit item.
 
-        Args:
-            user_id: User who performed the action
-            action: Action type (e.g., 'create_account', 'export_credentials')
-            resource_type: Type of resource affected
-            resource_id: ID of the resource
-            details: Additional details about the action
-            ip_address: User's IP address
-            user_agent: User's user agent
-            status: Action status ('success' or 'failure')
-
-        Returns:
-            True if logged successfully
+        Entries are handed to the background audit writer when it is running;
+        otherwise (or with must_persist) they are written synchronously.
         """
-        timestamp = int(time.time())
-        log_id = str(uuid4())
-
-        # Calculate TTL (90 days from now)
-        ttl = timestamp + (90 * 24 * 60 * 60)
-
-        item = {
-            "log_id": log_id,
-            "timestamp": timestamp,
-            "user_id": user_id,
-            "action": action,
-            "resource_type": resource_type,
-            "resource_id": resource_id,
-            "details": details or {},
-            "ip_address": ip_address or "",
-            "user_agent": user_agent or "",
-            "status": status,
-            "ttl": ttl,
-        }
+        action = item["action"]
+        resource_type = item["resource_type"]
+        resource_id = item["resource_id"]
+        user_id = item["user_id"]
+
+        writer = get_audit_writer()
+        if not must_persist and writer is not None and writer.submit(item):
+            logger.info(
+                "Audit log queued: %s on %s:%s by %s",
+                action,
+                resource_type,
+                resource_id,
+                user_id,
+            )
+            return True
 
         try:
             self.table.put_item(Item=item)
             logger.info(
-                f"Audit log: {action} on {resource_type}:{resource_id} by {user_id}"
+                "Audit log: %s on %s:%s by %s",
+                action,
+                resource_type,
+                resource_id,
+                user_id,
             )
             return True
         except ClientError as e:
-            logger.error(f"Error creating audit log: {e}")
+            logger.error("Error creating audit log: %s", e)
             return False
 
     def get_user_logs(
@@ -318,7 +324,173 @@ class AuditLogManager:
                 Limit=limit,
                 ScanIndexForward=False,  # Most recent first
             )
-            return response.get("Items", [])
+            return [decode_item(item) for item in response.get("Items", [])]
         except ClientError as e:
-            logger.error(f"Error getting user logs: {e}")
+            logger.error("Error getting user logs: %s", e)
             return []
+
+    def query_logs(
+        self,
+        user_id: Optional[str] = None,
+        action: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        max_reads: int = 10,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Query audit logs with filters and time bounds, one page at a time.
+
+        resource_id queries resource_id-timestamp-index and user_id queries
+        user_id-timestamp-index, with the time range in the key condition
+        (newest first). Without either the table is scanned with filters and
+        results are unordered.
+
+        Args:
+            user_id: Filter by acting user
+            action: Filter by action type
+            resource_id: Filter by resource ID
+            start_time: Inclusive lower bound (epoch seconds)
+            end_time: Inclusive upper bound (epoch seconds)
+            limit: Maximum number of logs to return
+            cursor: Cursor from a previous page
+            max_reads: Maximum DynamoDB calls used to fill a filtered page
+            segment: Parallel scan segment (scans only)
+            total_segments: Parallel scan segment count (scans only)
+
+        Returns:
+            Tuple of (log items, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is invalid for this query
+            AWSServiceException: If DynamoDB rejects the request
+        """
+        source, key_condition, params = self._log_expressions(
+            user_id, action, resource_id, start_time, end_time
+        )
+        if key_condition:
+            params["IndexName"] = source
+            params["KeyConditionExpression"] = key_condition
+            params["ScanIndexForward"] = False  # Most recent first
+        elif total_segments:
+            params["Segment"] = segment
+            params["TotalSegments"] = total_segments
+            source = f"scan:{segment}/{total_segments}"
+        if cursor:
+            params["ExclusiveStartKey"] = decode_cursor(cursor, source)
+
+        try:
+            items, last_key = self._read_logs(params, limit, max_reads)
+        except ClientError as e:
+            logger.error("Error querying audit logs: %s", e)
+            raise AWSServiceException(
+                "Failed to query audit logs", {"error": str(e)}
+            )
+
+        return items, encode_cursor(last_key, source) if last_key else None
+
+    @staticmethod
+    def _time_condition(
+        start_time: Optional[int],
+        end_time: Optional[int],
+        names: Dict[str, str],
+        values: Dict[str, Any],
+    ) -> Optional[str]:
+        """Timestamp bound expression; adds its names and values."""
+        if start_time is None and end_time is None:
+            return None
+        names["#ts"] = "timestamp"
+        if start_time is not None:
+            values[":start"] = start_time
+        if end_time is not None:
+            values[":end"] = end_time
+        if start_time is not None and end_time is not None:
+            return "#ts BETWEEN :start AND :end"
+        if start_time is not None:
+            return "#ts >= :start"
+        return "#ts <= :end"
+
+    def _log_expressions(
+        self,
+        user_id: Optional[str],
+        action: Optional[str],
+        resource_id: Optional[str],
+        start_time: Optional[int],
+        end_time: Optional[int],
+    ) -> Tuple[str, Optional[str], Dict[str, Any]]:
+        """
+        Pick the index for query_logs and build its expressions.
+
+        Returns:
+            Tuple of (index name or "scan", key condition or None, params
+            with the filter expression and attribute names/values)
+        """
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        filters: List[str] = []
+        time_condition = self._time_condition(start_time, end_time, names, values)
+
+        if resource_id:
+            source = self.RESOURCE_INDEX
+            key_condition = "resource_id = :resource_id"
+            values[":resource_id"] = resource_id
+            if user_id:
+                filters.append("user_id = :user_id")
+                values[":user_id"] = user_id
+        elif user_id:
+            source = self.USER_INDEX
+            key_condition = "user_id = :user_id"
+            values[":user_id"] = user_id
+        else:
+            source = "scan"
+            key_condition = None
+
+        if time_condition:
+            if key_condition:
+                key_condition = f"{key_condition} AND {time_condition}"
+            else:
+                filters.append(time_condition)
+
+        if action:
+            names["#action"] = "action"
+            values[":action"] = action
+            filters.append("#action = :action")
+
+        params: Dict[str, Any] = {}
+        if filters:
+            params["FilterExpression"] = " AND ".join(filters)
+        if names:
+            params["ExpressionAttributeNames"] = names
+        if values:
+            params["ExpressionAttributeValues"] = values
+        return source, key_condition, params
+
+    def _read_logs(
+        self, params: Dict[str, Any], limit: int, max_reads: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Read one page of query_logs results.
+
+        Limit applies before filtering, so keep reading until the page is
+        full, the results run out or max_reads is reached.
+
+        Returns:
+            Tuple of (log items, LastEvaluatedKey or None)
+        """
+        read = self.table.query if "KeyConditionExpression" in params else self.table.scan
+        items: List[Dict[str, Any]] = []
+        last_key = None
+        for _ in range(max_reads):
+            params["Limit"] = limit - len(items)
+            response = read(**params)
+
+            items.extend(decode_item(item) for item in response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key or len(items) >= limit:
+                break
+            params["ExclusiveStartKey"] = last_key
+        return items, last_key
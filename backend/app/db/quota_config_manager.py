@@ -8,13 +8,14 @@ import boto3
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
-from app.core.logging import logger
+from app.core.logging import get_logger
+from app.db.repositories import QuotaConfigRepository
 
+logger = get_logger("quota_config")
 
-class QuotaConfigManager:
-    """Manager for quota configuration operations."""
 
-    CONFIG_ID = "global-quota-config"
+class QuotaConfigManager(QuotaConfigRepository):
+    """DynamoDB repository for quota configuration operations."""
 
     def __init__(self):
         """Initialize QuotaConfigManager with DynamoDB table."""
@@ -34,7 +35,8 @@ class QuotaConfigManager:
         dynamodb = boto3.resource("dynamodb", **resource_kwargs)
         self.table = dynamodb.Table(settings.quota_config_table_name)
         logger.info(
-            f"QuotaConfigManager initialized with table: {settings.quota_config_table_name}"
+            "QuotaConfigManager initialized with table: %s",
+            settings.quota_config_table_name,
         )
 
     def get_config(self) -> Optional[Dict[str, Any]]:
@@ -45,20 +47,20 @@ class QuotaConfigManager:
             Configuration dict or None if not found
         """
         try:
-            logger.debug(f"[get_config] Querying table: {self.table.table_name}, key: {self.CONFIG_ID}")
+            logger.debug("[get_config] Querying table: %s, key: %s", self.table.table_name, self.CONFIG_ID)
             response = self.table.get_item(Key={"config_id": self.CONFIG_ID})
-            logger.debug(f"[get_config] DynamoDB response: {response}")
+            logger.debug("[get_config] DynamoDB response: %s", response)
             item = response.get("Item")
             if item:
-                logger.info(f"[get_config] Retrieved quota configuration with {len(item.get('models', []))} models")
+                logger.info("[get_config] Retrieved quota configuration with %s models", len(item.get("models", [])))
                 return item
             logger.warning("[get_config] Quota configuration not found in DynamoDB")
             return None
         except ClientError as e:
-            logger.error(f"[get_config] ClientError retrieving quota configuration: {e}")
+            logger.error("[get_config] ClientError retrieving quota configuration: %s", e)
             return None
         except Exception as e:
-            logger.error(f"[get_config] Unexpected error: {e}", exc_info=True)
+            logger.error("[get_config] Unexpected error: %s", e, exc_info=True)
             return None
 
     def update_config(
@@ -82,72 +84,14 @@ class QuotaConfigManager:
                 "updated_by": updated_by,
             }
 
-            logger.debug(f"[update_config] Putting item to table: {self.table.table_name}")
-            logger.debug(f"[update_config] Config item: {config}")
+            logger.debug("[update_config] Putting item to table: %s", self.table.table_name)
+            logger.debug("[update_config] Config item: %s", config)
             self.table.put_item(Item=config)
-            logger.info(f"[update_config] Updated quota configuration by {updated_by}, {len(models)} models")
+            logger.info("[update_config] Updated quota configuration by %s, %s models", updated_by, len(models))
             return config
         except ClientError as e:
-            logger.error(f"[update_config] ClientError updating quota configuration: {e}")
+            logger.error("[update_config] ClientError updating quota configuration: %s", e)
             return None
         except Exception as e:
-            logger.error(f"[update_config] Unexpected error: {e}", exc_info=True)
+            logger.error("[update_config] Unexpected error: %s", e, exc_info=True)
             return None
-
-    def initialize_default_config(self, updated_by: str = "system") -> Dict[str, Any]:
-        """
-        Initialize default quota configuration with Claude 4.5 models.
-
-        Args:
-            updated_by: User ID initializing the config (default: "system")
-
-        Returns:
-            Initialized configuration dict
-        """
-        default_models = [
-            {
-                "model_id": "claude-sonnet-4.5-v1",
-                "display_name": "Claude Sonnet 4.5 V1",
-                "quota_code_tpm": "L-27C57EE8",
-                "quota_code_rpm": None,
-                "enabled": True,
-                "show_in_dashboard": True,  # Show in dashboard by default
-                "has_1m_context": True,
-                "quota_code_tpm_1m": "L-4B26E44A",
-                "quota_code_rpm_1m": None,
-            },
-            {
-                "model_id": "claude-opus-4.5",
-                "display_name": "Claude Opus 4.5",
-                "quota_code_tpm": "L-3ABF6ACC",
-                "quota_code_rpm": None,
-                "enabled": True,
-                "show_in_dashboard": True,  # Show in dashboard by default
-                "has_1m_context": False,
-                "quota_code_tpm_1m": None,
-                "quota_code_rpm_1m": None,
-            },
-            {
-                "model_id": "claude-opus-4.6-v1",
-                "display_name": "Claude Opus 4.6 V1",
-                "quota_code_tpm": "L-3DCCFAA4",
-                "quota_code_rpm": None,
-                "enabled": False,  # Disabled by default, admin can enable
-                "show_in_dashboard": False,
-                "has_1m_context": True,
-                "quota_code_tpm_1m": "L-4C59C1F4",
-                "quota_code_rpm_1m": None,
-            },
-        ]
-
-        logger.info(f"[initialize_default_config] Creating default config with {len(default_models)} models")
-        logger.debug(f"[initialize_default_config] Default models: {default_models}")
-
-        config = self.update_config(default_models, updated_by)
-
-        if config:
-            logger.info(f"[initialize_default_config] Successfully initialized with {len(config.get('models', []))} models")
-        else:
-            logger.error("[initialize_default_config] Failed to initialize - update_config returned None")
-
-        return config
@@ -0,0 +1,83 @@
+"""
+Compact in-memory records for repository results.
+
+``AccountRepository.list_accounts`` returns one ``AccountRecord`` per
+account instead of a dict. With ``__slots__`` an account costs a fixed
+object plus its values, rather than a hash table sized for every attribute;
+encrypted credentials and unknown attributes are not kept at all.
+"""
+from typing import Any, Dict
+
+ACCOUNT_FIELDS = (
+    "account_id",
+    "account_name",
+    "account_email",
+    "region",
+    "status",
+    "billing_address",
+    "bedrock_quota",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "metadata",
+)
+_ACCOUNT_FIELD_SET = frozenset(ACCOUNT_FIELDS)
+
+
+class AccountRecord:
+    """
+    Account as listed by a repository (never holds credentials).
+
+    Attributes missing from the stored item stay unset, so they behave like
+    missing dict keys: ``record.get(name, default)`` returns the default and
+    pydantic (``from_attributes``) applies the schema default. Supports the
+    read-only mapping access callers already use on account items
+    (``record["account_id"]``, ``record.get("status")``).
+    """
+
+    __slots__ = ACCOUNT_FIELDS
+
+    def __init__(self, **attributes: Any):
+        """
+        Initialize a record.
+
+        Raises:
+            AttributeError: For names that are not account fields
+        """
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "AccountRecord":
+        """Build a record from a decoded account item (other attributes are dropped)."""
+        record = cls()
+        for name in ACCOUNT_FIELDS:
+            if name in item:
+                setattr(record, name, item[name])
+        return record
+
+    def __getitem__(self, name: str) -> Any:
+        if name in _ACCOUNT_FIELD_SET:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                pass
+        raise KeyError(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Attribute value, or ``default`` if unset."""
+        if name not in _ACCOUNT_FIELD_SET:
+            return default
+        return getattr(self, name, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Account item dict with the attributes that are set."""
+        return {name: getattr(self, name) for name in ACCOUNT_FIELDS if hasattr(self, name)}
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AccountRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return "AccountRecord(%r)" % self.to_dict()
@@ -0,0 +1,398 @@
+"""
+Repository interfaces and backend selection.
+
+Services talk to storage through these interfaces. ``settings.storage_backend``
+picks the implementation:
+
+- dynamodb: ``AWSAccountManager`` (low-level client, ``app.db.codec``),
+  ``AuditLogManager`` and ``QuotaConfigManager`` (boto3 tables)
+- memory: process-local tables from ``app.db.memory`` with the same key,
+  GSI ordering and pagination behaviour, for tests and benchmarks that
+  should not depend on DynamoDB Local
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.logging import get_logger, logger
+from app.db.audit_codec import encode_details
+from app.db.records import AccountRecord
+
+# Audit log entries expire via the table's TTL attribute after 90 days
+AUDIT_LOG_RETENTION_SECONDS = 90 * 24 * 60 * 60
+
+# Account attributes never returned outside get_account_credentials
+CREDENTIAL_FIELDS = ("access_key_encrypted", "secret_key_encrypted", "encryption_key_id")
+
+DEFAULT_QUOTA_MODELS = [
+    {
+        "model_id": "claude-sonnet-4.5-v1",
+        "display_name": "Claude Sonnet 4.5 V1",
+        "quota_code_tpm": "L-27C57EE8",
+        "quota_code_rpm": None,
+        "enabled": True,
+        "show_in_dashboard": True,  # Show in dashboard by default
+        "has_1m_context": True,
+        "quota_code_tpm_1m": "L-4B26E44A",
+        "quota_code_rpm_1m": None,
+    },
+    {
+        "model_id": "claude-opus-4.5",
+        "display_name": "Claude Opus 4.5",
+        "quota_code_tpm": "L-3ABF6ACC",
+        "quota_code_rpm": None,
+        "enabled": True,
+        "show_in_dashboard": True,  # Show in dashboard by default
+        "has_1m_context": False,
+        "quota_code_tpm_1m": None,
+        "quota_code_rpm_1m": None,
+    },
+    {
+        "model_id": "claude-opus-4.6-v1",
+        "display_name": "Claude Opus 4.6 V1",
+        "quota_code_tpm": "L-3DCCFAA4",
+        "quota_code_rpm": None,
+        "enabled": False,  # Disabled by default, admin can enable
+        "show_in_dashboard": False,
+        "has_1m_context": True,
+        "quota_code_tpm_1m": "L-4C59C1F4",
+        "quota_code_rpm_1m": None,
+    },
+]
+
+quota_logger = get_logger("quota_config")
+
+
+def strip_credentials(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove encrypted credential attributes from an account item (in place)."""
+    for field_name in CREDENTIAL_FIELDS:
+        item.pop(field_name, None)
+    return item
+
+
+class AccountRepository(ABC):
+    """Storage for AWS account records."""
+
+    def create_account(
+        self,
+        account_id: str,
+        account_name: str,
+        encrypted_access_key: str,
+        encrypted_secret_key: str,
+        encryption_key_id: str,
+        created_by: str,
+        region: str = "us-east-1",
+        account_email: Optional[str] = None,
+        billing_address: Optional[Dict[str, Any]] = None,
+        bedrock_quota: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a new AWS account record.
+
+        Args:
+            account_id: AWS account ID
+            account_name: Display name for the account
+            encrypted_access_key: KMS-encrypted access key (Base64)
+            encrypted_secret_key: KMS-encrypted secret key (Base64)
+            encryption_key_id: KMS key ID used for encryption
+            created_by: User ID who created this account
+            region: AWS region for Bedrock quota (default: us-east-1)
+            account_email: Optional account email
+            billing_address: Optional billing address dict
+            bedrock_quota: Optional Bedrock quota information
+
+        Returns:
+            Created account item (without credentials)
+        """
+        timestamp = int(time.time())
+
+        item = {
+            "account_id": account_id,
+            "account_name": account_name,
+            "account_email": account_email or "",
+            "region": region,
+            "access_key_encrypted": encrypted_access_key,
+            "secret_key_encrypted": encrypted_secret_key,
+            "encryption_key_id": encryption_key_id,
+            "billing_address": billing_address or {},
+            "bedrock_quota": bedrock_quota or {},
+            "status": "active",
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "created_by": created_by,
+            "metadata": {},
+        }
+
+        self._put_account(item)
+        logger.info("Created account: %s by user: %s", account_id, created_by)
+
+        return strip_credentials(item.copy())
+
+    @abstractmethod
+    def _put_account(self, item: Dict[str, Any]):
+        """Write a full account item."""
+
+    @abstractmethod
+    def get_account(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """Get account by ID (without credentials), or None if not found."""
+
+    @abstractmethod
+    def get_account_credentials(self, account_id: str) -> Optional[Dict[str, str]]:
+        """Get the encrypted credentials of an account, or None."""
+
+    @abstractmethod
+    def list_accounts(
+        self, user_id: Optional[str] = None, user_role: str = "user"
+    ) -> List[AccountRecord]:
+        """List accounts visible to a user (admins: all; users: those they created)."""
+
+    @abstractmethod
+    def read_accounts_page(
+        self,
+        user_id: Optional[str] = None,
+        user_role: str = "user",
+        limit: int = 500,
+        start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[AccountRecord], Optional[Dict[str, Any]]]:
+        """
+        Read one page of the accounts visible to a user.
+
+        Returns:
+            Tuple of (account records, backend-specific key to continue from or None)
+
+        Raises:
+            AWSServiceException: If the backend rejects the request
+        """
+
+    def iter_account_pages(
+        self, user_id: Optional[str] = None, user_role: str = "user", page_size: int = 500
+    ) -> Iterator[List[AccountRecord]]:
+        """
+        Yield every account visible to a user, one page at a time.
+
+        Pages are read lazily as the caller consumes them, so only one page
+        is held in memory regardless of the fleet size.
+        """
+        if user_role != "admin" and not user_id:
+            return
+        start_key = None
+        while True:
+            records, start_key = self.read_accounts_page(user_id, user_role, page_size, start_key)
+            if records:
+                yield records
+            if start_key is None:
+                return
+
+    @abstractmethod
+    def update_billing_address(
+        self, account_id: str, billing_address: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Replace the billing address; returns the previous one ({} if unset), or None on failure."""
+
+    @abstractmethod
+    def update_bedrock_quota(self, account_id: str, quota_data: Dict[str, Any]) -> bool:
+        """Replace the Bedrock quota information of an account."""
+
+    @abstractmethod
+    def delete_account(self, account_id: str) -> bool:
+        """Soft delete an account (status becomes inactive)."""
+
+
+class AuditLogRepository(ABC):
+    """Storage for audit log entries."""
+
+    USER_INDEX = "user_id-timestamp-index"
+    RESOURCE_INDEX = "resource_id-timestamp-index"
+
+    def __init__(self, compress_threshold: Optional[int] = None):
+        """
+        Initialize audit log repository.
+
+        Args:
+            compress_threshold: Details JSON size (bytes) above which details
+                are stored compressed (defaults to settings; 0 disables)
+        """
+        self.compress_threshold = (
+            settings.audit_details_compress_threshold
+            if compress_threshold is None
+            else compress_threshold
+        )
+
+    def log_action(
+        self,
+        user_id: str,
+        action: str,
+        resource_type: str,
+        resource_id: str,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        status: str = "success",
+        must_persist: bool = False,
+    ) -> bool:
+        """
+        Log an action to the audit log.
+
+        Args:
+            user_id: User who performed the action
+            action: Action type (e.g., 'create_account', 'export_credentials')
+            resource_type: Type of resource affected
+            resource_id: ID of the resource
+            details: Additional details about the action
+            ip_address: User's IP address
+            user_agent: User's user agent
+            status: Action status ('success' or 'failure')
+            must_persist: Write synchronously and report the real outcome
+
+        Returns:
+            True if logged (or queued) successfully
+        """
+        timestamp = int(time.time())
+
+        item = {
+            "log_id": str(uuid4()),
+            "timestamp": timestamp,
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            **encode_details(details or {}, self.compress_threshold),
+            "ip_address": ip_address or "",
+            "user_agent": user_agent or "",
+            "status": status,
+            "ttl": timestamp + AUDIT_LOG_RETENTION_SECONDS,
+        }
+        return self._store(item, must_persist)
+
+    @abstractmethod
+    def _store(self, item: Dict[str, Any], must_persist: bool) -> bool:
+        """Persist (or queue) an encoded audit item."""
+
+    @abstractmethod
+    def get_user_logs(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent audit logs of a user."""
+
+    @abstractmethod
+    def query_logs(
+        self,
+        user_id: Optional[str] = None,
+        action: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        max_reads: int = 10,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Query audit logs with filters and time bounds, one page at a time.
+
+        resource_id queries resource_id-timestamp-index and user_id queries
+        user_id-timestamp-index, with the time range in the key condition
+        (newest first). Without either the table is scanned with filters and
+        results are unordered. Each read evaluates at most ``limit`` items
+        before filtering, so a filtered page may be short while a cursor is
+        still returned.
+
+        Returns:
+            Tuple of (log items, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is invalid for this query
+            AWSServiceException: If the backend rejects the request
+        """
+
+
+class QuotaConfigRepository(ABC):
+    """Storage for the global quota configuration."""
+
+    CONFIG_ID = "global-quota-config"
+
+    @abstractmethod
+    def get_config(self) -> Optional[Dict[str, Any]]:
+        """Get quota configuration, or None if not found."""
+
+    @abstractmethod
+    def update_config(self, models: list, updated_by: str) -> Optional[Dict[str, Any]]:
+        """Replace the quota configuration; returns it, or None on error."""
+
+    def initialize_default_config(self, updated_by: str = "system") -> Dict[str, Any]:
+        """
+        Initialize default quota configuration with Claude 4.5 models.
+
+        Args:
+            updated_by: User ID initializing the config (default: "system")
+
+        Returns:
+            Initialized configuration dict
+        """
+        default_models = [dict(model) for model in DEFAULT_QUOTA_MODELS]
+
+        quota_logger.info("[initialize_default_config] Creating default config with %s models", len(default_models))
+        quota_logger.debug("[initialize_default_config] Default models: %s", default_models)
+
+        config = self.update_config(default_models, updated_by)
+
+        if config:
+            quota_logger.info("[initialize_default_config] Successfully initialized with %s models", len(config.get("models", [])))
+        else:
+            quota_logger.error("[initialize_default_config] Failed to initialize - update_config returned None")
+
+        return config
+
+
+# ===================================================================
+# Backend selection
+# ===================================================================
+
+
+def get_account_repository(dynamodb_client=None) -> AccountRepository:
+    """
+    Account repository for the configured storage backend.
+
+    Args:
+        dynamodb_client: DynamoDBClient to reuse (dynamodb backend only)
+    """
+    if settings.storage_backend == "memory":
+        from app.db.memory import InMemoryAccountRepository, get_memory_store
+
+        return InMemoryAccountRepository(get_memory_store())
+
+    from app.db.dynamodb import DynamoDBClient
+    from app.db.models import AWSAccountManager
+
+    return AWSAccountManager(dynamodb_client or DynamoDBClient())
+
+
+def get_audit_log_repository(dynamodb_client=None) -> AuditLogRepository:
+    """
+    Audit log repository for the configured storage backend.
+
+    Args:
+        dynamodb_client: DynamoDBClient to reuse (dynamodb backend only)
+    """
+    if settings.storage_backend == "memory":
+        from app.db.memory import InMemoryAuditLogRepository, get_memory_store
+
+        return InMemoryAuditLogRepository(get_memory_store())
+
+    from app.db.dynamodb import DynamoDBClient
+    from app.db.models import AuditLogManager
+
+    return AuditLogManager(dynamodb_client or DynamoDBClient())
+
+
+def get_quota_config_repository() -> QuotaConfigRepository:
+    """Quota config repository for the configured storage backend."""
+    if settings.storage_backend == "memory":
+        from app.db.memory import InMemoryQuotaConfigRepository, get_memory_store
+
+        return InMemoryQuotaConfigRepository(get_memory_store())
+
+    from app.db.quota_config_manager import QuotaConfigManager
+
+    return QuotaConfigManager()
@@ -3,16 +3,27 @@ FastAPI application entry point.
 
 Configures and initializes the Account Platform API service.
 """
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.api import accounts, admin, auth, dashboard, health
+from app.api import accounts, admin, auth, dashboard, health, local_issuer
 from app.core.config import settings
 from app.core.logging import logger
+from app.core.loop_monitor import get_loop_monitor
+from app.core.metrics import mark_process_dead
+from app.core.timing import instrument_default_session
+from app.db.audit_writer import start_audit_writer, stop_audit_writer
 from app.db.dynamodb import DynamoDBClient
+from app.middleware.cognito_auth import get_validator
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+from app.services.readiness import start_readiness_checker, stop_readiness_checker
 
 
 @asynccontextmanager
@@ -23,23 +34,49 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"AWS Region: {settings.aws_region}")
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("Environment: %s", settings.environment)
+    logger.info("AWS Region: %s", settings.aws_region)
+
+    # Time AWS calls made by boto3.client()/boto3.resource() clients
+    instrument_default_session()
 
     # Initialize DynamoDB client
-    try:
-        dynamodb_client = DynamoDBClient()
-        app.state.dynamodb_client = dynamodb_client
-        logger.info("DynamoDB client initialized")
-
-        # Create tables if they don't exist (development only)
-        if settings.environment == "development":
-            logger.info("Creating DynamoDB tables (if not exist)...")
-            dynamodb_client.create_tables()
-    except Exception as e:
-        logger.error(f"Failed to initialize DynamoDB: {e}")
-        # Continue anyway for testing without DynamoDB
+    dynamodb_client = None
+    if settings.storage_backend == "memory":
+        logger.warning("STORAGE_BACKEND=memory: data lives in this process only")
+    else:
+        try:
+            dynamodb_client = DynamoDBClient()
+            app.state.dynamodb_client = dynamodb_client
+            logger.info("DynamoDB client initialized")
+
+            # Create tables if they don't exist (development only)
+            if settings.environment == "development":
+                logger.info("Creating DynamoDB tables (if not exist)...")
+                dynamodb_client.create_tables()
+
+            # Batch audit log writes in the background
+            start_audit_writer(dynamodb_client)
+        except Exception as e:
+            logger.error("Failed to initialize DynamoDB: %s", e)
+            # Continue anyway for testing without DynamoDB (/ready reports it)
+
+    # Prefetch Cognito JWKS and keep it fresh in the background
+    # (the local issuer's keys are loaded in-process instead)
+    refresh_jwks = not settings.local_issuer_enabled and bool(
+        settings.cognito_user_pool_id or settings.cognito_jwks_url
+    )
+    if refresh_jwks:
+        await get_validator().jwks_provider.start()
+    if settings.local_issuer_enabled:
+        logger.warning("LOCAL ISSUER ENABLED: trusting locally minted tokens")
+
+    # Probe dependencies in the background for /ready
+    await start_readiness_checker(dynamodb_client)
+
+    # Measure event loop lag for /metrics (and report stalls in debug mode)
+    await get_loop_monitor().start()
 
     logger.info("Application started successfully")
 
@@ -47,6 +84,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down application...")
+    # Flush queued audit log entries before exiting
+    await asyncio.to_thread(stop_audit_writer)
+    if refresh_jwks:
+        await get_validator().jwks_provider.stop()
+    await get_loop_monitor().stop()
+    await stop_readiness_checker()
+    mark_process_dead()
     logger.info("Application shutdown completed")
 
 
@@ -78,6 +122,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Admin request profiling (innermost, so only the app itself is profiled)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -87,6 +135,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression (outside CORS, inside timing/metrics so they include it)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.compression_encodings.split(","),
+        minimum_size=settings.compression_min_size,
+        offload_size=settings.compression_offload_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        zstd_level=settings.compression_zstd_level,
+    )
+
+# Per-request AWS call timing (Server-Timing header + request log line)
+app.add_middleware(
+    ServerTimingMiddleware,
+    header=settings.server_timing_enabled,
+)
+
+# Request latency / in-flight metrics (outermost, so it sees every request)
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(
     health.router,
@@ -117,6 +186,12 @@ app.include_router(
     tags=["admin"],
 )
 
+if settings.local_issuer_enabled:
+    app.include_router(
+        local_issuer.router,
+        tags=["local-issuer"],
+    )
+
 
 # Root endpoint
 @app.get("/", summary="API information")
@@ -128,6 +203,7 @@ async def root():
         "description": "Account Platform API",
         "documentation": settings.docs_url,
         "health": "/health",
+        "ready": "/ready",
     }
 
 
@@ -1,15 +1,19 @@
 """
 Cognito JWT authentication middleware.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Tuple
 
 import boto3
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt, jwk
 
 from app.core.config import settings
-from app.core.logging import logger
+from app.core.exceptions import InvalidTokenException
+from app.core.logging import logger, warn_once
+from app.core.metrics import CACHE_REQUESTS, TOKEN_VERIFICATION_SECONDS
+from app.middleware.jwks import JWKSProvider
+from app.middleware.jwt_backends import get_jwt_backend
+from app.middleware.token_cache import VerifiedTokenCache
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
@@ -22,71 +26,75 @@ class CognitoJWTValidator:
         """Initialize Cognito JWT validator."""
         self.user_pool_id = settings.cognito_user_pool_id
         self.region = settings.cognito_region
-        self.jwks: Optional[Dict[str, Any]] = None
 
         # Build issuer URL
-        self.issuer = f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}"
+        self.issuer = (
+            settings.cognito_issuer_url
+            or f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}"
+        )
+        jwks_url = settings.cognito_jwks_url or f"{self.issuer}/.well-known/jwks.json"
 
-        logger.info(f"Cognito JWT validator initialized for pool: {self.user_pool_id}")
+        # Cached JWKS, refreshed in the background (see app.middleware.jwks)
+        self.jwks_provider = JWKSProvider(jwks_url)
 
-    def _get_jwks(self) -> Dict[str, Any]:
-        """Get JSON Web Key Set (JWKS) from Cognito."""
-        if self.jwks:
-            return self.jwks
+        # Trust the in-process local issuer instead of Cognito (load testing)
+        if settings.local_issuer_enabled:
+            from app.middleware.local_issuer import get_local_issuer
 
-        import httpx
+            local_issuer = get_local_issuer()
+            self.issuer = local_issuer.issuer
+            self.jwks_provider = JWKSProvider(
+                jwks_url, ttl=float("inf"), min_refresh_interval=float("inf")
+            )
+            self.jwks_provider.load(local_issuer.jwks)
 
-        jwks_url = f"{self.issuer}/.well-known/jwks.json"
+        # RS256 implementation (see app.middleware.jwt_backends)
+        self.backend = get_jwt_backend(settings.jwt_backend)
 
-        try:
-            with httpx.Client() as client:
-                response = client.get(jwks_url, timeout=10.0)
-                response.raise_for_status()
-                self.jwks = response.json()
-            logger.debug("Retrieved JWKS from Cognito")
-            return self.jwks
-        except Exception as e:
-            logger.error(f"Failed to retrieve JWKS: {e}")
+        # Verified claims by token hash, and constructed public keys by kid
+        self.token_cache = VerifiedTokenCache(maxsize=settings.token_cache_size)
+        self._public_keys: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+
+        logger.info(
+            "Cognito JWT validator initialized for issuer: %s (backend: %s)",
+            self.issuer,
+            self.backend.name,
+        )
+
+    async def _get_public_key(self, kid: str) -> Any:
+        """Get public key for token verification."""
+        if not kid:
             raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Unable to verify authentication",
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token format",
             )
 
-    def _get_public_key(self, token: str) -> Any:
-        """Get public key for token verification."""
-        try:
-            # Decode header without verification
-            headers = jwt.get_unverified_header(token)
-            kid = headers.get("kid")
+        # Find matching key (refetches JWKS on unknown kid)
+        key = await self.jwks_provider.get_key(kid)
 
-            if not kid:
+        if key is None:
+            if not self.jwks_provider.available:
                 raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid token format",
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Unable to verify authentication",
                 )
-
-            # Get JWKS
-            jwks = self._get_jwks()
-
-            # Find matching key
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    # Construct the public key using jwk.construct
-                    return jwk.construct(key, algorithm='RS256')
-
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Public key not found",
             )
 
-        except JWTError as e:
-            logger.error(f"JWT error: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token format",
-            )
+        # Reuse the constructed key while the JWK for this kid is unchanged
+        cached = self._public_keys.get(kid)
+        if cached is not None and cached[0] is key:
+            CACHE_REQUESTS.labels(cache="public_key", result="hit").inc()
+            return cached[1]
+        CACHE_REQUESTS.labels(cache="public_key", result="miss").inc()
+
+        public_key = self.backend.construct_key(key)
+        self._public_keys[kid] = (key, public_key)
+        return public_key
 
-    def validate_token(self, token: str) -> Dict[str, Any]:
+    async def validate_token(self, token: str) -> Dict[str, Any]:
         """
         Validate JWT token and extract claims.
 
@@ -99,31 +107,40 @@ class CognitoJWTValidator:
         Raises:
             HTTPException: If token is invalid
         """
+        # Fast path: token already verified and its signing key still published
+        cached = self.token_cache.get(token)
+        if cached is not None and self.jwks_provider.has_key(cached[0]):
+            CACHE_REQUESTS.labels(cache="verified_token", result="hit").inc()
+            return cached[1]
+        CACHE_REQUESTS.labels(cache="verified_token", result="miss").inc()
+
         try:
-            # Get public key
-            public_key = self._get_public_key(token)
-
-            # Decode and verify token
-            claims = jwt.decode(
-                token,
-                public_key,
-                algorithms=["RS256"],
-                issuer=self.issuer,
-                options={"verify_aud": False},  # Cognito tokens don't have audience
-            )
+            with TOKEN_VERIFICATION_SECONDS.time():
+                # Decode header without verification
+                headers = self.backend.get_unverified_header(token)
+                kid = headers.get("kid")
+
+                # Get public key
+                public_key = await self._get_public_key(kid)
+
+                # Decode and verify token (audience is not checked for Cognito)
+                claims = self.backend.decode(token, public_key, self.issuer)
 
-            logger.debug(f"Token validated for user: {claims.get('sub')}")
+            self.token_cache.put(token, kid, claims)
+            logger.debug("Token validated for user: %s", claims.get("sub"))
             return claims
 
-        except JWTError as e:
-            logger.error(f"Token validation failed: {e}")
+        except HTTPException:
+            raise
+        except InvalidTokenException as e:
+            logger.error("Token validation failed: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         except Exception as e:
-            logger.error(f"Unexpected error validating token: {e}")
+            logger.error("Unexpected error validating token: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Authentication failed",
@@ -166,7 +183,7 @@ async def get_current_user(
     token = credentials.credentials
 
     # Validate token and get claims
-    claims = validator.validate_token(token)
+    claims = await validator.validate_token(token)
 
     # Extract user information
     user_id = claims.get("sub")
@@ -184,7 +201,7 @@ async def get_current_user(
         "claims": claims,  # Keep full claims for advanced use cases
     }
 
-    logger.debug(f"Authenticated user: {user_id} (role: {role})")
+    logger.debug("Authenticated user: %s (role: %s)", user_id, role)
     return user_info
 
 
@@ -205,7 +222,7 @@ async def require_admin(
     """
     if current_user.get("role") != "admin":
         logger.warning(
-            f"Admin access denied for user: {current_user.get('user_id')}"
+            "Admin access denied for user: %s", current_user.get("user_id")
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -222,7 +239,7 @@ async def get_dev_user() -> Dict[str, Any]:
 
     Returns a mock admin user for local testing.
     """
-    logger.warning("🚧 DEVELOPMENT MODE: Using mock user (authentication bypassed)")
+    warn_once("🚧 DEVELOPMENT MODE: Using mock user (authentication bypassed)")
     return {
         "user_id": "dev-user-123",
         "email": "admin@example.com",
@@ -0,0 +1,324 @@
+"""
+Response compression middleware.
+
+Pure ASGI middleware that compresses response bodies with the best encoding
+the client accepts, in the configured preference order (``COMPRESSION_ENCODINGS``):
+
+- gzip always (zlib)
+- br when ``brotli`` is installed, zstd when ``zstandard`` is installed
+  (``pip install '.[compression]'``); unavailable encodings are skipped
+
+Single-body responses (the account list, dashboard stats, ...) are only
+compressed from ``COMPRESSION_MIN_SIZE`` bytes. Streaming responses (the
+account and audit exports) are compressed chunk by chunk, each chunk
+flushed so the client can decode everything received so far. Bodies or
+chunks of ``COMPRESSION_OFFLOAD_SIZE`` bytes and more are compressed in a
+worker thread (zlib, brotli and zstandard release the GIL), keeping the
+event loop free.
+
+Left untouched: responses that already have a Content-Encoding (e.g. the
+gzipped audit export), non-text content types, Server-Sent Events (each
+event must reach the browser as soon as it is sent), ``Cache-Control:
+no-transform`` and 204/304 responses.
+"""
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional extra
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional extra
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+class Compressor(ABC):
+    """Streaming compressor: flushed chunks, then ``finish``."""
+
+    encoding = ""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress and flush a chunk (decodable up to here)."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """End the stream."""
+
+    def compress_all(self, data: bytes) -> bytes:
+        """Compress a whole body in one go."""
+        return self.compress(data) + self.finish()
+
+
+class GzipCompressor(Compressor):
+    """gzip via zlib."""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+    def compress_all(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliCompressor(Compressor):
+    """Brotli (text mode)."""
+
+    encoding = "br"
+
+    def __init__(self, quality: int = 4):
+        self.quality = quality
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+    def compress_all(self, data: bytes) -> bytes:
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=self.quality)
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard (one-shot bodies carry the content size)."""
+
+    encoding = "zstd"
+
+    def __init__(self, level: int = 3):
+        self._context = zstandard.ZstdCompressor(level=level)
+        self._compressor = self._context.compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+    def compress_all(self, data: bytes) -> bytes:
+        return self._context.compress(data)
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce."""
+    encodings = ["gzip"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding codings by q-value (lowercased)."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header: str, preferred: Sequence[str]) -> Optional[str]:
+    """
+    Pick the response encoding.
+
+    Args:
+        header: Request Accept-Encoding header
+        preferred: Encodings we can produce, most preferred first
+
+    Returns:
+        Highest q-value encoding (ties go to ``preferred`` order), or None
+    """
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in preferred:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Compress compressible responses for clients that accept it."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("gzip",),
+        minimum_size: int = 1024,
+        offload_size: int = 256 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application
+            encodings: Encodings to offer, most preferred first (unavailable ones are dropped)
+            minimum_size: Smallest single-body response to compress
+            offload_size: Bodies/chunks from this size are compressed in a thread
+            gzip_level: zlib level (1-9)
+            brotli_quality: Brotli quality (0-11)
+            zstd_level: Zstandard level (1-22)
+        """
+        self.app = app
+        available = available_encodings()
+        self.encodings = [encoding for encoding in encodings if encoding in available]
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality, "zstd": zstd_level}
+
+    def compressor(self, encoding: str) -> Compressor:
+        """New compressor for one response."""
+        if encoding == "br":
+            return BrotliCompressor(self.levels["br"])
+        if encoding == "zstd":
+            return ZstdCompressor(self.levels["zstd"])
+        return GzipCompressor(self.levels["gzip"])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows the body size
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                passthrough = True
+                if start is not None:
+                    await send(start)
+                await send(message)
+                return
+
+            if compressor is None:
+                compressor = await self._begin(start, message, encoding, send)
+                if compressor is None:
+                    passthrough = True
+                    return
+            await self._send_chunk(compressor, message, send)
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _begin(
+        self, start: Message, message: Message, encoding: str, send: Send
+    ) -> Optional[Compressor]:
+        """
+        Send the held-back response start along with the first body chunk.
+
+        Returns the compressor for a streamed body, or None once the message
+        has been sent as is or compressed in one go.
+        """
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self._compressible(start) or (
+            not more_body and len(body) < self.minimum_size
+        ):
+            await send(start)
+            await send(message)
+            return None
+
+        compressor = self.compressor(encoding)
+        headers = MutableHeaders(scope=start)
+        headers["Content-Encoding"] = encoding
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body:
+            body = await self._run(compressor.compress_all, body)
+            headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return None
+        del headers["Content-Length"]
+        await send(start)
+        return compressor
+
+    async def _send_chunk(self, compressor: Compressor, message: Message, send: Send):
+        """Compress and flush a streamed body chunk, ending the stream on the last."""
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        chunk = await self._run(compressor.compress, body) if body else b""
+        if not more_body:
+            chunk += compressor.finish()
+        elif not chunk:
+            return
+        await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _run(self, compress, data: bytes) -> bytes:
+        """Compress inline, or in a worker thread for large data."""
+        if len(data) >= self.offload_size:
+            return await asyncio.to_thread(compress, data)
+        return compress(data)
+
+    @staticmethod
+    def _compressible(start: Message) -> bool:
+        if start["status"] in (204, 304):
+            return False
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(UNCOMPRESSED_TYPES):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
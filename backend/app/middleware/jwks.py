@@ -0,0 +1,173 @@
+"""
+Asynchronous JWKS provider for Cognito token verification.
+
+Keys are prefetched at startup and refreshed in the background every
+``settings.jwks_cache_ttl`` seconds. Tokens signed with an unknown ``kid``
+trigger an on-demand refetch, rate limited to one per
+``settings.jwks_min_refresh_interval`` and shared by all concurrent callers.
+If Cognito is unreachable the last-known-good keys keep being served.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+class JWKSProvider:
+    """Cached, self-refreshing JSON Web Key Set."""
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float | None = None,
+        min_refresh_interval: float | None = None,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize JWKS provider.
+
+        Args:
+            jwks_url: URL of the JWKS document
+            ttl: Seconds between background refreshes (defaults to settings.jwks_cache_ttl)
+            min_refresh_interval: Minimum seconds between on-demand refetches
+                (defaults to settings.jwks_min_refresh_interval)
+            timeout: HTTP timeout in seconds (defaults to settings.jwks_fetch_timeout)
+        """
+        self.jwks_url = jwks_url
+        self.ttl = ttl if ttl is not None else settings.jwks_cache_ttl
+        self.min_refresh_interval = (
+            min_refresh_interval
+            if min_refresh_interval is not None
+            else settings.jwks_min_refresh_interval
+        )
+        self.timeout = timeout if timeout is not None else settings.jwks_fetch_timeout
+
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: float = 0.0
+        self._last_attempt: Optional[float] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether at least one signing key is cached."""
+        return bool(self._keys)
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful fetch, or None if never fetched."""
+        if not self._fetched_at:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    def has_key(self, kid: str) -> bool:
+        """Whether a key ID is in the current key set (no fetch)."""
+        return kid in self._keys
+
+    def load(self, jwks: Dict[str, Any]):
+        """
+        Replace the cached keys with a JWKS document (no fetch).
+
+        Counts as a fetch attempt for the on-demand refetch rate limit, so a
+        provider with min_refresh_interval=inf never goes to the network.
+
+        Args:
+            jwks: JWKS document with a 'keys' list
+        """
+        self._keys = {key["kid"]: key for key in jwks.get("keys", []) if key.get("kid")}
+        self._fetched_at = self._last_attempt = time.monotonic()
+
+    async def start(self):
+        """Prefetch keys and start the background refresh loop."""
+        await self.refresh()
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info("JWKS provider started (%s keys, ttl=%ss)", len(self._keys), self.ttl)
+
+    async def stop(self):
+        """Stop the background refresh loop."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the JWK for a key ID.
+
+        Refetches when the cache is stale or the kid is unknown, subject to
+        the on-demand rate limit.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            JWK dict, or None if the key is not known
+        """
+        stale = self.age is None or self.age > self.ttl
+        if (stale or kid not in self._keys) and self._may_refetch():
+            await self.refresh()
+        return self._keys.get(kid)
+
+    async def refresh(self) -> bool:
+        """
+        Fetch the JWKS document (single-flight).
+
+        Concurrent callers on the same event loop share one request.
+
+        Returns:
+            True if the keys were refreshed
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight
+        if inflight is not None and not inflight.done() and inflight.get_loop() is loop:
+            return await asyncio.shield(inflight)
+
+        self._inflight = loop.create_task(self._fetch())
+        return await asyncio.shield(self._inflight)
+
+    def _may_refetch(self) -> bool:
+        """Check the on-demand refetch rate limit."""
+        if self._last_attempt is None:
+            return True
+        return time.monotonic() - self._last_attempt >= self.min_refresh_interval
+
+    async def _fetch(self) -> bool:
+        """Fetch and replace the cached keys, keeping the old ones on failure."""
+        self._last_attempt = time.monotonic()
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.jwks_url)
+                response.raise_for_status()
+                jwks = response.json()
+
+            if not any(key.get("kid") for key in jwks.get("keys", [])):
+                raise ValueError("JWKS document contains no keys")
+
+            self.load(jwks)
+            logger.debug("Retrieved JWKS with %s keys", len(self._keys))
+            return True
+        except Exception as e:
+            if self._keys:
+                logger.warning("Failed to refresh JWKS, serving last-known-good keys: %s", e)
+            else:
+                logger.error("Failed to retrieve JWKS: %s", e)
+            return False
+
+    async def _refresh_loop(self):
+        """Refresh keys every ttl seconds, retrying sooner after failures."""
+        while True:
+            age = self.age
+            if age is None:
+                delay = self.min_refresh_interval
+            else:
+                delay = max(self.ttl - age, self.min_refresh_interval)
+            await asyncio.sleep(delay)
+            await self.refresh()
@@ -0,0 +1,160 @@
+"""
+Interchangeable JWT verification backends.
+
+``CognitoJWTValidator`` talks to a ``JWTBackend`` instead of a specific
+library, so the RS256 implementation can be chosen with the ``JWT_BACKEND``
+setting. Every backend must pass the conformance cases in
+``benchmarks/jwt_backends.py`` (expired, wrong issuer, unknown kid, tampered
+signature, ...) before it is used.
+
+Available backends:
+- jose: python-jose (default, always installed)
+- pyjwt: PyJWT with cryptography (``pip install ".[pyjwt]"``)
+"""
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from app.core.exceptions import InvalidTokenException
+
+
+class JWTBackend(ABC):
+    """RS256 verification primitives used by the Cognito validator."""
+
+    name: str = ""
+
+    @abstractmethod
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        """
+        Decode the token header without verifying the signature.
+
+        Raises:
+            InvalidTokenException: If the token is malformed
+        """
+
+    @abstractmethod
+    def construct_key(self, jwk_data: Dict[str, Any]) -> Any:
+        """
+        Build a reusable public key object from a JWK.
+
+        Raises:
+            InvalidTokenException: If the JWK cannot be used for RS256
+        """
+
+    @abstractmethod
+    def decode(self, token: str, key: Any, issuer: str) -> Dict[str, Any]:
+        """
+        Verify signature, expiry and issuer, and return the claims.
+
+        Audience is not verified (Cognito ID tokens are validated by issuer).
+
+        Raises:
+            InvalidTokenException: If verification fails
+        """
+
+
+class JoseBackend(JWTBackend):
+    """python-jose backend."""
+
+    name = "jose"
+
+    def __init__(self):
+        """Initialize jose backend."""
+        from jose import JWTError, jwk, jwt
+
+        self._jwt = jwt
+        self._jwk = jwk
+        self._error = JWTError
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.get_unverified_header(token)
+        except self._error as e:
+            raise InvalidTokenException(f"Invalid token header: {e}")
+
+    def construct_key(self, jwk_data: Dict[str, Any]) -> Any:
+        try:
+            return self._jwk.construct(jwk_data, algorithm="RS256")
+        except self._error as e:
+            raise InvalidTokenException(f"Invalid JWK: {e}")
+
+    def decode(self, token: str, key: Any, issuer: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                issuer=issuer,
+                options={"verify_aud": False},
+            )
+        except self._error as e:
+            raise InvalidTokenException(str(e))
+
+
+class PyJWTBackend(JWTBackend):
+    """PyJWT backend (uses cryptography directly for RSA)."""
+
+    name = "pyjwt"
+
+    def __init__(self):
+        """Initialize PyJWT backend."""
+        try:
+            import jwt
+            from jwt.algorithms import RSAAlgorithm
+        except ImportError as e:
+            raise ImportError(
+                "JWT_BACKEND=pyjwt requires PyJWT: pip install '.[pyjwt]'"
+            ) from e
+
+        self._jwt = jwt
+        self._rsa = RSAAlgorithm
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.get_unverified_header(token)
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenException(f"Invalid token header: {e}")
+
+    def construct_key(self, jwk_data: Dict[str, Any]) -> Any:
+        try:
+            return self._rsa.from_jwk(json.dumps(jwk_data))
+        except (self._jwt.PyJWTError, ValueError, KeyError) as e:
+            raise InvalidTokenException(f"Invalid JWK: {e}")
+
+    def decode(self, token: str, key: Any, issuer: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                issuer=issuer,
+                options={"verify_aud": False},
+            )
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenException(str(e))
+
+
+BACKENDS = {
+    JoseBackend.name: JoseBackend,
+    PyJWTBackend.name: PyJWTBackend,
+}
+
+
+def get_jwt_backend(name: str) -> JWTBackend:
+    """
+    Create a JWT backend by name.
+
+    Args:
+        name: Backend name ('jose' or 'pyjwt')
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JWT backend '{name}', expected one of {sorted(BACKENDS)}")
+    return backend_cls()
@@ -0,0 +1,171 @@
+"""
+Local Cognito stand-in for offline load testing.
+
+Generates (or loads) an RSA keypair, publishes it as a JWKS document and
+mints Cognito-shaped ID tokens. When ``LOCAL_ISSUER_ENABLED=true`` the
+``CognitoJWTValidator`` trusts this issuer instead of Cognito and the dev
+auth bypass is switched off, so requests go through the real
+``get_current_user``/``require_admin`` path including signature checks.
+
+The private key is stored in ``LOCAL_ISSUER_KEY_FILE`` so every uvicorn
+worker and the load generator share the same key.
+"""
+import base64
+import os
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+def _int_b64(value: int) -> str:
+    """Encode an integer as unpadded base64url (JWK format)."""
+    data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+class LocalIssuer:
+    """RSA keypair and token minting for a fake Cognito user pool."""
+
+    def __init__(
+        self,
+        issuer: str | None = None,
+        key_file: str | None = None,
+        client_id: str = "local-client",
+    ):
+        """
+        Initialize local issuer.
+
+        Args:
+            issuer: Issuer URL placed in the 'iss' claim
+                (defaults to settings.local_issuer_url)
+            key_file: PEM file for the private key, created if missing
+                (defaults to settings.local_issuer_key_file; None = in-memory key)
+            client_id: Value for the 'aud' claim
+        """
+        self.issuer = issuer or settings.local_issuer_url
+        self.client_id = client_id
+        self.private_key = self._load_or_create_key(
+            key_file if key_file is not None else settings.local_issuer_key_file
+        )
+        self._private_pem = self.private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+        numbers = self.private_key.public_key().public_numbers()
+        n = _int_b64(numbers.n)
+        # Stable kid derived from the modulus, so all workers agree
+        self.kid = f"local-{n[:16]}"
+        self._jwk = {
+            "kty": "RSA",
+            "kid": self.kid,
+            "alg": "RS256",
+            "use": "sig",
+            "n": n,
+            "e": _int_b64(numbers.e),
+        }
+
+        logger.info("Local issuer ready: %s (kid: %s)", self.issuer, self.kid)
+
+    @staticmethod
+    def _load_or_create_key(key_file: str | None) -> rsa.RSAPrivateKey:
+        """Load the private key, generating and persisting it if needed."""
+        if key_file and os.path.exists(key_file):
+            with open(key_file, "rb") as f:
+                return serialization.load_pem_private_key(f.read(), password=None)
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        if not key_file:
+            return key
+
+        pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+        # Write to a temp file and hard-link into place so concurrent workers
+        # never read a partial key; the first writer wins.
+        tmp_path = f"{key_file}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pem)
+        try:
+            os.link(tmp_path, key_file)
+            logger.info("Generated local issuer key: %s", key_file)
+            return key
+        except FileExistsError:
+            with open(key_file, "rb") as f:
+                return serialization.load_pem_private_key(f.read(), password=None)
+        finally:
+            os.unlink(tmp_path)
+
+    @property
+    def jwks(self) -> Dict[str, Any]:
+        """Public JWKS document."""
+        return {"keys": [dict(self._jwk)]}
+
+    def mint(
+        self,
+        sub: str,
+        email: str,
+        role: str = "user",
+        username: Optional[str] = None,
+        expires_in: int = 3600,
+        extra_claims: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Mint a signed Cognito-style ID token.
+
+        Args:
+            sub: User ID ('sub' claim)
+            email: User email
+            role: Value for 'custom:role' ('admin' or 'user')
+            username: 'cognito:username' (defaults to email)
+            expires_in: Lifetime in seconds
+            extra_claims: Additional claims to merge in
+
+        Returns:
+            Signed JWT string
+        """
+        now = int(time.time())
+        claims = {
+            "sub": sub,
+            "email": email,
+            "email_verified": True,
+            "cognito:username": username or email,
+            "custom:role": role,
+            "token_use": "id",
+            "aud": self.client_id,
+            "iss": self.issuer,
+            "auth_time": now,
+            "iat": now,
+            "exp": now + expires_in,
+            "jti": str(uuid.uuid4()),
+        }
+        if extra_claims:
+            claims.update(extra_claims)
+
+        return jwt.encode(
+            claims, self._private_pem, algorithm="RS256", headers={"kid": self.kid}
+        )
+
+
+# Global issuer instance
+_local_issuer = None
+
+
+def get_local_issuer() -> LocalIssuer:
+    """Get or create the local issuer."""
+    global _local_issuer
+    if _local_issuer is None:
+        _local_issuer = LocalIssuer()
+    return _local_issuer
@@ -0,0 +1,70 @@
+"""
+Prometheus request metrics middleware.
+
+Pure ASGI middleware recording latency per method, route template (e.g.
+``/api/accounts/{account_id}``, not the raw path) and status, plus the
+number of requests in flight.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_PROGRESS
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Route template of the matched route, or 'unmatched'.
+
+    The router stores the matched route in the scope. Depending on the
+    FastAPI version, routes of included routers may be relative to the
+    include prefix, so the prefix is recovered from the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    regex = getattr(route, "path_regex", None)
+    if template is None:
+        return "unmatched"
+    if regex is None:
+        return template
+
+    path = scope["path"]
+    if regex.match(path):
+        return template
+    for index, char in enumerate(path):
+        if char == "/" and index and regex.match(path[index:]):
+            return path[:index] + template
+    return template
+
+
+class MetricsMiddleware:
+    """Record request latency and in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            HTTP_REQUEST_SECONDS.labels(
+                method=method, route=route_template(scope), status=str(status_code)
+            ).observe(time.perf_counter() - start)
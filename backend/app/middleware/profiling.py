@@ -0,0 +1,132 @@
+"""
+Admin request profiling middleware.
+
+With ``PROFILING_ENABLED=true``, an admin can profile a single request by
+sending ``X-Profile: 1`` or adding ``?profile=1``. The caller is resolved
+with the regular auth dependencies and must pass ``require_admin``;
+otherwise the flag is ignored and the request runs normally.
+
+The profile is stored by ``ProfileStore`` and its ID is returned in the
+``X-Profile-Id`` response header. List and download profiles via
+``/api/admin/profiles``. Profiles run one at a time; a flagged request
+arriving while another is being profiled runs unprofiled.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.middleware.cognito_auth import get_current_user, get_dev_user, require_admin
+from app.services.profiling import (
+    get_profile_store,
+    profile_lock,
+    resolve_profiler,
+    run_profiled,
+)
+
+_TRUE_VALUES = {"1", "true", "yes"}
+
+
+def _profile_requested(scope: Scope, headers: Headers) -> bool:
+    if headers.get("x-profile", "").lower() in _TRUE_VALUES:
+        return True
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return any(v.lower() in _TRUE_VALUES for v in query.get("profile", []))
+
+
+async def _resolve_admin(headers: Headers) -> Optional[Dict[str, Any]]:
+    """Return the admin user making the request, or None."""
+    try:
+        if settings.use_dev_auth:
+            user = await get_dev_user()
+        else:
+            scheme, _, token = headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            user = await get_current_user(
+                HTTPAuthorizationCredentials(scheme=scheme, credentials=token)
+            )
+        return await require_admin(current_user=user)
+    except HTTPException:
+        return None
+
+
+class ProfilingMiddleware:
+    """Profile flagged requests from admins."""
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not _profile_requested(scope, headers):
+            await self.app(scope, receive, send)
+            return
+
+        admin = await _resolve_admin(headers)
+        if admin is None:
+            logger.warning("Ignoring profile flag from non-admin on %s", scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        if profile_lock.locked():
+            logger.info("Profile already running, not profiling %s", scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        async with profile_lock:
+            await self._profile(scope, receive, send, admin)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send, admin: Dict[str, Any]):
+        store = get_profile_store()
+        profile_id = store.new_id()
+        profiler = resolve_profiler()
+        status_code = 500
+
+        async def send_with_profile_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        start = time.perf_counter()
+        data = await run_profiled(
+            profiler, lambda: self.app(scope, receive, send_with_profile_id)
+        )
+        duration = time.perf_counter() - start
+
+        # Write and prune off the event loop
+        meta = await asyncio.to_thread(
+            store.save,
+            profile_id,
+            data,
+            {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "profiler": profiler,
+                "user_id": admin["user_id"],
+            },
+        )
+        logger.info(
+            "Profiled %s %s (%sms, %s) -> %s",
+            scope["method"],
+            scope["path"],
+            meta["duration_ms"],
+            profiler,
+            meta["filename"],
+        )
@@ -0,0 +1,96 @@
+"""
+Server-Timing middleware.
+
+Pure ASGI middleware (so the request contextvar reaches the endpoint) that
+collects the AWS calls made while serving each request, adds them as a
+``Server-Timing`` response header and writes one structured log line per
+request to the ``account_platform.request`` logger (sample it with
+``LOG_SAMPLE_RATES=request=0.1``).
+"""
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+from app.core.timing import RequestTimings, end_request_timings, start_request_timings
+
+logger = get_logger("request")
+
+
+class ServerTimingMiddleware:
+    """Attach per-request AWS call timings to responses and logs."""
+
+    def __init__(self, app: ASGIApp, header: bool = True):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application
+            header: Whether to emit the Server-Timing header
+        """
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = start_request_timings()
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.header:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        timings.server_timing(time.perf_counter() - start),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_timings(token)
+            if logger.isEnabledFor(logging.INFO):
+                self._log(scope, status_code, time.perf_counter() - start, timings)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, duration: float, timings: RequestTimings):
+        by_service = timings.by_service()
+        aws_seconds = sum(seconds for _, seconds in by_service.values())
+        services = " ".join(
+            f"{service}={count}/{seconds * 1000:.1f}ms"
+            for service, (count, seconds) in sorted(by_service.items())
+        )
+        logger.info(
+            "request method=%s path=%s status=%s duration_ms=%.1f "
+            "aws_calls=%d aws_ms=%.1f%s",
+            scope["method"],
+            scope["path"],
+            status_code,
+            duration * 1000,
+            len(timings.calls),
+            aws_seconds * 1000,
+            f" {services}" if services else "",
+            extra={
+                "request_timing": {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(duration * 1000, 2),
+                    "aws_calls": len(timings.calls),
+                    "aws_ms": round(aws_seconds * 1000, 2),
+                    "operations": {
+                        name: {"count": count, "ms": round(seconds * 1000, 2)}
+                        for name, (count, seconds) in timings.by_operation().items()
+                    },
+                }
+            },
+        )
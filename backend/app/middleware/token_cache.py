@@ -0,0 +1,86 @@
+"""
+Cache of verified JWT claims.
+
+The SPA sends the same ID token for up to an hour, so full RS256
+verification is only needed the first time a token is seen. Entries are
+keyed by the SHA-256 of the token and expire at the token's ``exp``.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified token claims."""
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        Initialize token cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens (0 disables the cache)
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Look up a previously verified token.
+
+        Args:
+            token: Raw JWT string
+
+        Returns:
+            Tuple of (kid, claims), or None if absent or expired
+        """
+        if not self.maxsize:
+            return None
+
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, kid, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return kid, claims
+
+    def put(self, token: str, kid: str, claims: Dict[str, Any]):
+        """
+        Store verified claims until the token expires.
+
+        Tokens without a numeric ``exp`` claim are never cached.
+        """
+        if not self.maxsize:
+            return
+
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), kid, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached tokens."""
+        with self._lock:
+            self._entries.clear()
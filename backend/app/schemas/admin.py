@@ -33,3 +33,18 @@ class QuotaConfigUpdate(BaseModel):
     """Schema for updating quota configuration."""
 
     models: List[ModelConfig] = Field(..., description="List of model configurations to update")
+
+
+class ProfileInfo(BaseModel):
+    """Schema for a stored request profile."""
+
+    id: str = Field(..., description="Profile ID")
+    method: str = Field(..., description="HTTP method of the profiled request")
+    path: str = Field(..., description="Path of the profiled request")
+    status: int = Field(..., description="Response status code")
+    duration_ms: float = Field(..., description="Request duration under the profiler")
+    profiler: str = Field(..., description="Profiler used (pyinstrument or cprofile)")
+    filename: str = Field(..., description="Stored file (.speedscope.json or .pstats)")
+    size_bytes: int = Field(..., description="Profile size")
+    created_at: int = Field(..., description="Unix timestamp when stored")
+    user_id: Optional[str] = Field(None, description="Admin who requested the profile")
@@ -0,0 +1,49 @@
+"""
+Audit log schemas.
+"""
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+
+def _plain_numbers(value: Any) -> Any:
+    """Convert DynamoDB Decimals to int/float so they serialize as numbers."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {k: _plain_numbers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain_numbers(v) for v in value]
+    return value
+
+
+class AuditLogEntry(BaseModel):
+    """Schema for a single audit log entry."""
+
+    log_id: str = Field(..., description="Audit log ID")
+    timestamp: int = Field(..., description="Unix timestamp of the action")
+    user_id: str = Field(..., description="User who performed the action")
+    action: str = Field(..., description="Action type (e.g., create_account)")
+    resource_type: str = Field(..., description="Type of resource affected")
+    resource_id: str = Field(..., description="ID of the resource affected")
+    details: Dict[str, Any] = Field(default_factory=dict, description="Additional details")
+    ip_address: str = Field("", description="Client IP address")
+    user_agent: str = Field("", description="Client user agent")
+    status: str = Field(..., description="Action status (success/failure)")
+
+    @field_validator("details", mode="before")
+    @classmethod
+    def plain_details(cls, v):
+        """Render numeric detail values as JSON numbers."""
+        return _plain_numbers(v) if v else {}
+
+
+class AuditLogPage(BaseModel):
+    """Schema for a page of audit log entries."""
+
+    items: List[AuditLogEntry] = Field(..., description="Audit log entries")
+    count: int = Field(..., description="Number of entries in this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (None if no more results)"
+    )
@@ -22,3 +22,21 @@ class UserInfo(BaseModel):
     username: str = Field(..., description="Username")
     role: str = Field(..., description="User role (admin/user)")
     claims: Optional[Dict] = Field(default=None, description="Full JWT claims")
+
+
+class LocalTokenRequest(BaseModel):
+    """Request to mint a token from the local issuer (load testing only)."""
+
+    sub: str = Field(..., description="User ID (sub claim)")
+    email: str = Field(..., description="User email")
+    role: str = Field(default="user", description="custom:role claim (admin/user)")
+    username: Optional[str] = Field(default=None, description="cognito:username claim")
+    expires_in: int = Field(default=3600, ge=1, le=86400, description="Token lifetime in seconds")
+
+
+class LocalTokenResponse(BaseModel):
+    """Token minted by the local issuer."""
+
+    id_token: str = Field(..., description="Signed RS256 ID token")
+    token_type: str = Field(default="Bearer", description="Token type")
+    expires_in: int = Field(..., description="Token lifetime in seconds")
@@ -0,0 +1,154 @@
+"""
+Streaming export of the account inventory (NDJSON or CSV).
+
+Accounts are read from the repository one page at a time while the
+response is being sent, so memory holds a single page regardless of the
+fleet size. ``export`` reads the first page before returning, so a database
+that is down fails the request before any response is sent; a read that
+fails later raises out of the stream, which aborts the response instead of
+ending it like a complete file.
+
+Columns are a fixed set of account attributes followed by one TPM column
+per enabled model in the current quota config, plus a 1M context TPM
+column for models that have one.
+"""
+import csv
+import io
+import itertools
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.responses import dumps
+from app.db.records import AccountRecord
+from app.db.repositories import AccountRepository
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+BASE_COLUMNS = [
+    "account_id",
+    "account_name",
+    "account_email",
+    "region",
+    "status",
+    "billing_country",
+    "created_by",
+    "created_at",
+    "updated_at",
+]
+
+# Spreadsheet apps evaluate cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def quota_columns(models: List[Dict[str, Any]]) -> List[str]:
+    """bedrock_quota field names for the enabled models of a quota config."""
+    columns = []
+    for model in models:
+        if not model.get("enabled", False):
+            continue
+        field_name = model["model_id"].replace("-", "_").replace(".", "_")
+        columns.append(field_name + "_tpm")
+        if model.get("has_1m_context"):
+            columns.append(field_name + "_1m_tpm")
+    return columns
+
+
+def _csv_safe(value: Any) -> Any:
+    """Keep text cells from being read as formulas."""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class AccountInventoryExporter:
+    """Page-by-page account inventory export."""
+
+    def __init__(
+        self,
+        repository: AccountRepository,
+        models: List[Dict[str, Any]],
+        page_size: Optional[int] = None,
+    ):
+        """
+        Initialize account inventory exporter.
+
+        Args:
+            repository: Account repository used for reads
+            models: Quota config models (enabled ones become TPM columns)
+            page_size: Accounts per read
+        """
+        self.repository = repository
+        self.page_size = max(1, page_size or settings.account_export_page_size)
+        self.quota_columns = quota_columns(models)
+        self.columns = BASE_COLUMNS + self.quota_columns
+
+    def row(self, record: AccountRecord) -> List[Any]:
+        """Column values for one account (None where unknown)."""
+        billing = record.get("billing_address") or {}
+        quota = record.get("bedrock_quota") or {}
+        return [
+            record.get("account_id"),
+            record.get("account_name"),
+            record.get("account_email"),
+            record.get("region"),
+            record.get("status"),
+            billing.get("country"),
+            record.get("created_by"),
+            record.get("created_at"),
+            record.get("updated_at"),
+        ] + [quota.get(column) for column in self.quota_columns]
+
+    def _pages(self, user_id: str, user_role: str) -> Iterator[List[AccountRecord]]:
+        return self.repository.iter_account_pages(
+            user_id=user_id, user_role=user_role, page_size=self.page_size
+        )
+
+    def iter_ndjson(self, user_id: str, user_role: str) -> Iterator[bytes]:
+        """One JSON object per account, one chunk per page."""
+        return self._ndjson(self._pages(user_id, user_role))
+
+    def iter_csv(self, user_id: str, user_role: str) -> Iterator[bytes]:
+        """Header row, then one CSV row per account, one chunk per page."""
+        return self._csv(self._pages(user_id, user_role))
+
+    def _ndjson(self, pages: Iterable[List[AccountRecord]]) -> Iterator[bytes]:
+        columns = self.columns
+        for page in pages:
+            yield b"".join(
+                dumps(dict(zip(columns, self.row(record)))) + b"\n" for record in page
+            )
+
+    def _csv(self, pages: Iterable[List[AccountRecord]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+        for page in pages:
+            writer.writerows(
+                [_csv_safe(value) for value in self.row(record)] for record in page
+            )
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            # Header only (no accounts)
+            yield buffer.getvalue().encode("utf-8")
+
+    def export(self, export_format: str, user_id: str, user_role: str) -> Iterator[bytes]:
+        """
+        Byte stream of the export, with the first page already read.
+
+        Raises:
+            ValueError: For an unknown format
+            AWSServiceException: If the first page cannot be read
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}")
+
+        pages = self._pages(user_id, user_role)
+        first = next(pages, None)
+        if first is not None:
+            pages = itertools.chain([first], pages)
+
+        if export_format == "csv":
+            return self._csv(pages)
+        return self._ndjson(pages)
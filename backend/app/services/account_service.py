@@ -1,19 +1,29 @@
 """
 Account management business logic service.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from app.core.config import settings
 from app.core.exceptions import (
     AccountNotFoundException,
+    AuditLogException,
     InvalidCredentialsException,
     PermissionDeniedException,
 )
 from app.core.logging import logger
+from app.db.audit_codec import diff_values
 from app.db.dynamodb import DynamoDBClient
-from app.db.models import AuditLogManager, AWSAccountManager
+from app.db.records import AccountRecord
+from app.db.repositories import (
+    DEFAULT_QUOTA_MODELS,
+    get_account_repository,
+    get_audit_log_repository,
+    get_quota_config_repository,
+)
+from app.services.account_export import AccountInventoryExporter
 from app.services.aws_service import AWSService
 from app.services.encryption_service import KMSService
+from app.services.event_bus import get_event_bus
 
 
 class AccountService:
@@ -21,13 +31,51 @@ class AccountService:
 
     def __init__(self):
         """Initialize account service with dependencies."""
-        self.db_client = DynamoDBClient()
+        self.db_client = (
+            DynamoDBClient() if settings.storage_backend == "dynamodb" else None
+        )
         self.kms_service = KMSService()
-        self.account_manager = AWSAccountManager(self.db_client)
-        self.audit_manager = AuditLogManager(self.db_client)
+        self.account_manager = get_account_repository(self.db_client)
+        self.audit_manager = get_audit_log_repository(self.db_client)
+        self.event_bus = get_event_bus()
 
         logger.info("AccountService initialized")
 
+    @staticmethod
+    def _quota_delta(
+        old_quota: Dict[str, Any], new_quota: Dict[str, Any]
+    ) -> Dict[str, int]:
+        """Per-field TPM change between two bedrock_quota dicts."""
+        delta = {}
+        for key in set(old_quota) | set(new_quota):
+            if not key.endswith("_tpm"):
+                continue
+            change = int(new_quota.get(key) or 0) - int(old_quota.get(key) or 0)
+            if change:
+                delta[key] = change
+        return delta
+
+    def _publish_totals(
+        self,
+        owner: Optional[str],
+        total_accounts: int = 0,
+        active_accounts: int = 0,
+        quota_delta: Optional[Dict[str, int]] = None,
+    ):
+        """Publish a dashboard totals delta if anything changed."""
+        if not (total_accounts or active_accounts or quota_delta):
+            return
+
+        self.event_bus.publish(
+            "totals_changed",
+            {
+                "total_accounts": total_accounts,
+                "active_accounts": active_accounts,
+                "quota_delta": quota_delta or {},
+            },
+            owner=owner,
+        )
+
     async def create_account(
         self,
         access_key: str,
@@ -71,7 +119,7 @@ class AccountService:
                 {"user_id": created_by, "required_role": "admin"},
             )
 
-        logger.info(f"Creating account: {account_name} in region: {region} by user: {created_by}")
+        logger.info("Creating account: %s in region: %s by user: %s", account_name, region, created_by)
 
         # Step 1: Verify credentials and get account info
         aws_service = AWSService(access_key, secret_key, settings.aws_region)
@@ -84,12 +132,12 @@ class AccountService:
             )
 
         account_id = verification["account_id"]
-        logger.info(f"Verified AWS account: {account_id}")
+        logger.info("Verified AWS account: %s", account_id)
 
         # Step 2: Encrypt credentials
         encrypted_access_key = self.kms_service.encrypt(access_key)
         encrypted_secret_key = self.kms_service.encrypt(secret_key)
-        logger.info(f"Encrypted credentials for account: {account_id}")
+        logger.info("Encrypted credentials for account: %s", account_id)
 
         # Step 3: Get billing address (optional)
         billing_address = aws_service.get_billing_address()
@@ -121,12 +169,21 @@ class AccountService:
             status="success",
         )
 
-        logger.info(f"Account created successfully: {account_id} in region: {region}")
+        # Step 7: Notify dashboard subscribers
+        self.event_bus.publish("account_created", {"account": account}, owner=created_by)
+        self._publish_totals(
+            owner=created_by,
+            total_accounts=1,
+            active_accounts=1,
+            quota_delta=self._quota_delta({}, bedrock_quota or {}),
+        )
+
+        logger.info("Account created successfully: %s in region: %s", account_id, region)
         return account
 
     async def list_accounts(
         self, user_id: str, user_role: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[AccountRecord]:
         """
         List accounts based on user role.
 
@@ -137,15 +194,111 @@ class AccountService:
         Returns:
             List of accounts (without credentials)
         """
-        logger.info(f"Listing accounts for user: {user_id} (role: {user_role})")
+        logger.info("Listing accounts for user: %s (role: %s)", user_id, user_role)
 
         accounts = self.account_manager.list_accounts(
             user_id=user_id, user_role=user_role
         )
 
-        logger.info(f"Found {len(accounts)} accounts for user: {user_id}")
+        logger.info("Found %s accounts for user: %s", len(accounts), user_id)
         return accounts
 
+    async def export_inventory(
+        self,
+        user_id: str,
+        user_role: str,
+        export_format: str = "ndjson",
+        ip_address: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Start a streaming export of the account inventory.
+
+        Admins export all accounts, users the accounts they created. TPM
+        columns follow the current quota config (the default models if none
+        is stored).
+
+        Args:
+            user_id: User requesting the export
+            user_role: User role ('admin' or 'user')
+            export_format: 'ndjson' or 'csv'
+            ip_address: Optional IP address for audit
+
+        Returns:
+            Byte stream; the first page is read before returning, the rest
+            page by page as it is consumed
+
+        Raises:
+            ValueError: For an unknown format
+            AWSServiceException: If the first page cannot be read
+        """
+        quota_config = get_quota_config_repository().get_config()
+        models = quota_config.get("models", []) if quota_config else DEFAULT_QUOTA_MODELS
+        exporter = AccountInventoryExporter(self.account_manager, models)
+        details = {"format": export_format, "columns": len(exporter.columns)}
+
+        try:
+            stream = exporter.export(export_format, user_id, user_role)
+        except Exception as e:
+            self._log_export_failure(user_id, details, e, ip_address)
+            raise
+
+        self.audit_manager.log_action(
+            user_id=user_id,
+            action="export_inventory",
+            resource_type="account",
+            resource_id="*",
+            details=details,
+            ip_address=ip_address,
+        )
+        logger.info(
+            "Account inventory export (%s) started for user: %s (role: %s)",
+            export_format,
+            user_id,
+            user_role,
+        )
+        return self._watch_export(stream, user_id, details, ip_address)
+
+    def _watch_export(
+        self,
+        stream: Iterator[bytes],
+        user_id: str,
+        details: Dict[str, Any],
+        ip_address: Optional[str],
+    ) -> Iterator[bytes]:
+        """Pass the export through, recording a failure if it aborts mid-stream."""
+        chunks = 0
+        try:
+            for chunk in stream:
+                chunks += 1
+                yield chunk
+        except Exception as e:
+            self._log_export_failure(user_id, {**details, "chunks_sent": chunks}, e, ip_address)
+            raise
+
+    def _log_export_failure(
+        self,
+        user_id: str,
+        details: Dict[str, Any],
+        error: Exception,
+        ip_address: Optional[str],
+    ):
+        logger.error(
+            "Account inventory export (%s) aborted for user %s after %s chunks: %s",
+            details["format"],
+            user_id,
+            details.get("chunks_sent", 0),
+            error,
+        )
+        self.audit_manager.log_action(
+            user_id=user_id,
+            action="export_inventory",
+            resource_type="account",
+            resource_id="*",
+            details={**details, "error": str(error)},
+            ip_address=ip_address,
+            status="failure",
+        )
+
     async def get_account(self, account_id: str) -> Dict[str, Any]:
         """
         Get account details.
@@ -191,6 +344,8 @@ class AccountService:
         Raises:
             PermissionDeniedException: If user is not admin
             AccountNotFoundException: If account not found
+            AuditLogException: If the export could not be audited
+                (AUDIT_EXPORT_MUST_PERSIST)
         """
         # Permission check
         if user_role != "admin":
@@ -200,7 +355,9 @@ class AccountService:
             )
 
         logger.warning(
-            f"Credentials export requested for account: {account_id} by user: {user_id}"
+            "Credentials export requested for account: %s by user: %s",
+            account_id,
+            user_id,
         )
 
         # Get encrypted credentials
@@ -217,7 +374,8 @@ class AccountService:
         secret_key = self.kms_service.decrypt(creds["secret_key_encrypted"])
 
         # Log action (IMPORTANT for security audit)
-        self.audit_manager.log_action(
+        must_persist = settings.audit_export_must_persist
+        logged = self.audit_manager.log_action(
             user_id=user_id,
             action="export_credentials",
             resource_type="account",
@@ -225,10 +383,17 @@ class AccountService:
             details={"reason": "admin_export"},
             ip_address=ip_address,
             status="success",
+            must_persist=must_persist,
         )
+        if must_persist and not logged:
+            # Never hand out credentials without a durable audit record
+            raise AuditLogException(
+                "Credentials export could not be audited",
+                {"account_id": account_id},
+            )
 
         logger.warning(
-            f"Credentials exported for account: {account_id} by user: {user_id}"
+            "Credentials exported for account: %s by user: %s", account_id, user_id
         )
 
         return {
@@ -269,7 +434,7 @@ class AccountService:
                 {"user_id": user_id, "required_role": "admin"},
             )
 
-        logger.info(f"Refreshing Bedrock quota for account: {account_id}")
+        logger.info("Refreshing Bedrock quota for account: %s", account_id)
 
         # Get account to retrieve region
         account = await self.get_account(account_id)
@@ -289,8 +454,7 @@ class AccountService:
         secret_key = self.kms_service.decrypt(creds["secret_key_encrypted"])
 
         # Get quota configuration
-        from app.db.quota_config_manager import QuotaConfigManager
-        quota_config_manager = QuotaConfigManager()
+        quota_config_manager = get_quota_config_repository()
         quota_config = quota_config_manager.get_config()
 
         # Query quota from AWS using the account's region
@@ -313,11 +477,26 @@ class AccountService:
             action="refresh_quota",
             resource_type="account",
             resource_id=account_id,
-            details={"quota": quota, "region": region},
+            details={
+                "quota": diff_values(account.get("bedrock_quota") or {}, quota),
+                "region": region,
+            },
             status="success",
         )
 
-        logger.info(f"Bedrock quota refreshed for account: {account_id} in region: {region}")
+        # Notify dashboard subscribers
+        owner = account.get("created_by")
+        self.event_bus.publish(
+            "quota_refreshed",
+            {"account_id": account_id, "bedrock_quota": quota},
+            owner=owner,
+        )
+        self._publish_totals(
+            owner=owner,
+            quota_delta=self._quota_delta(account.get("bedrock_quota") or {}, quota),
+        )
+
+        logger.info("Bedrock quota refreshed for account: %s in region: %s", account_id, region)
         return quota
 
     async def get_billing_address(self, account_id: str) -> Dict[str, Any]:
@@ -354,9 +533,10 @@ class AccountService:
                 {"user_id": user_id, "required_role": "admin"},
             )
 
-        success = self.account_manager.update_billing_address(
+        previous = self.account_manager.update_billing_address(
             account_id, billing_address
         )
+        success = previous is not None
 
         if success:
             # Log action
@@ -365,7 +545,7 @@ class AccountService:
                 action="update_billing_address",
                 resource_type="account",
                 resource_id=account_id,
-                details={"billing_address": billing_address},
+                details={"billing_address": diff_values(previous, billing_address)},
                 status="success",
             )
 
@@ -423,6 +603,16 @@ class AccountService:
                 status="success",
             )
 
-            logger.info(f"Account {account_id} deleted by user {user_id}")
+            # Notify dashboard subscribers
+            owner = account.get("created_by")
+            self.event_bus.publish(
+                "account_deactivated", {"account_id": account_id}, owner=owner
+            )
+            self._publish_totals(
+                owner=owner,
+                active_accounts=-1 if account.get("status") == "active" else 0,
+            )
+
+            logger.info("Account %s deleted by user %s", account_id, user_id)
 
         return success
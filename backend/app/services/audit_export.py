@@ -0,0 +1,340 @@
+"""
+Streaming NDJSON export of audit logs.
+
+The requested range is split into partitions that are read concurrently by
+worker threads:
+
+- user_id / resource_id exports query the matching timestamp index, one
+  partition per contiguous time slice
+- other exports use a DynamoDB parallel scan, one partition per segment
+
+Pages flow through a bounded queue, so memory stays flat regardless of the
+range size. After every page an ``{"_checkpoint": "<token>"}`` line is
+emitted. The token encodes the whole export (filters plus per-partition
+cursors), and passing it back as ``resume`` continues after the last
+checkpointed page. A final ``{"_complete": true}`` line marks a finished
+export. Lines are ordered within a partition, not across partitions.
+"""
+import base64
+import binascii
+import json
+import queue
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.repositories import AUDIT_LOG_RETENTION_SECONDS, AuditLogRepository
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize DynamoDB types in exported items."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _line(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, default=_json_default, separators=(",", ":")).encode() + b"\n"
+
+
+@dataclass
+class ExportCheckpoint:
+    """Export definition plus progress, encodable as a resume token."""
+
+    start_time: int
+    end_time: int
+    partitions: int
+    user_id: Optional[str] = None
+    action: Optional[str] = None
+    resource_id: Optional[str] = None
+    cursors: Dict[int, str] = field(default_factory=dict)
+    done: Set[int] = field(default_factory=set)
+    exported: int = 0
+
+    @property
+    def uses_index(self) -> bool:
+        """Whether partitions are time slices of an index query."""
+        return bool(self.user_id or self.resource_id)
+
+    def time_range(self, index: int) -> Tuple[int, int]:
+        """
+        Inclusive time slice for an index partition.
+
+        Boundaries are spread proportionally, so slice widths differ by at
+        most one second and none is empty while partitions <= range length.
+        """
+        length = self.end_time - self.start_time + 1
+        start = self.start_time + index * length // self.partitions
+        end = self.start_time + (index + 1) * length // self.partitions - 1
+        return start, end
+
+    def encode(self) -> str:
+        """Encode as an opaque url-safe token."""
+        payload = {
+            "q": [self.start_time, self.end_time, self.partitions,
+                  self.user_id, self.action, self.resource_id],
+            "c": {str(k): v for k, v in self.cursors.items()},
+            "d": sorted(self.done),
+            "n": self.exported,
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "ExportCheckpoint":
+        """
+        Decode a resume token.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            start_time, end_time, partitions, user_id, action, resource_id = payload["q"]
+            return cls(
+                start_time=int(start_time),
+                end_time=int(end_time),
+                partitions=int(partitions),
+                user_id=user_id,
+                action=action,
+                resource_id=resource_id,
+                cursors={int(k): v for k, v in payload["c"].items()},
+                done={int(i) for i in payload["d"]},
+                exported=int(payload["n"]),
+            )
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed checkpoint: {e}")
+
+
+class AuditLogExporter:
+    """Concurrent, checkpointed audit log export."""
+
+    def __init__(
+        self,
+        manager: AuditLogRepository,
+        partitions: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ):
+        """
+        Initialize audit log exporter.
+
+        Args:
+            manager: Audit log manager used for reads
+            partitions: Time slices or scan segments per export
+            concurrency: Worker threads reading partitions
+            page_size: Items per read (and per checkpoint)
+        """
+        self.manager = manager
+        self.partitions = max(1, partitions or settings.audit_export_partitions)
+        self.concurrency = max(1, concurrency or settings.audit_export_concurrency)
+        self.page_size = max(1, page_size or settings.audit_export_page_size)
+
+    def plan(
+        self,
+        user_id: Optional[str] = None,
+        action: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> ExportCheckpoint:
+        """
+        Create the initial checkpoint for a new export.
+
+        The range defaults to the audit log retention window ending now.
+
+        Raises:
+            ValueError: If start_time is after end_time
+        """
+        if end_time is None:
+            end_time = int(time.time())
+        if start_time is None:
+            start_time = end_time - AUDIT_LOG_RETENTION_SECONDS
+        if start_time > end_time:
+            raise ValueError("start_time must not be after end_time")
+
+        partitions = self.partitions
+        if user_id or resource_id:
+            # At most one slice per second, so every slice is non-empty
+            partitions = min(partitions, end_time - start_time + 1)
+
+        return ExportCheckpoint(
+            start_time=start_time,
+            end_time=end_time,
+            partitions=partitions,
+            user_id=user_id,
+            action=action,
+            resource_id=resource_id,
+        )
+
+    def _read_page(
+        self, checkpoint: ExportCheckpoint, index: int, cursor: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Read one page of a partition."""
+        if checkpoint.uses_index:
+            start_time, end_time = checkpoint.time_range(index)
+            return self.manager.query_logs(
+                user_id=checkpoint.user_id,
+                action=checkpoint.action,
+                resource_id=checkpoint.resource_id,
+                start_time=start_time,
+                end_time=end_time,
+                limit=self.page_size,
+                cursor=cursor,
+            )
+        return self.manager.query_logs(
+            action=checkpoint.action,
+            start_time=checkpoint.start_time,
+            end_time=checkpoint.end_time,
+            limit=self.page_size,
+            cursor=cursor,
+            segment=index,
+            total_segments=checkpoint.partitions,
+        )
+
+    @staticmethod
+    def _put(out: queue.Queue, message: Tuple, stop: threading.Event) -> bool:
+        """Put into the bounded queue, giving up once the export is stopped."""
+        while not stop.is_set():
+            try:
+                out.put(message, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _worker(
+        self,
+        checkpoint: ExportCheckpoint,
+        start_cursors: Dict[int, str],
+        pending: queue.Queue,
+        out: queue.Queue,
+        stop: threading.Event,
+    ):
+        """Read whole partitions until none are left."""
+        while not stop.is_set():
+            try:
+                index = pending.get_nowait()
+            except queue.Empty:
+                return
+
+            cursor = start_cursors.get(index)
+            try:
+                while True:
+                    items, cursor = self._read_page(checkpoint, index, cursor)
+                    if not self._put(out, ("page", index, items, cursor), stop):
+                        return
+                    if cursor is None:
+                        break
+            except Exception as e:
+                self._put(out, ("error", index, e, None), stop)
+                return
+
+    def iter_chunks(self, checkpoint: ExportCheckpoint) -> Iterator[bytes]:
+        """
+        Stream the export as NDJSON, one chunk per page.
+
+        Each chunk holds a page of items followed by its checkpoint line.
+        The checkpoint object is updated in place as pages are emitted.
+
+        Raises:
+            ValueError: If a checkpoint cursor does not match its partition
+            AWSServiceException: If a DynamoDB read fails
+        """
+        remaining = [i for i in range(checkpoint.partitions) if i not in checkpoint.done]
+        pending: queue.Queue = queue.Queue()
+        for index in remaining:
+            pending.put(index)
+
+        # Bounded: at most a few pages are buffered ahead of the consumer
+        out: queue.Queue = queue.Queue(maxsize=self.concurrency * 2)
+        stop = threading.Event()
+        start_cursors = dict(checkpoint.cursors)
+        workers = [
+            threading.Thread(
+                target=self._worker,
+                args=(checkpoint, start_cursors, pending, out, stop),
+                name=f"audit-export-{i}",
+                daemon=True,
+            )
+            for i in range(min(self.concurrency, len(remaining)))
+        ]
+        for worker in workers:
+            worker.start()
+
+        logger.info(
+            "Audit export: %s/%s partitions, %s workers, range %s-%s",
+            len(remaining),
+            checkpoint.partitions,
+            len(workers),
+            checkpoint.start_time,
+            checkpoint.end_time,
+        )
+
+        try:
+            active = len(remaining)
+            while active:
+                kind, index, payload, cursor = out.get()
+                if kind == "error":
+                    logger.error("Audit export partition %s failed: %s", index, payload)
+                    raise payload
+
+                chunk = b"".join(_line(item) for item in payload)
+                checkpoint.exported += len(payload)
+                if cursor is None:
+                    checkpoint.done.add(index)
+                    checkpoint.cursors.pop(index, None)
+                    active -= 1
+                else:
+                    checkpoint.cursors[index] = cursor
+
+                yield chunk + _line(
+                    {"_checkpoint": checkpoint.encode(), "exported": checkpoint.exported}
+                )
+
+            yield _line({"_complete": True, "exported": checkpoint.exported})
+            logger.info("Audit export complete: %s items", checkpoint.exported)
+        finally:
+            stop.set()
+
+    def export(
+        self,
+        resume: Optional[str] = None,
+        compress: bool = False,
+        **filters: Any,
+    ) -> Iterator[bytes]:
+        """
+        Plan (or resume) an export and return its byte stream.
+
+        Args:
+            resume: Checkpoint token from a previous export; filters are ignored
+            compress: Gzip the stream
+            **filters: user_id, action, resource_id, start_time, end_time
+
+        Raises:
+            ValueError: If the resume token or time range is invalid
+        """
+        checkpoint = ExportCheckpoint.decode(resume) if resume else self.plan(**filters)
+        chunks = self.iter_chunks(checkpoint)
+        return gzip_stream(chunks) if compress else chunks
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Gzip a byte stream incrementally.
+
+    Each chunk is sync-flushed so everything up to the last checkpoint can
+    be decompressed from a truncated download.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
@@ -11,7 +11,10 @@ from botocore.exceptions import ClientError
 
 from app.core.config import settings
 from app.core.exceptions import AWSServiceException, InvalidCredentialsException
-from app.core.logging import logger
+from app.core.logging import get_logger, warn_once
+from app.core.timing import instrument_session
+
+logger = get_logger("aws")
 
 
 class AWSService:
@@ -36,18 +39,20 @@ class AWSService:
         self.region = region or settings.aws_region
 
         # Check if we're in development mode
-        self.dev_mode = settings.environment == "development"
+        self.dev_mode = settings.use_mock_aws
 
         if self.dev_mode:
-            logger.warning("🚧 DEVELOPMENT MODE: Using mock AWS API responses")
+            warn_once("🚧 DEVELOPMENT MODE: Using mock AWS API responses")
             self.session = None
         else:
-            self.session = boto3.Session(
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name=self.region,
+            self.session = instrument_session(
+                boto3.Session(
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=self.region,
+                )
             )
-            logger.info(f"AWS service initialized for region: {self.region}")
+            logger.debug("AWS service initialized for region: %s", self.region)
 
     def verify_credentials(self) -> Dict[str, Any]:
         """
@@ -75,12 +80,12 @@ class AWSService:
                 "user_arn": f"arn:aws:iam::{account_id}:user/dev-user",
                 "user_id": "AIDACKCEVSQ6C2EXAMPLE",
             }
-            logger.info(f"🚧 DEV: Mock credentials verified for account: {result['account_id']}")
+            logger.info("🚧 DEV: Mock credentials verified for account: %s", result["account_id"])
             return result
 
         # Production mode: use real STS
         try:
-            sts = self.session.client("sts")
+            sts = self.session.client("sts", endpoint_url=settings.aws_api_endpoint_url)
             identity = sts.get_caller_identity()
 
             result = {
@@ -90,7 +95,7 @@ class AWSService:
                 "user_id": identity["UserId"],
             }
 
-            logger.info(f"Credentials verified for account: {result['account_id']}")
+            logger.info("Credentials verified for account: %s", result["account_id"])
             return result
 
         except ClientError as e:
@@ -144,7 +149,11 @@ class AWSService:
 
         # Production mode: use real AWS Account API
         try:
-            account = self.session.client("account", region_name=self.region)
+            account = self.session.client(
+                "account",
+                region_name=self.region,
+                endpoint_url=settings.aws_api_endpoint_url,
+            )
             response = account.get_contact_information()
 
             contact = response.get("ContactInformation", {})
@@ -163,12 +172,13 @@ class AWSService:
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             logger.warning(
-                f"Could not retrieve billing address: {error_code}. "
-                "This may require additional IAM permissions."
+                "Could not retrieve billing address: %s. "
+                "This may require additional IAM permissions.",
+                error_code,
             )
             return None
         except Exception as e:
-            logger.error(f"Unexpected error getting billing address: {e}")
+            logger.error("Unexpected error getting billing address: %s", e)
             return None
 
     def get_bedrock_quota(self) -> Dict[str, Any]:
@@ -204,7 +214,7 @@ class AWSService:
                 "last_updated": int(time.time()),
                 "note": "Mock quota for development",
             }
-            logger.info(f"🚧 DEV: Returned mock Bedrock quota: Sonnet V1 {sonnet_v1_tpm} TPM, Sonnet 1M {sonnet_1m_tpm} TPM, Opus {opus_tpm} TPM")
+            logger.info("🚧 DEV: Returned mock Bedrock quota: Sonnet V1 %s TPM, Sonnet 1M %s TPM, Opus %s TPM", sonnet_v1_tpm, sonnet_1m_tpm, opus_tpm)
             return result
 
         # Production mode: try real APIs
@@ -224,7 +234,11 @@ class AWSService:
             Quota dict or None if unavailable
         """
         try:
-            quotas = self.session.client("service-quotas", region_name=self.region)
+            quotas = self.session.client(
+                "service-quotas",
+                region_name=self.region,
+                endpoint_url=settings.aws_api_endpoint_url,
+            )
 
             # Define specific QuotaCodes for Claude 4.5 quotas
             # These are the Global cross-region TPM quotas
@@ -253,23 +267,23 @@ class AWSService:
                     if quota_key == "sonnet_v1":
                         sonnet_v1_tpm = quota_value
                         found_quotas.append(f"Sonnet V1: {quota_name}")
-                        logger.info(f"✓ Retrieved Sonnet 4.5 V1 quota: {quota_value} TPM")
+                        logger.debug("✓ Retrieved Sonnet 4.5 V1 quota: %s TPM", quota_value)
                     elif quota_key == "sonnet_v1_1m":
                         sonnet_v1_1m_tpm = quota_value
                         found_quotas.append(f"Sonnet V1 1M: {quota_name}")
-                        logger.info(f"✓ Retrieved Sonnet 4.5 V1 1M Context quota: {quota_value} TPM")
+                        logger.debug("✓ Retrieved Sonnet 4.5 V1 1M Context quota: %s TPM", quota_value)
                     elif quota_key == "opus_45":
                         opus_tpm = quota_value
                         found_quotas.append(f"Opus 4.5: {quota_name}")
-                        logger.info(f"✓ Retrieved Opus 4.5 quota: {quota_value} TPM")
+                        logger.debug("✓ Retrieved Opus 4.5 quota: %s TPM", quota_value)
 
                 except ClientError as e:
                     error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                    logger.warning(f"Could not retrieve {quota_key} quota (code: {quota_code}): {error_code}")
+                    logger.warning("Could not retrieve %s quota (code: %s): %s", quota_key, quota_code, error_code)
 
             # If we found at least one quota, return the result
             if sonnet_v1_tpm > 0 or sonnet_v1_1m_tpm > 0 or opus_tpm > 0:
-                logger.info(f"Successfully retrieved quotas - Sonnet V1: {sonnet_v1_tpm}, Sonnet V1 1M: {sonnet_v1_1m_tpm}, Opus: {opus_tpm}")
+                logger.info("Successfully retrieved quotas - Sonnet V1: %s, Sonnet V1 1M: %s, Opus: %s", sonnet_v1_tpm, sonnet_v1_1m_tpm, opus_tpm)
                 return {
                     "claude_sonnet_45_v1_tpm": sonnet_v1_tpm,
                     "claude_sonnet_45_v1_1m_tpm": sonnet_v1_1m_tpm,
@@ -283,7 +297,7 @@ class AWSService:
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            logger.warning(f"Service Quotas API error: {error_code}")
+            logger.warning("Service Quotas API error: %s", error_code)
             return None
 
     def _get_quota_from_bedrock_api(self) -> Dict[str, Any]:
@@ -294,7 +308,11 @@ class AWSService:
             Dict with available information (quota values set to 0 as not directly available)
         """
         try:
-            bedrock = self.session.client("bedrock", region_name=self.region)
+            bedrock = self.session.client(
+                "bedrock",
+                region_name=self.region,
+                endpoint_url=settings.aws_api_endpoint_url,
+            )
 
             # List foundation models
             response = bedrock.list_foundation_models(byProvider="Anthropic")
@@ -320,8 +338,9 @@ class AWSService:
             }
 
             logger.warning(
-                f"Bedrock API fallback: Found {len(claude_45_models)} Claude 4.5 models but cannot retrieve TPM quotas. "
-                f"Grant servicequotas:GetServiceQuota permission to access quota information."
+                "Bedrock API fallback: Found %s Claude 4.5 models but cannot retrieve TPM quotas. "
+                "Grant servicequotas:GetServiceQuota permission to access quota information.",
+                len(claude_45_models),
             )
             return result
 
@@ -367,12 +386,16 @@ class AWSService:
                     field_name_1m = field_name.replace("_tpm", "_1m_tpm")
                     result[field_name_1m] = tpm_values[seed] // 5  # 1M typically has lower quota
 
-            logger.info(f"🚧 DEV: Returned mock quota for {len([m for m in models_config if m.get('enabled')])} models")
+            logger.info("🚧 DEV: Returned mock quota for %s models", len([m for m in models_config if m.get("enabled")]))
             return result
 
         # Production mode: query Service Quotas API
         try:
-            quotas_client = self.session.client("service-quotas", region_name=self.region)
+            quotas_client = self.session.client(
+                "service-quotas",
+                region_name=self.region,
+                endpoint_url=settings.aws_api_endpoint_url,
+            )
             result = {"last_updated": int(time.time())}
 
             for model in models_config:
@@ -392,9 +415,9 @@ class AWSService:
                         quota_value = int(response.get("Quota", {}).get("Value", 0))
                         field_name = model_id.replace("-", "_").replace(".", "_") + "_tpm"
                         result[field_name] = quota_value
-                        logger.info(f"✓ Retrieved {model_id} TPM quota: {quota_value}")
+                        logger.debug("✓ Retrieved %s TPM quota: %s", model_id, quota_value)
                     except ClientError as e:
-                        logger.warning(f"Could not retrieve {model_id} TPM quota: {e}")
+                        logger.warning("Could not retrieve %s TPM quota: %s", model_id, e)
                         field_name = model_id.replace("-", "_").replace(".", "_") + "_tpm"
                         result[field_name] = 0
 
@@ -410,18 +433,18 @@ class AWSService:
                             quota_value = int(response.get("Quota", {}).get("Value", 0))
                             field_name = model_id.replace("-", "_").replace(".", "_") + "_1m_tpm"
                             result[field_name] = quota_value
-                            logger.info(f"✓ Retrieved {model_id} 1M context TPM quota: {quota_value}")
+                            logger.debug("✓ Retrieved %s 1M context TPM quota: %s", model_id, quota_value)
                         except ClientError as e:
-                            logger.warning(f"Could not retrieve {model_id} 1M context TPM quota: {e}")
+                            logger.warning("Could not retrieve %s 1M context TPM quota: %s", model_id, e)
                             field_name = model_id.replace("-", "_").replace(".", "_") + "_1m_tpm"
                             result[field_name] = 0
 
-            logger.info(f"Successfully retrieved quotas for configured models")
+            logger.info("Successfully retrieved quotas for configured models")
             return result
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            logger.error(f"Error querying quotas: {error_code}")
+            logger.error("Error querying quotas: %s", error_code)
             # Return empty result with timestamp
             return {"last_updated": int(time.time())}
 
@@ -439,7 +462,11 @@ class AWSService:
 
         # Production mode: test real access
         try:
-            bedrock = self.session.client("bedrock", region_name=self.region)
+            bedrock = self.session.client(
+                "bedrock",
+                region_name=self.region,
+                endpoint_url=settings.aws_api_endpoint_url,
+            )
             bedrock.list_foundation_models()
             logger.info("Bedrock access verified")
             return True
@@ -8,7 +8,7 @@ from botocore.exceptions import ClientError
 
 from app.core.config import settings
 from app.core.exceptions import EncryptionException
-from app.core.logging import logger
+from app.core.logging import logger, warn_once
 
 
 class KMSService:
@@ -26,10 +26,10 @@ class KMSService:
         self.region = region or settings.aws_region
 
         # Check if we're in development mode
-        self.dev_mode = settings.environment == "development"
+        self.dev_mode = settings.use_mock_aws
 
         if self.dev_mode:
-            logger.warning("🚧 DEVELOPMENT MODE: Using mock encryption (base64) instead of KMS")
+            warn_once("🚧 DEVELOPMENT MODE: Using mock encryption (base64) instead of KMS")
             self.kms = None
         else:
             self.kms = boto3.client(
@@ -37,8 +37,9 @@ class KMSService:
                 region_name=self.region,
                 aws_access_key_id=settings.aws_access_key_id,
                 aws_secret_access_key=settings.aws_secret_access_key,
+                endpoint_url=settings.aws_api_endpoint_url,
             )
-            logger.info(f"KMS service initialized with key: {self.key_id[:8]}...")
+            logger.info("KMS service initialized with key: %s...", self.key_id[:8])
 
     def encrypt(self, plaintext: str) -> str:
         """
@@ -76,7 +77,7 @@ class KMSService:
             ciphertext_blob = response["CiphertextBlob"]
             encrypted = base64.b64encode(ciphertext_blob).decode("utf-8")
 
-            logger.debug(f"Successfully encrypted data using KMS key: {self.key_id[:8]}...")
+            logger.debug("Successfully encrypted data using KMS key: %s...", self.key_id[:8])
             return encrypted
 
         except ClientError as e:
@@ -0,0 +1,193 @@
+"""
+In-process publish/subscribe bus for dashboard events.
+
+The service layer publishes account and quota changes here and the
+``/api/dashboard/events`` SSE endpoint fans them out to connected clients.
+Each subscriber owns a bounded queue, so a slow client can never hold more
+than ``settings.event_queue_size`` events in memory.
+
+Note: the bus is per process. With several uvicorn workers, a client only
+receives events published by the worker serving its stream.
+"""
+import asyncio
+import itertools
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize DynamoDB Decimals in event payloads."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass
+class DashboardEvent:
+    """A single event delivered to dashboard subscribers."""
+
+    id: int
+    type: str
+    data: Dict[str, Any]
+    owner: Optional[str] = None
+    timestamp: int = field(default_factory=lambda: int(time.time()))
+
+    def to_sse(self) -> str:
+        """Format the event as a Server-Sent Events message."""
+        payload = json.dumps(
+            {"type": self.type, "timestamp": self.timestamp, "data": self.data},
+            default=_json_default,
+            separators=(",", ":"),
+        )
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """A subscriber's bounded event queue."""
+
+    def __init__(self, user_id: str, user_role: str, maxsize: int):
+        """
+        Initialize subscription.
+
+        Must be created from the event loop that will consume it.
+        """
+        self.user_id = user_id
+        self.user_role = user_role
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = asyncio.get_running_loop()
+        self.dropped = 0
+
+    def accepts(self, event: DashboardEvent) -> bool:
+        """Admins see every event, users only events for their own accounts."""
+        return (
+            self.user_role == "admin"
+            or event.owner is None
+            or event.owner == self.user_id
+        )
+
+    def deliver(self, event: DashboardEvent):
+        """
+        Enqueue an event without blocking.
+
+        When the queue is full the backlog is discarded and replaced by a single
+        ``resync`` event telling the client to refetch ``/api/dashboard/stats``.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            discarded = self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.dropped += discarded + 1
+            self.queue.put_nowait(
+                DashboardEvent(
+                    id=event.id,
+                    type="resync",
+                    data={"reason": "subscriber_lagging", "dropped": discarded + 1},
+                )
+            )
+            logger.warning(
+                "Event subscriber %s lagging, dropped %s events",
+                self.user_id,
+                discarded + 1,
+            )
+
+    async def get(self, timeout: float) -> Optional[DashboardEvent]:
+        """Wait for the next event, returning None on timeout."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """Fan-out bus delivering dashboard events to all subscribers."""
+
+    def __init__(self, queue_size: int = 100):
+        """Initialize event bus."""
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    def subscribe(self, user_id: str, user_role: str) -> Subscription:
+        """Register a new subscriber (call from the event loop)."""
+        subscription = Subscription(user_id, user_role, self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+        logger.debug("Event subscriber added: %s (%s total)", user_id, self.subscriber_count)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscriber."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+        logger.debug(
+            "Event subscriber removed: %s (%s total)",
+            subscription.user_id,
+            self.subscriber_count,
+        )
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        owner: Optional[str] = None,
+    ) -> DashboardEvent:
+        """
+        Publish an event to all matching subscribers.
+
+        Never blocks. Safe to call from the event loop or from worker threads.
+
+        Args:
+            event_type: Event name (e.g., 'account_created')
+            data: JSON-serializable event payload
+            owner: User ID owning the affected account (None = visible to all)
+
+        Returns:
+            The published event
+        """
+        event = DashboardEvent(id=next(self._ids), type=event_type, data=data, owner=owner)
+
+        with self._lock:
+            subscribers = [s for s in self._subscribers if s.accepts(event)]
+
+        if not subscribers:
+            return event
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for subscription in subscribers:
+            if subscription.loop is current_loop:
+                subscription.deliver(event)
+            elif not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+
+        return event
+
+
+# Global event bus instance
+_event_bus = None
+
+
+def get_event_bus() -> EventBus:
+    """Get or create the process-wide event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus(queue_size=settings.event_queue_size)
+    return _event_bus
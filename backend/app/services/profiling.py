@@ -0,0 +1,227 @@
+"""
+On-demand request profiling.
+
+Profiles a single request and stores the result in ``settings.profile_dir``:
+
+- pyinstrument (``pip install ".[profiling]"``): statistical profiler with
+  async support, saved as speedscope JSON (open at https://www.speedscope.app)
+- cProfile fallback: deterministic profiler, saved as pstats (snakeviz,
+  gprof2dot, ``python -m pstats``). It profiles the whole thread, so other
+  requests running concurrently on the event loop show up too.
+
+One request is profiled at a time; flagged requests arriving meanwhile run
+unprofiled. Only the newest ``settings.profile_max_files`` profiles are
+kept. ``ProfileStore`` does blocking file I/O: call it via
+``asyncio.to_thread`` from async code.
+"""
+import asyncio
+import cProfile
+import json
+import os
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import logger
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}T[0-9]{12}-[0-9a-f]{4}$")
+
+# Held while a request is being profiled (one at a time per process)
+profile_lock = asyncio.Lock()
+
+# Profiler name -> stored file suffix
+PROFILE_FORMATS = {
+    "pyinstrument": ".speedscope.json",
+    "cprofile": ".pstats",
+}
+
+
+def resolve_profiler(name: Optional[str] = None) -> str:
+    """
+    Resolve the profiler to use.
+
+    Args:
+        name: 'auto', 'pyinstrument' or 'cprofile' (defaults to settings.profiler)
+
+    Returns:
+        'pyinstrument' or 'cprofile'
+    """
+    name = name or settings.profiler
+    if name == "cprofile":
+        return name
+    try:
+        import pyinstrument  # noqa: F401
+
+        return "pyinstrument"
+    except ImportError:
+        if name == "pyinstrument":
+            logger.warning("pyinstrument not installed, falling back to cProfile")
+        return "cprofile"
+
+
+async def run_profiled(
+    profiler: str, call: Callable[[], Awaitable[None]]
+) -> bytes:
+    """
+    Await a coroutine under a profiler.
+
+    Only one profile may run at a time: both profilers hook the whole thread
+    (on Python 3.12+ cProfile refuses to start while another profiler is
+    active). Callers serialize with ``profile_lock``.
+
+    Args:
+        profiler: 'pyinstrument' or 'cprofile'
+        call: Coroutine function to profile
+
+    Returns:
+        Serialized profile (speedscope JSON or pstats)
+    """
+    if profiler == "pyinstrument":
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        sampler = Profiler(interval=0.0005, async_mode="enabled")
+        sampler.start()
+        try:
+            await call()
+        finally:
+            sampler.stop()
+        rendered = await asyncio.to_thread(sampler.output, SpeedscopeRenderer())
+        return rendered.encode()
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        await call()
+    finally:
+        profile.disable()
+    return await asyncio.to_thread(_pstats_bytes, profile)
+
+
+def _pstats_bytes(profile: cProfile.Profile) -> bytes:
+    """Serialize cProfile stats (blocking file I/O)."""
+    # pstats is written via marshal; dump to a temp file to get the bytes
+    tmp_path = os.path.join(settings.profile_dir, f".tmp-{os.getpid()}-{secrets.token_hex(4)}")
+    os.makedirs(settings.profile_dir, exist_ok=True)
+    try:
+        profile.dump_stats(tmp_path)
+        with open(tmp_path, "rb") as f:
+            return f.read()
+    finally:
+        os.unlink(tmp_path)
+
+
+class ProfileStore:
+    """Directory of stored profiles with JSON metadata sidecars."""
+
+    def __init__(self, directory: Optional[str] = None, max_files: Optional[int] = None):
+        """
+        Initialize profile store.
+
+        Args:
+            directory: Profile directory (defaults to settings.profile_dir)
+            max_files: Profiles to keep (defaults to settings.profile_max_files)
+        """
+        self.directory = directory or settings.profile_dir
+        self.max_files = max_files or settings.profile_max_files
+
+    @staticmethod
+    def new_id() -> str:
+        """Generate a sortable profile ID."""
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        return f"{stamp}-{secrets.token_hex(2)}"
+
+    def _meta_path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def save(self, profile_id: str, data: bytes, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a profile and prune old ones.
+
+        Args:
+            profile_id: ID from new_id()
+            data: Serialized profile
+            meta: Request metadata (method, path, status, ...)
+
+        Returns:
+            Stored metadata
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        filename = f"{profile_id}{PROFILE_FORMATS[meta['profiler']]}"
+        with open(os.path.join(self.directory, filename), "wb") as f:
+            f.write(data)
+
+        meta = {
+            **meta,
+            "id": profile_id,
+            "filename": filename,
+            "size_bytes": len(data),
+            "created_at": int(time.time()),
+        }
+        with open(self._meta_path(profile_id), "w") as f:
+            json.dump(meta, f)
+
+        self._prune()
+        return meta
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """List stored profiles, newest first."""
+        if not os.path.isdir(self.directory):
+            return []
+
+        ids = sorted(
+            (name[:-5] for name in os.listdir(self.directory)
+             if name.endswith(".json") and PROFILE_ID_PATTERN.match(name[:-5])),
+            reverse=True,
+        )
+        profiles = []
+        for profile_id in ids[:limit]:
+            try:
+                with open(self._meta_path(profile_id)) as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def get(self, profile_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Find a stored profile.
+
+        Returns:
+            Tuple of (file path, metadata), or None if not found
+        """
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        try:
+            with open(self._meta_path(profile_id)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        path = os.path.join(self.directory, meta["filename"])
+        return (path, meta) if os.path.exists(path) else None
+
+    def _prune(self):
+        for meta in self.list(limit=10_000)[self.max_files:]:
+            for path in (
+                os.path.join(self.directory, meta["filename"]),
+                self._meta_path(meta["id"]),
+            ):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+
+# Global store instance
+_profile_store = None
+
+
+def get_profile_store() -> ProfileStore:
+    """Get or create the profile store."""
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore()
+    return _profile_store
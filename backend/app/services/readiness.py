@@ -0,0 +1,271 @@
+"""
+Dependency readiness probes.
+
+A background task checks every dependency each ``settings.readiness_interval``
+seconds and caches the results; ``/ready`` only reads the cache, so load
+balancer health checks never add load or latency to the dependencies.
+
+- dynamodb: DescribeTable on every table (must be ACTIVE); fails if the
+  DynamoDB client could not be initialized at startup; skipped with
+  STORAGE_BACKEND=memory
+- kms: DescribeKey on ``settings.kms_key_id`` (must be enabled; the task role
+  needs kms:DescribeKey besides encrypt/decrypt); skipped when
+  encryption is mocked (development without AWS_API_ENDPOINT_URL)
+- jwks: signing keys cached by the JWKS provider (no fetch; the provider
+  refreshes itself); skipped with development auth
+"""
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from app.core.config import settings
+from app.core.logging import logger
+
+# Results older than this many intervals mean the probe loop is stuck
+_STALE_INTERVALS = 3
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one dependency probe."""
+
+    status: str  # "ok", "error" or "skipped"
+    latency_ms: float = 0.0
+    checked_at: float = field(default_factory=time.time)
+    error: Optional[str] = None
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the dependency is usable."""
+        return self.status != "error"
+
+
+class ReadinessChecker:
+    """Periodically probe dependencies and cache the results."""
+
+    def __init__(
+        self,
+        dynamodb_client=None,
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize readiness checker.
+
+        Args:
+            dynamodb_client: DynamoDBClient instance, or None if it failed to
+                initialize
+            interval: Seconds between probe rounds (defaults to settings.readiness_interval)
+            timeout: Per-probe timeout in seconds (defaults to settings.readiness_timeout)
+        """
+        self.dynamodb_client = dynamodb_client
+        self.interval = interval or settings.readiness_interval
+        self.timeout = timeout or settings.readiness_timeout
+        self.results: Dict[str, ProbeResult] = {}
+        self._completed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Short timeouts and no retries: a slow dependency is a failed probe
+        self._config = Config(
+            connect_timeout=self.timeout,
+            read_timeout=self.timeout,
+            retries={"max_attempts": 1},
+        )
+        self._dynamodb = None
+        self._kms = None
+
+    async def start(self):
+        """Run the first probe round and start the background loop."""
+        await self.check()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="readiness-probes")
+            logger.info("Readiness probes started (interval=%ss)", self.interval)
+
+    async def stop(self):
+        """Stop the background loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether every dependency passed its last, fresh probe."""
+        if self._completed_at is None:
+            return False
+        if time.monotonic() - self._completed_at > self.interval * _STALE_INTERVALS:
+            return False
+        return all(result.ok for result in self.results.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cached readiness report."""
+        if self._completed_at is None:
+            status = "starting"
+        else:
+            status = "ready" if self.ready else "not_ready"
+        return {
+            "status": status,
+            "checks": {name: asdict(result) for name, result in self.results.items()},
+        }
+
+    async def check(self):
+        """Run all probes concurrently and replace the cached results."""
+        probes = {
+            "dynamodb": self._probe_dynamodb,
+            "kms": self._probe_kms,
+            "jwks": self._probe_jwks,
+        }
+        results = await asyncio.gather(
+            *(self._timed(probe) for probe in probes.values())
+        )
+        for name, result in zip(probes, results):
+            previous = self.results.get(name)
+            if result.status == "error" and (previous is None or previous.ok):
+                logger.warning("Readiness probe %s failed: %s", name, result.error)
+            elif result.ok and previous is not None and not previous.ok:
+                logger.info("Readiness probe %s recovered", name)
+        self.results = dict(zip(probes, results))
+        self._completed_at = time.monotonic()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error("Readiness probe round failed: %s", e)
+
+    async def _timed(self, probe: Callable[[], Any]) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(probe(), self.timeout)
+        except asyncio.TimeoutError:
+            result = ProbeResult(status="error", error=f"Timed out after {self.timeout}s")
+        except Exception as e:
+            result = ProbeResult(status="error", error=f"{type(e).__name__}: {e}")
+        result.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    # ===================================================================
+    # Probes
+    # ===================================================================
+
+    async def _probe_dynamodb(self) -> ProbeResult:
+        if settings.storage_backend == "memory":
+            return ProbeResult(status="skipped", detail={"reason": "in-memory storage"})
+        if self.dynamodb_client is None:
+            return ProbeResult(status="error", error="DynamoDB client not initialized")
+
+        if self._dynamodb is None:
+            self._dynamodb = await asyncio.to_thread(
+                boto3.client,
+                "dynamodb",
+                config=self._config,
+                **self.dynamodb_client.connection_kwargs,
+            )
+
+        tables = [
+            settings.dynamodb_accounts_table,
+            settings.dynamodb_users_table,
+            settings.dynamodb_audit_logs_table,
+            settings.quota_config_table_name,
+        ]
+        statuses = await asyncio.gather(
+            *(asyncio.to_thread(self._table_status, table) for table in tables)
+        )
+        inactive: List[str] = [
+            f"{table}={status}" for table, status in zip(tables, statuses) if status != "ACTIVE"
+        ]
+        return ProbeResult(
+            status="error" if inactive else "ok",
+            error=f"Tables not active: {', '.join(inactive)}" if inactive else None,
+            detail={"tables": dict(zip(tables, statuses))},
+        )
+
+    def _table_status(self, table: str) -> str:
+        try:
+            response = self._dynamodb.describe_table(TableName=table)
+        except ClientError as e:
+            return e.response.get("Error", {}).get("Code", "Unknown")
+        return response["Table"]["TableStatus"]
+
+    async def _probe_kms(self) -> ProbeResult:
+        if settings.use_mock_aws:
+            return ProbeResult(status="skipped", detail={"reason": "mock encryption"})
+        if not settings.kms_key_id:
+            return ProbeResult(status="error", error="KMS_KEY_ID not configured")
+
+        if self._kms is None:
+            # Client creation loads service models; keep it off the loop
+            self._kms = await asyncio.to_thread(
+                boto3.client,
+                "kms",
+                region_name=settings.aws_region,
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                endpoint_url=settings.aws_api_endpoint_url,
+                config=self._config,
+            )
+
+        response = await asyncio.to_thread(self._kms.describe_key, KeyId=settings.kms_key_id)
+        metadata = response["KeyMetadata"]
+        enabled = metadata.get("Enabled", False)
+        return ProbeResult(
+            status="ok" if enabled else "error",
+            error=None if enabled else f"KMS key is {metadata.get('KeyState')}",
+            detail={"key_state": metadata.get("KeyState")},
+        )
+
+    async def _probe_jwks(self) -> ProbeResult:
+        if settings.use_dev_auth:
+            return ProbeResult(status="skipped", detail={"reason": "development auth"})
+
+        from app.middleware.cognito_auth import get_validator
+
+        provider = get_validator().jwks_provider
+        age = provider.age
+        detail = {"age_seconds": round(age, 1) if age is not None else None}
+        if not provider.available:
+            return ProbeResult(status="error", error="No JWKS signing keys cached", detail=detail)
+        return ProbeResult(status="ok", detail=detail)
+
+
+# Global checker instance
+_readiness_checker = None
+
+
+def get_readiness_checker() -> Optional[ReadinessChecker]:
+    """Get the readiness checker (None until the application has started)."""
+    return _readiness_checker
+
+
+async def start_readiness_checker(dynamodb_client=None) -> ReadinessChecker:
+    """
+    Create the readiness checker and start probing.
+
+    Args:
+        dynamodb_client: DynamoDBClient instance, or None if it failed to initialize
+    """
+    global _readiness_checker
+    if _readiness_checker is None:
+        _readiness_checker = ReadinessChecker(dynamodb_client)
+        await _readiness_checker.start()
+    return _readiness_checker
+
+
+async def stop_readiness_checker():
+    """Stop probing."""
+    global _readiness_checker
+    if _readiness_checker is not None:
+        await _readiness_checker.stop()
+        _readiness_checker = None
@@ -0,0 +1 @@
+"""Benchmarks and conformance harnesses for the Account Platform backend."""
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Account list memory and response serialization benchmark.
+
+Memory: decodes ``--accounts`` wire-format account items (fleet-shaped) into
+per-account dicts (``deserialize_item``, as list_accounts returned before)
+and into ``AccountRecord`` slots (``deserialize_account``), and reports the
+traced allocation per 100k accounts.
+
+Serialization throughput, for GET /api/accounts and GET /api/dashboard/stats:
+
+- double: the previous path, building response models from the dicts,
+  then FastAPI's response_model step (dump to dicts, validate again,
+  dump in JSON mode, ``json.dumps``)
+- single: the current path, one validation (from record attributes for the
+  account list) and a direct ``dump_json``
+
+Both paths must produce byte-identical JSON.
+
+Usage:
+    python -m benchmarks.account_records
+    python -m benchmarks.account_records --accounts 100000 --repeat 5 --json results/records.json
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from boto3.dynamodb.types import TypeSerializer
+from pydantic import TypeAdapter
+
+# The app reads its settings at import time
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.db.codec import deserialize_account, deserialize_item  # noqa: E402
+from app.db.repositories import CREDENTIAL_FIELDS, DEFAULT_QUOTA_MODELS  # noqa: E402
+from app.schemas.account import AccountResponse  # noqa: E402
+from app.schemas.dashboard import (  # noqa: E402
+    DashboardModelQuota,
+    DashboardStats,
+    QuotaSummary,
+)
+from benchmarks.fleet import account_item  # noqa: E402
+
+NOW = 1760000000
+PER = 100000
+
+
+def wire_items(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Account items in the low-level client's wire format."""
+    serializer = TypeSerializer()
+    return [
+        {key: serializer.serialize(value) for key, value in account_item(seed, i, DEFAULT_QUOTA_MODELS, NOW).items()}
+        for i in range(count)
+    ]
+
+
+def traced_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated after ``build()`` (its result kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fastapi_response_step(model_type: Any, content: Any) -> bytes:
+    """What FastAPI does with a returned model/list and a response_model."""
+    adapter = TypeAdapter(model_type)
+    if isinstance(content, list):
+        content = [item.model_dump() for item in content]
+    else:
+        content = content.model_dump()
+    value = adapter.validate_python(content)
+    return json.dumps(
+        adapter.dump_python(value, mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def dashboard_data(accounts: List[Any]) -> Dict[str, Any]:
+    """Dashboard stats input (as the endpoint builds it) for the default dashboard models."""
+    models = [m for m in DEFAULT_QUOTA_MODELS if m.get("show_in_dashboard")][:2]
+    summaries, totals = [], {m["model_id"]: 0 for m in models}
+    for account in accounts:
+        quota = account.get("bedrock_quota", {})
+        summary = {"account_id": account["account_id"], "account_name": account["account_name"]}
+        for model in models:
+            field = model["model_id"].replace("-", "_").replace(".", "_") + "_tpm"
+            summary[field] = quota.get(field, 0)
+            totals[model["model_id"]] += summary[field]
+        summaries.append(summary)
+    return {
+        "total_accounts": len(accounts),
+        "active_accounts": sum(1 for a in accounts if a.get("status") == "active"),
+        "model_quotas": [{"model_id": k, "display_name": k, "total_tpm": v} for k, v in totals.items()],
+        "accounts_with_quota": summaries,
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    count = args.accounts
+    items = wire_items(count)
+
+    dict_bytes = traced_bytes(lambda: [deserialize_item(i, skip=CREDENTIAL_FIELDS) for i in items])
+    record_bytes = traced_bytes(lambda: [deserialize_account(i) for i in items])
+
+    dicts = [deserialize_item(i, skip=CREDENTIAL_FIELDS) for i in items]
+    records = [deserialize_account(i) for i in items]
+    account_list = TypeAdapter(List[AccountResponse])
+
+    def accounts_double() -> bytes:
+        return fastapi_response_step(List[AccountResponse], [AccountResponse(**d) for d in dicts])
+
+    def accounts_single() -> bytes:
+        return account_list.dump_json(account_list.validate_python(records, from_attributes=True))
+
+    def dashboard_double() -> bytes:
+        data = dashboard_data(dicts)
+        stats = DashboardStats(
+            total_accounts=data["total_accounts"],
+            active_accounts=data["active_accounts"],
+            model_quotas=[DashboardModelQuota(**m) for m in data["model_quotas"]],
+            accounts_with_quota=[QuotaSummary(**s) for s in data["accounts_with_quota"]],
+        )
+        return fastapi_response_step(DashboardStats, stats)
+
+    def dashboard_single() -> bytes:
+        return DashboardStats.model_validate(dashboard_data(records)).model_dump_json().encode()
+
+    assert accounts_double() == accounts_single(), "account list JSON differs"
+    assert dashboard_double() == dashboard_single(), "dashboard JSON differs"
+
+    results: Dict[str, Any] = {
+        "accounts": count,
+        "memory_mb_per_100k": {
+            "dict": round(dict_bytes / count * PER / 2**20, 1),
+            "record": round(record_bytes / count * PER / 2**20, 1),
+        },
+    }
+    print(f"{count} accounts, {len(DEFAULT_QUOTA_MODELS)} quota models\n")
+    print("Decoded list memory per 100k accounts:")
+    for name in ("dict", "record"):
+        print(f"  {name:<7} {results['memory_mb_per_100k'][name]:>7.1f} MB")
+
+    print(f"\n{'response':<18} {'double ms':>10} {'single ms':>10} {'accounts/s (single)':>20} {'speedup':>8}")
+    for name, double, single in (
+        ("accounts list", accounts_double, accounts_single),
+        ("dashboard stats", dashboard_double, dashboard_single),
+    ):
+        double_s, single_s = best_of(double, args.repeat), best_of(single, args.repeat)
+        results[name.replace(" ", "_")] = {
+            "double_ms": round(double_s * 1000, 1),
+            "single_ms": round(single_s * 1000, 1),
+            "accounts_per_s": round(count / single_s),
+        }
+        print(
+            f"{name:<18} {double_s * 1000:>10.1f} {single_s * 1000:>10.1f} "
+            f"{count / single_s:>20,.0f} {double_s / single_s:>7.2f}x"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+End-to-end API benchmark against a local DynamoDB stand-in.
+
+Runs the FastAPI app in-process (httpx ASGITransport, real middleware and
+lifespan, development auth and mocked STS/KMS/Service Quotas) on top of
+moto (default), DynamoDB Local (``--endpoint-url``) or the in-memory
+storage backend (``--storage memory``, no boto3 at all, which isolates the
+app's own Python overhead). For every fleet size the accounts table is
+seeded with synthetic accounts (``benchmarks.fleet``), then each endpoint
+is driven with ``--concurrency`` workers:
+
+- list: GET /api/accounts
+- detail: GET /api/accounts/{id}
+- dashboard: GET /api/dashboard/stats
+- create: POST /api/accounts
+- refresh: POST /api/accounts/{id}/quota/refresh
+
+With ``--fake-aws`` the STS/KMS/Service Quotas/Account/Bedrock mocks are
+replaced by the latency-injecting stand-in from ``benchmarks.fake_aws``, so
+create and refresh pay realistic AWS round trips (``--fake-aws-profile``
+tunes latencies and fault rates; its counters are printed per size).
+
+Each endpoint stops after ``--requests`` requests or ``--max-seconds``,
+whichever comes first (scans of 100k accounts in moto are slow). Results
+include p50/p95/p99, throughput and mean response size, and can be written
+as JSON to diff between commits.
+
+Usage:
+    python -m benchmarks.api_endpoints
+    python -m benchmarks.api_endpoints --sizes 100,10000 --endpoints list,detail
+    python -m benchmarks.api_endpoints --endpoint-url http://localhost:8001 --sizes 100000
+    python -m benchmarks.api_endpoints --storage memory --sizes 100000
+    python -m benchmarks.api_endpoints --fake-aws --endpoints create,refresh
+    python -m benchmarks.api_endpoints --json results/api_endpoints.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List
+
+# The app reads its settings at import time
+os.environ.setdefault("ENVIRONMENT", "development")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+from benchmarks.fleet import account_id, account_item, generate_fleet  # noqa: E402
+from benchmarks.stats import summarize  # noqa: E402
+
+ENDPOINTS = ["list", "detail", "dashboard", "create", "refresh"]
+
+
+def git_revision() -> str:
+    """Short commit hash of the working tree, or 'unknown'."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def seed_accounts(dynamodb_client, size: int, models: List[Dict[str, Any]], seed: int = 7) -> List[str]:
+    """
+    Write ``size`` deterministic fleet accounts (same seed, same items).
+
+    Skips writing when the table already holds at least ``size`` items
+    (a DynamoDB Local table seeded by an earlier run).
+
+    Args:
+        dynamodb_client: DynamoDBClient, or None for the in-memory backend
+
+    Returns:
+        Seeded account IDs
+    """
+    if dynamodb_client is None:
+        from app.db.memory import get_memory_store
+
+        table = get_memory_store().accounts
+        now = int(time.time())
+        for index in range(table.item_count, size):
+            table.put(account_item(seed, index, models, now))
+        return [account_id(index) for index in range(size)]
+
+    table = dynamodb_client.dynamodb.Table(dynamodb_client.accounts_table_name)
+    if table.item_count >= size:
+        return [account_id(index) for index in range(size)]
+
+    result = generate_fleet(
+        dynamodb_client.connection_kwargs,
+        models,
+        size,
+        seed=seed,
+        accounts_table=dynamodb_client.accounts_table_name,
+    )
+    return result["account_ids"]
+
+
+# ===================================================================
+# Driving the app
+# ===================================================================
+
+
+async def drive(
+    client,
+    make_request,
+    requests: int,
+    concurrency: int,
+    max_seconds: float,
+) -> Dict[str, Any]:
+    """
+    Send requests from ``concurrency`` workers and summarize them.
+
+    Args:
+        client: httpx.AsyncClient bound to the app
+        make_request: Callable(client, n) returning an awaitable response
+        requests: Maximum number of requests
+        concurrency: Concurrent workers
+        max_seconds: Stop issuing new requests after this long
+    """
+    latencies: List[float] = []
+    sizes: List[int] = []
+    errors = 0
+    issued = 0
+    deadline = time.perf_counter() + max_seconds
+
+    async def worker():
+        nonlocal errors, issued
+        while issued < requests and time.perf_counter() < deadline:
+            n = issued
+            issued += 1
+            start = time.perf_counter()
+            response = await make_request(client, n)
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(response.content))
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result = summarize(latencies, time.perf_counter() - start, errors)
+    result["mean_bytes"] = int(sum(sizes) / len(sizes)) if sizes else 0
+    return result
+
+
+def request_factories(account_ids: List[str], size: int) -> Dict[str, Any]:
+    """Request builders per endpoint."""
+    rng = random.Random(size)
+
+    def detail(client, n):
+        return client.get(f"/api/accounts/{rng.choice(account_ids)}")
+
+    def create(client, n):
+        return client.post(
+            "/api/accounts",
+            json={
+                "access_key": f"AKIB{size:08d}{n:08d}",
+                "secret_key": "b" * 40,
+                "account_name": f"Created {n}",
+            },
+        )
+
+    def refresh(client, n):
+        return client.post(f"/api/accounts/{rng.choice(account_ids)}/quota/refresh")
+
+    return {
+        "list": lambda client, n: client.get("/api/accounts"),
+        "detail": detail,
+        "dashboard": lambda client, n: client.get("/api/dashboard/stats"),
+        "create": create,
+        "refresh": refresh,
+    }
+
+
+async def run_size(size: int, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Seed one fleet size and benchmark every selected endpoint."""
+    import httpx
+
+    from app.core.config import settings
+    from app.db.dynamodb import DynamoDBClient
+    from app.db.repositories import get_quota_config_repository
+    from app.main import app
+
+    results = []
+    async with app.router.lifespan_context(app):
+        manager = get_quota_config_repository()
+        config = manager.get_config() or manager.initialize_default_config()
+        dynamodb_client = DynamoDBClient() if settings.storage_backend == "dynamodb" else None
+
+        start = time.perf_counter()
+        account_ids = await asyncio.to_thread(
+            seed_accounts, dynamodb_client, size, config["models"]
+        )
+        print(f"\n{size} accounts seeded in {time.perf_counter() - start:.1f}s")
+
+        transport = httpx.ASGITransport(app=app)
+        factories = request_factories(account_ids, size)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=None
+        ) as client:
+            for endpoint in args.endpoints:
+                # Warm up caches, clients and code paths
+                for n in range(args.warmup):
+                    await factories[endpoint](client, -1 - n)
+
+                result = await drive(
+                    client,
+                    factories[endpoint],
+                    args.requests,
+                    args.concurrency,
+                    args.max_seconds,
+                )
+                result.update({"size": size, "endpoint": endpoint})
+                results.append(result)
+                print(
+                    f"  {endpoint:<10} n={result['requests']:<5} "
+                    f"p50={result['p50_ms']:>8.1f}ms p95={result['p95_ms']:>8.1f}ms "
+                    f"p99={result['p99_ms']:>8.1f}ms {result['rps']:>7.1f} req/s "
+                    f"errors={result['errors']} bytes={result['mean_bytes']}"
+                )
+    return results
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="100,10000,100000")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="Time budget per endpoint")
+    parser.add_argument("--storage", choices=["dynamodb", "memory"], default="dynamodb")
+    parser.add_argument("--endpoint-url", help="DynamoDB Local URL (default: in-process moto)")
+    parser.add_argument("--fake-aws", action="store_true", help="Use the fake AWS server")
+    parser.add_argument("--fake-aws-profile", help="JSON latency/fault profile for --fake-aws")
+    parser.add_argument("--fake-aws-port", type=int, default=4599)
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    args.endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    from app.core.config import settings
+
+    settings.storage_backend = args.storage
+    if args.endpoint_url:
+        os.environ["DYNAMODB_ENDPOINT_URL"] = args.endpoint_url
+        settings.dynamodb_endpoint_url = args.endpoint_url
+
+    fake_server = None
+    if args.fake_aws:
+        from benchmarks.fake_aws import FakeAWS, FakeAWSServer
+
+        profile = {}
+        if args.fake_aws_profile:
+            with open(args.fake_aws_profile) as f:
+                profile = json.load(f)
+        fake_server = FakeAWSServer(FakeAWS(profile), port=args.fake_aws_port).start()
+        settings.aws_api_endpoint_url = fake_server.endpoint_url
+        settings.kms_key_id = settings.kms_key_id or "fake-aws-benchmark-key"
+
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        if args.storage == "memory":
+            from app.db.memory import get_memory_store
+
+            get_memory_store().clear()
+            context = nullcontext()
+        elif args.endpoint_url:
+            # One set of tables per size, so runs can reuse earlier seeding
+            base = os.environ.get("DYNAMODB_ACCOUNTS_TABLE", "account-platform-aws-accounts")
+            settings.dynamodb_accounts_table = f"{base}-bench-{size}"
+            context = nullcontext()
+        else:
+            from moto import mock_aws
+
+            context = mock_aws()
+
+        with context:
+            results.extend(asyncio.run(run_size(size, args)))
+
+        if fake_server is not None:
+            for operation, counters in fake_server.fake.snapshot().items():
+                print(f"  fake {operation:<32} {counters}")
+            fake_server.fake.stats.clear()
+
+    if fake_server is not None:
+        fake_server.stop()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                {
+                    "revision": git_revision(),
+                    "timestamp": int(time.time()),
+                    "python": platform.python_version(),
+                    "storage": args.storage,
+                    "dynamodb": args.endpoint_url or "moto",
+                    "aws": "fake_aws" if args.fake_aws else "mock",
+                    "concurrency": args.concurrency,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nResults written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
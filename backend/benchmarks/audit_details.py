@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Audit log item size and write-unit benchmark for detail encodings.
+
+Builds refresh_quota audit items for a growing number of configured models
+and compares four encodings of ``details``:
+
+- full: the whole quota dict (previous behaviour)
+- full+z: the whole quota dict, compressed above the threshold
+- diff: only changed quota fields (old/new)
+- diff+z: diff, compressed above the threshold (current behaviour)
+
+Item sizes follow DynamoDB's item size rules. Each write is charged once
+for the table and once per ALL-projected GSI (two on the audit table).
+
+Usage:
+    python -m benchmarks.audit_details
+    python -m benchmarks.audit_details --models 5,20,50 --changed 2 --threshold 512
+    python -m benchmarks.audit_details --json results/audit_details.json
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from boto3.dynamodb.types import Binary
+
+from app.db.audit_codec import decode_item, diff_values, encode_details
+
+# Table + user_id-timestamp-index + resource_id-timestamp-index
+ITEM_COPIES = 3
+
+
+def attribute_size(value: Any) -> int:
+    """Approximate DynamoDB storage size of an attribute value."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        digits = len(str(abs(Decimal(str(value)))).replace(".", "").strip("0")) or 1
+        return 1 + math.ceil(digits / 2)
+    if isinstance(value, Binary):
+        return len(value.value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return 3 + sum(
+            len(k.encode("utf-8")) + attribute_size(v) + 1 for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return 3 + sum(attribute_size(v) + 1 for v in value)
+    raise TypeError(f"Unsupported type: {type(value).__name__}")
+
+
+def item_size(item: Dict[str, Any]) -> int:
+    """Approximate DynamoDB item size (attribute names + values)."""
+    return sum(len(k.encode("utf-8")) + attribute_size(v) for k, v in item.items())
+
+
+def make_quota(models: int, rng: random.Random) -> Dict[str, Any]:
+    """Quota dict shaped like AWSService.get_bedrock_quota_dynamic output."""
+    quota: Dict[str, Any] = {"last_updated": int(time.time())}
+    for i in range(models):
+        field = f"claude_model_{i:02d}_v1_tpm"
+        quota[field] = rng.choice([100000, 200000, 400000, 600000, 800000])
+        if i % 2 == 0:
+            quota[field.replace("_tpm", "_1m_tpm")] = quota[field] // 5
+    return quota
+
+
+def base_item() -> Dict[str, Any]:
+    """Audit item without details (as written by AuditLogManager.log_action)."""
+    now = int(time.time())
+    return {
+        "log_id": "6f1c0d9e-4b7a-4c1e-9a55-3f0d2c8b7e41",
+        "timestamp": now,
+        "user_id": "8a7b6c5d-1234-4e56-9abc-def012345678",
+        "action": "refresh_quota",
+        "resource_type": "account",
+        "resource_id": "123456789012",
+        "ip_address": "203.0.113.10",
+        "user_agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+        "status": "success",
+        "ttl": now + 90 * 24 * 3600,
+    }
+
+
+def measure(details: Dict[str, Any], threshold: int) -> Dict[str, Any]:
+    """Size and write units for one encoding."""
+    item = {**base_item(), **encode_details(details, threshold)}
+    restored = decode_item(dict(item))
+    assert json.loads(json.dumps(restored["details"], default=float)) == json.loads(
+        json.dumps(details, default=float)
+    ), "round trip mismatch"
+
+    size = item_size(item)
+    return {
+        "bytes": size,
+        "compressed": "details_z" in item,
+        "wcu": math.ceil(size / 1024) * ITEM_COPIES,
+    }
+
+
+def run(models: int, changed: int, threshold: int, seed: int = 7) -> Dict[str, Any]:
+    """Compare encodings for one model count."""
+    rng = random.Random(seed + models)
+    old = make_quota(models, rng)
+    new = dict(old, last_updated=old["last_updated"] + 300)
+    for field in rng.sample([k for k in old if k != "last_updated"], min(changed, models)):
+        new[field] = old[field] * 2
+
+    full = {"quota": new, "region": "us-east-1"}
+    diff = {"quota": diff_values(old, new), "region": "us-east-1"}
+
+    return {
+        "models": models,
+        "fields": len(new) - 1,
+        "full": measure(full, 0),
+        "full+z": measure(full, threshold),
+        "diff": measure(diff, 0),
+        "diff+z": measure(diff, threshold),
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", default="3,10,25,50,100")
+    parser.add_argument("--changed", type=int, default=1, help="Quota fields changed per refresh")
+    parser.add_argument("--threshold", type=int, default=512)
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = [
+        run(int(m), args.changed, args.threshold) for m in args.models.split(",") if m.strip()
+    ]
+
+    variants = ["full", "full+z", "diff", "diff+z"]
+    print(f"refresh_quota audit item, {args.changed} field(s) changed, threshold {args.threshold}B")
+    print(f"WCU counts the table plus {ITEM_COPIES - 1} ALL-projected GSIs\n")
+    print(f"{'models':>6} {'fields':>6} " + " ".join(f"{v + ' B/WCU':>14}" for v in variants))
+    for r in results:
+        cells = " ".join(f"{r[v]['bytes']:>8}/{r[v]['wcu']:<5}" for v in variants)
+        print(f"{r['models']:>6} {r['fields']:>6} {cells}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"changed": args.changed, "threshold": args.threshold, "results": results}, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark: bytes on the wire and CPU cost.
+
+Builds the app's largest payloads from ``--accounts`` fleet-shaped accounts:
+
+- accounts: GET /api/accounts (one JSON body)
+- dashboard: GET /api/dashboard/stats (one JSON body)
+- export-ndjson / export-csv: GET /api/accounts/export, streamed one chunk
+  per ``--page-size`` accounts, each chunk flushed as the middleware does
+
+and compresses each with every available encoding and level (gzip always,
+br/zstd with the compression extra installed), reporting wire bytes, ratio
+and compression CPU milliseconds per response (best of ``--repeat``, process
+CPU time). Every result is decompressed and checked against the original.
+
+Loop stall: serves the accounts body through CompressionMiddleware with the
+configured encoding while a ticker measures the longest event loop stall,
+with compression inline and offloaded to a thread.
+
+Usage:
+    python -m benchmarks.compression
+    python -m benchmarks.compression --accounts 20000 --encodings gzip,zstd --json results/compression.json
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+# The app reads its settings at import time
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.core.config import settings  # noqa: E402
+from app.db.memory import InMemoryAccountRepository, MemoryStore  # noqa: E402
+from app.db.repositories import DEFAULT_QUOTA_MODELS  # noqa: E402
+from app.middleware import compression  # noqa: E402
+from app.schemas.account import AccountResponse  # noqa: E402
+from app.schemas.dashboard import DashboardStats  # noqa: E402
+from app.services.account_export import AccountInventoryExporter  # noqa: E402
+from benchmarks.account_records import dashboard_data  # noqa: E402
+from benchmarks.fleet import account_item  # noqa: E402
+
+NOW = 1760000000
+
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 6], "zstd": [1, 3, 9]}
+
+
+def decompress(encoding: str, data: bytes) -> bytes:
+    """Decode a complete compressed body."""
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br":
+        return compression.brotli.decompress(data)
+    # Streamed frames carry no content size, so use the streaming reader
+    return compression.zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def build_payloads(count: int, page_size: int) -> Dict[str, List[bytes]]:
+    """Payloads by name, each as its list of body chunks."""
+    repository = InMemoryAccountRepository(MemoryStore())
+    for i in range(count):
+        repository._put_account(account_item(7, i, DEFAULT_QUOTA_MODELS, NOW))
+    records = repository.list_accounts("bench", "admin")
+
+    account_list = TypeAdapter(List[AccountResponse])
+    exporter = AccountInventoryExporter(repository, DEFAULT_QUOTA_MODELS, page_size)
+    return {
+        "accounts": [account_list.dump_json(account_list.validate_python(records, from_attributes=True))],
+        "dashboard": [DashboardStats.model_validate(dashboard_data(records)).model_dump_json().encode()],
+        "export-ndjson": list(exporter.iter_ndjson("bench", "admin")),
+        "export-csv": list(exporter.iter_csv("bench", "admin")),
+    }
+
+
+def compress_response(make: Callable[[], compression.Compressor], chunks: List[bytes]) -> bytes:
+    """Compress like the middleware: one-shot for one body, flushed chunks otherwise."""
+    compressor = make()
+    if len(chunks) == 1:
+        return compressor.compress_all(chunks[0])
+    return b"".join(compressor.compress(chunk) for chunk in chunks) + compressor.finish()
+
+
+def best_cpu(func: Callable[[], Any], repeat: int) -> float:
+    """Best process CPU time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+async def max_loop_stall(body: bytes, encoding: str, offload_size: int, requests: int) -> float:
+    """Longest event loop stall (seconds) while serving ``body`` compressed."""
+
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    middleware = compression.CompressionMiddleware(app, encodings=[encoding], offload_size=offload_size)
+    scope = {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]}
+    stall, running = 0.0, True
+
+    async def ticker():
+        nonlocal stall
+        while running:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - before - 0.001)
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    for _ in range(requests):
+        await middleware(scope, receive, send)
+    running = False
+    await task
+    return stall
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=settings.account_export_page_size)
+    parser.add_argument("--encodings", default="gzip,br,zstd", help="Comma-separated, unavailable ones are skipped")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    available = compression.available_encodings()
+    encodings = [e for e in args.encodings.split(",") if e in available]
+    skipped = [e for e in args.encodings.split(",") if e not in available]
+    payloads = build_payloads(args.accounts, args.page_size)
+    factories = {
+        "gzip": compression.GzipCompressor,
+        "br": compression.BrotliCompressor,
+        "zstd": compression.ZstdCompressor,
+    }
+
+    print(f"{args.accounts} accounts, export page size {args.page_size}")
+    if skipped:
+        print(f"skipped (not installed): {', '.join(skipped)}")
+    print(f"\n{'payload':<14} {'encoding':<8} {'chunks':>6} {'bytes':>10} {'wire':>9} {'ratio':>6} {'cpu ms':>8} {'MB/s':>7}")
+
+    results: Dict[str, Any] = {"accounts": args.accounts, "page_size": args.page_size, "payloads": {}}
+    for name, chunks in payloads.items():
+        original = b"".join(chunks)
+        rows = results["payloads"][name] = {"bytes": len(original), "chunks": len(chunks), "encodings": {}}
+        print(f"{name:<14} {'identity':<8} {len(chunks):>6} {len(original):>10} {len(original):>9} {1:>6.1f}")
+        for encoding in encodings:
+            for level in LEVELS[encoding]:
+                make = partial(factories[encoding], level)
+                wire = compress_response(make, chunks)
+                assert decompress(encoding, wire) == original, f"{name} {encoding}-{level} round trip differs"
+                cpu = best_cpu(partial(compress_response, make, chunks), args.repeat)
+                label = f"{encoding}-{level}"
+                rows["encodings"][label] = {
+                    "wire_bytes": len(wire),
+                    "ratio": round(len(original) / len(wire), 2),
+                    "cpu_ms": round(cpu * 1000, 2),
+                }
+                print(
+                    f"{'':<14} {label:<8} {len(chunks):>6} {len(original):>10} {len(wire):>9} "
+                    f"{len(original) / len(wire):>6.1f} {cpu * 1000:>8.2f} {len(original) / cpu / 2**20 if cpu else 0:>7.0f}"
+                )
+
+    body = payloads["accounts"][0]
+    encoding = next((e for e in settings.compression_encodings.split(",") if e in available), "gzip")
+    inline = asyncio.run(max_loop_stall(body, encoding, len(body) + 1, 10))
+    offloaded = asyncio.run(max_loop_stall(body, encoding, settings.compression_offload_size, 10))
+    results["loop_stall_ms"] = {
+        "encoding": encoding,
+        "inline": round(inline * 1000, 2),
+        "offloaded": round(offloaded * 1000, 2),
+    }
+    print(f"\nLongest event loop stall, accounts body ({len(body)} bytes, {encoding}, default level):")
+    print(f"  inline     {inline * 1000:>7.2f} ms")
+    print(f"  offloaded  {offloaded * 1000:>7.2f} ms  (COMPRESSION_OFFLOAD_SIZE={settings.compression_offload_size})")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
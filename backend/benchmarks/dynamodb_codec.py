@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Account scan deserialization benchmark: resource layer vs ``app.db.codec``.
+
+Builds wire-format account items with the fleet generator (as a Scan
+returns them to botocore after JSON parsing) and times the two decode paths
+of a large admin scan:
+
+- resource: ``TypeDeserializer`` on every attribute (what
+  ``Table.scan()`` does), then ``strip_credentials``; numbers are Decimal
+- codec: ``deserialize_item(item, skip=CREDENTIAL_FIELDS)``; credentials
+  are never decoded and numbers are int
+
+Each path is followed by the dashboard's quota aggregation over the decoded
+items, which is where the Decimal/int difference shows up a second time.
+
+With ``--endpoint-url`` the scan is also run end to end against an accounts
+table filled by ``benchmarks.fleet`` (all pages, both paths), so botocore's
+HTTP and JSON parsing cost is included.
+
+Usage:
+    python -m benchmarks.dynamodb_codec
+    python -m benchmarks.dynamodb_codec --accounts 10000,100000 --repeat 5
+    python -m benchmarks.dynamodb_codec --endpoint-url http://localhost:8001 --json results/codec.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+# The app reads its settings at import time
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.core.config import settings  # noqa: E402
+from app.db.codec import deserialize_item  # noqa: E402
+from app.db.repositories import (  # noqa: E402
+    CREDENTIAL_FIELDS,
+    DEFAULT_QUOTA_MODELS,
+    strip_credentials,
+)
+from benchmarks.fleet import account_item  # noqa: E402
+
+NOW = 1760000000
+
+
+def wire_items(count: int, models: List[Dict[str, Any]], seed: int = 7) -> List[Dict[str, Any]]:
+    """Account items in the low-level client's wire format."""
+    serializer = TypeSerializer()
+    return [
+        {key: serializer.serialize(value) for key, value in account_item(seed, i, models, NOW).items()}
+        for i in range(count)
+    ]
+
+
+def decode_resource(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Resource-layer decoding (TypeDeserializer per attribute, then strip)."""
+    deserializer = TypeDeserializer()
+    return [
+        strip_credentials({key: deserializer.deserialize(value) for key, value in item.items()})
+        for item in items
+    ]
+
+
+def decode_codec(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Codec decoding, skipping credential attributes."""
+    return [deserialize_item(item, skip=CREDENTIAL_FIELDS) for item in items]
+
+
+def quota_totals(accounts: List[Dict[str, Any]], models: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Dashboard-style per-model TPM totals over decoded accounts."""
+    fields = []
+    for model in models:
+        base = model["model_id"].replace("-", "_").replace(".", "_")
+        fields.append((model["model_id"], base + "_tpm", base + "_1m_tpm" if model.get("has_1m_context") else None))
+
+    totals: Dict[str, Any] = {model_id: 0 for model_id, _, _ in fields}
+    for account in accounts:
+        quota = account.get("bedrock_quota") or {}
+        for model_id, field, field_1m in fields:
+            value = quota.get(field, 0) or 0
+            if field_1m:
+                value += quota.get(field_1m, 0) or 0
+            if value > 0:
+                totals[model_id] += value
+    return totals
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_offline(count: int, models: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    """Decode and aggregate ``count`` wire items with both paths."""
+    items = wire_items(count, models)
+    resource_accounts = decode_resource(items)
+    codec_accounts = decode_codec(items)
+    assert quota_totals(resource_accounts, models) == quota_totals(codec_accounts, models), "totals differ"
+
+    result: Dict[str, Any] = {"accounts": count}
+    for name, decode, decoded in (
+        ("resource", decode_resource, resource_accounts),
+        ("codec", decode_codec, codec_accounts),
+    ):
+        decode_s = best_of(partial(decode, items), repeat)
+        totals_s = best_of(partial(quota_totals, decoded, models), repeat)
+        result[name] = {
+            "decode_ms": round(decode_s * 1000, 2),
+            "totals_ms": round(totals_s * 1000, 2),
+            "us_per_item": round(decode_s * 1e6 / count, 2),
+        }
+    result["speedup"] = round(result["resource"]["decode_ms"] / result["codec"]["decode_ms"], 2)
+    return result
+
+
+def run_table_scan(repeat: int) -> Dict[str, Any]:
+    """Full paginated scan of the accounts table through both paths."""
+    from app.db.dynamodb import DynamoDBClient
+
+    dynamodb_client = DynamoDBClient()
+    table = dynamodb_client.dynamodb.Table(dynamodb_client.accounts_table_name)
+    client = dynamodb_client.client
+
+    def scan_resource() -> List[Dict[str, Any]]:
+        accounts, kwargs = [], {}
+        while True:
+            response = table.scan(**kwargs)
+            accounts.extend(strip_credentials(item) for item in response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                return accounts
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def scan_codec() -> List[Dict[str, Any]]:
+        accounts, kwargs = [], {"TableName": dynamodb_client.accounts_table_name}
+        while True:
+            response = client.scan(**kwargs)
+            accounts.extend(decode_codec(response.get("Items", [])))
+            if "LastEvaluatedKey" not in response:
+                return accounts
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    count = len(scan_codec())
+    return {
+        "accounts": count,
+        "resource_ms": round(best_of(scan_resource, repeat) * 1000, 1),
+        "codec_ms": round(best_of(scan_codec, repeat) * 1000, 1),
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", default="1000,10000,50000", help="Comma-separated item counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--endpoint-url", help="Also scan a fleet-filled accounts table at this DynamoDB URL")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    models = DEFAULT_QUOTA_MODELS
+    results: Dict[str, Any] = {"models": len(models), "offline": []}
+
+    print(f"Account scan decoding, {len(models)} quota models, best of {args.repeat}\n")
+    print(f"{'accounts':>9} {'resource ms':>12} {'codec ms':>9} {'speedup':>8} {'us/item':>13} {'totals ms (D/int)':>18}")
+    for count in (int(c) for c in args.accounts.split(",") if c.strip()):
+        r = run_offline(count, models, args.repeat)
+        results["offline"].append(r)
+        print(
+            f"{count:>9} {r['resource']['decode_ms']:>12.1f} {r['codec']['decode_ms']:>9.1f} "
+            f"{r['speedup']:>7.2f}x {r['resource']['us_per_item']:>6.2f}/{r['codec']['us_per_item']:<6.2f}"
+            f" {r['resource']['totals_ms']:>8.1f}/{r['codec']['totals_ms']:<8.1f}"
+        )
+
+    if args.endpoint_url:
+        settings.dynamodb_endpoint_url = args.endpoint_url
+        scan = run_table_scan(args.repeat)
+        results["table_scan"] = scan
+        print(
+            f"\nFull table scan ({scan['accounts']} accounts): "
+            f"resource {scan['resource_ms']:.0f} ms, codec {scan['codec_ms']:.0f} ms"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
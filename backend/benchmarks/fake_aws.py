@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Latency-injecting local stand-in for the AWS APIs the app calls.
+
+One HTTP server answers, in each service's wire protocol, every operation
+``AWSService``, ``KMSService`` and the readiness probes use:
+
+- sts: GetCallerIdentity (account ID derived from the signing access key,
+  like the development mock)
+- kms: Encrypt, Decrypt, DescribeKey (reversible fake ciphertext)
+- servicequotas: GetServiceQuota (deterministic values per account/quota)
+- account: GetContactInformation
+- bedrock: ListFoundationModels
+
+Point the app at it with ``AWS_API_ENDPOINT_URL=http://127.0.0.1:4599`` (and
+any ``KMS_KEY_ID``); this also disables the development mocks, so the real
+code paths, clients and retries run.
+
+Every operation sleeps for a sample of a lognormal latency distribution
+fitted to its p50/p99 and fails at the configured error and throttle rates
+(throttles use each service's throttling error code, so botocore retries
+them as it would in AWS). A profile overrides the defaults below::
+
+    {
+      "seed": 7,
+      "default": {"p50_ms": 40, "p99_ms": 250, "error_rate": 0.0, "throttle_rate": 0.0},
+      "operations": {"servicequotas.GetServiceQuota": {"p50_ms": 90, "throttle_rate": 0.05}}
+    }
+
+Control endpoints: ``GET /_fake/stats`` (per-operation calls, errors,
+throttles and injected latency), ``POST /_fake/reset`` and ``PUT /_fake/profile``.
+
+Usage:
+    python -m benchmarks.fake_aws
+    python -m benchmarks.fake_aws --port 4599 --profile fake_aws_profile.json
+    python -m benchmarks.fake_aws --scale 0  # no injected latency
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+# Typical latencies observed from inside a region
+DEFAULT_PROFILE: Dict[str, Any] = {
+    "seed": 7,
+    "default": {"p50_ms": 40, "p99_ms": 250, "error_rate": 0.0, "throttle_rate": 0.0},
+    "operations": {
+        "sts.GetCallerIdentity": {"p50_ms": 25, "p99_ms": 120},
+        "kms.Encrypt": {"p50_ms": 8, "p99_ms": 45},
+        "kms.Decrypt": {"p50_ms": 8, "p99_ms": 45},
+        "kms.DescribeKey": {"p50_ms": 6, "p99_ms": 30},
+        "servicequotas.GetServiceQuota": {"p50_ms": 70, "p99_ms": 400},
+        "account.GetContactInformation": {"p50_ms": 90, "p99_ms": 500},
+        "bedrock.ListFoundationModels": {"p50_ms": 120, "p99_ms": 600},
+    },
+}
+
+# Error codes per service: (throttle code, throttle status, error code, error status)
+ERROR_CODES = {
+    "sts": ("Throttling", 400, "InternalFailure", 500),
+    "kms": ("ThrottlingException", 400, "KMSInternalException", 500),
+    "servicequotas": ("TooManyRequestsException", 400, "ServiceException", 500),
+    "account": ("TooManyRequestsException", 429, "InternalServerException", 500),
+    "bedrock": ("ThrottlingException", 429, "InternalServerException", 500),
+}
+
+QUERY_SERVICES = {"sts"}
+REST_SERVICES = {"account", "bedrock"}
+
+_CREDENTIAL = re.compile(r"Credential=([^/]+)/")
+_FAKE_CIPHERTEXT = b"fakekms:"
+
+
+@dataclass
+class OperationStats:
+    """Counters for one operation."""
+
+    calls: int = 0
+    errors: int = 0
+    throttles: int = 0
+    injected_ms: float = 0.0
+
+
+class FakeAWS:
+    """Request handling, fault injection and counters."""
+
+    def __init__(self, profile: Optional[Dict[str, Any]] = None, scale: float = 1.0):
+        """
+        Initialize fake AWS.
+
+        Args:
+            profile: Latency/fault profile (merged over DEFAULT_PROFILE)
+            scale: Multiplier for every injected latency (0 disables it)
+        """
+        self.scale = scale
+        self.stats: Dict[str, OperationStats] = {}
+        self.load_profile(profile or {})
+
+    def load_profile(self, profile: Dict[str, Any]):
+        """Merge a profile over the defaults."""
+        self.default = {**DEFAULT_PROFILE["default"], **profile.get("default", {})}
+        operations = dict(DEFAULT_PROFILE["operations"])
+        for name, overrides in profile.get("operations", {}).items():
+            operations[name] = {**operations.get(name, {}), **overrides}
+        self.operations = operations
+        self.rng = random.Random(profile.get("seed", DEFAULT_PROFILE["seed"]))
+
+    def settings_for(self, operation: str) -> Dict[str, Any]:
+        """Effective latency and fault settings for an operation."""
+        return {**self.default, **self.operations.get(operation, {})}
+
+    def sample_latency(self, operation: str) -> float:
+        """Latency in seconds from a lognormal fitted to p50/p99."""
+        config = self.settings_for(operation)
+        p50 = config["p50_ms"]
+        p99 = max(config.get("p99_ms", p50), p50)
+        if p50 <= 0:
+            return 0.0
+        sigma = (math.log(p99) - math.log(p50)) / 2.326
+        return self.rng.lognormvariate(math.log(p50), sigma) * self.scale / 1000
+
+    def fault(self, operation: str) -> Optional[str]:
+        """Draw an injected fault: 'throttle', 'error' or None."""
+        config = self.settings_for(operation)
+        draw = self.rng.random()
+        if draw < config.get("throttle_rate", 0.0):
+            return "throttle"
+        if draw < config.get("throttle_rate", 0.0) + config.get("error_rate", 0.0):
+            return "error"
+        return None
+
+    async def handle(self, request: Request) -> Response:
+        """Dispatch an AWS API request."""
+        body = await request.body()
+        service, operation, params = identify(request, body)
+        name = f"{service}.{operation}"
+        stats = self.stats.setdefault(name, OperationStats())
+        stats.calls += 1
+
+        delay = self.sample_latency(name)
+        stats.injected_ms += delay * 1000
+        if delay:
+            await asyncio.sleep(delay)
+
+        fault = self.fault(name)
+        if fault == "throttle":
+            stats.throttles += 1
+            code, status, _, _ = ERROR_CODES.get(service, ERROR_CODES["kms"])
+            return error_response(service, code, "Rate exceeded", status)
+        if fault == "error":
+            stats.errors += 1
+            _, _, code, status = ERROR_CODES.get(service, ERROR_CODES["kms"])
+            return error_response(service, code, "Injected failure", status)
+
+        handler = HANDLERS.get(name)
+        if handler is None:
+            return error_response(service, "UnknownOperationException", f"{name} not faked", 400)
+        return handler(access_key(request), params)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-operation counters."""
+        return {
+            name: {
+                "calls": s.calls,
+                "errors": s.errors,
+                "throttles": s.throttles,
+                "mean_injected_ms": round(s.injected_ms / s.calls, 2) if s.calls else 0.0,
+            }
+            for name, s in sorted(self.stats.items())
+        }
+
+
+# ===================================================================
+# Protocol helpers
+# ===================================================================
+
+
+def identify(request: Request, body: bytes) -> Tuple[str, str, Dict[str, Any]]:
+    """Work out (service, operation, params) from a botocore request."""
+    target = request.headers.get("x-amz-target", "")
+    if target:
+        prefix, _, operation = target.partition(".")
+        service = "kms" if prefix == "TrentService" else "servicequotas"
+        return service, operation, json.loads(body or b"{}")
+
+    path = request.url.path
+    if path == "/getContactInformation":
+        return "account", "GetContactInformation", json.loads(body or b"{}")
+    if path == "/foundation-models":
+        return "bedrock", "ListFoundationModels", dict(request.query_params)
+
+    form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+    return "sts", form.get("Action", "Unknown"), form
+
+
+def access_key(request: Request) -> str:
+    """Access key ID from the SigV4 Authorization header."""
+    match = _CREDENTIAL.search(request.headers.get("authorization", ""))
+    return match.group(1) if match else "AKIAFAKE"
+
+
+def account_id_for(key: str) -> str:
+    """Same derivation as the development mock in AWSService."""
+    return str(int(hashlib.md5(key.encode()).hexdigest()[:12], 16))[:12].zfill(12)
+
+
+def error_response(service: str, code: str, message: str, status: int) -> Response:
+    """Error in the service's wire protocol."""
+    if service in QUERY_SERVICES:
+        xml = (
+            "<ErrorResponse><Error><Type>Sender</Type>"
+            f"<Code>{code}</Code><Message>{message}</Message></Error>"
+            f"<RequestId>{uuid.uuid4()}</RequestId></ErrorResponse>"
+        )
+        return Response(xml, status_code=status, media_type="text/xml")
+    if service in REST_SERVICES:
+        return JSONResponse(
+            {"message": message}, status_code=status, headers={"x-amzn-ErrorType": code}
+        )
+    return Response(
+        json.dumps({"__type": code, "message": message}),
+        status_code=status,
+        media_type="application/x-amz-json-1.1",
+    )
+
+
+def _json(payload: Dict[str, Any]) -> Response:
+    return Response(json.dumps(payload), media_type="application/x-amz-json-1.1")
+
+
+# ===================================================================
+# Operations
+# ===================================================================
+
+
+def get_caller_identity(key: str, params: Dict[str, Any]) -> Response:
+    account_id = account_id_for(key)
+    xml = (
+        '<GetCallerIdentityResponse xmlns="https://sts.amazonaws.com/doc/2011-06-15/">'
+        "<GetCallerIdentityResult>"
+        f"<Arn>arn:aws:iam::{account_id}:user/fake-user</Arn>"
+        "<UserId>AIDACKCEVSQ6C2EXAMPLE</UserId>"
+        f"<Account>{account_id}</Account>"
+        "</GetCallerIdentityResult>"
+        f"<ResponseMetadata><RequestId>{uuid.uuid4()}</RequestId></ResponseMetadata>"
+        "</GetCallerIdentityResponse>"
+    )
+    return Response(xml, media_type="text/xml")
+
+
+def _key_arn(key_id: str) -> str:
+    if key_id.startswith("arn:"):
+        return key_id
+    return f"arn:aws:kms:us-east-1:000000000000:key/{key_id}"
+
+
+def kms_encrypt(key: str, params: Dict[str, Any]) -> Response:
+    key_id = params.get("KeyId", "")
+    blob = _FAKE_CIPHERTEXT + key_id.encode() + b":" + base64.b64decode(params["Plaintext"])
+    return _json(
+        {
+            "CiphertextBlob": base64.b64encode(blob).decode(),
+            "KeyId": _key_arn(key_id),
+            "EncryptionAlgorithm": "SYMMETRIC_DEFAULT",
+        }
+    )
+
+
+def kms_decrypt(key: str, params: Dict[str, Any]) -> Response:
+    blob = base64.b64decode(params["CiphertextBlob"])
+    key_id = "fake"
+    if blob.startswith(_FAKE_CIPHERTEXT):
+        key_id, _, blob = blob[len(_FAKE_CIPHERTEXT):].partition(b":")
+        key_id = key_id.decode()
+    return _json(
+        {
+            "Plaintext": base64.b64encode(blob).decode(),
+            "KeyId": _key_arn(key_id),
+            "EncryptionAlgorithm": "SYMMETRIC_DEFAULT",
+        }
+    )
+
+
+def kms_describe_key(key: str, params: Dict[str, Any]) -> Response:
+    key_id = params.get("KeyId", "fake")
+    return _json(
+        {
+            "KeyMetadata": {
+                "KeyId": key_id.rsplit("/", 1)[-1],
+                "Arn": _key_arn(key_id),
+                "Enabled": True,
+                "KeyState": "Enabled",
+                "KeyUsage": "ENCRYPT_DECRYPT",
+                "CreationDate": 1700000000.0,
+            }
+        }
+    )
+
+
+def get_service_quota(key: str, params: Dict[str, Any]) -> Response:
+    code = params.get("QuotaCode", "")
+    digest = hashlib.md5(f"{account_id_for(key)}:{code}".encode()).digest()
+    value = [200000, 400000, 800000, 2000000][digest[0] % 4]
+    return _json(
+        {
+            "Quota": {
+                "ServiceCode": params.get("ServiceCode", "bedrock"),
+                "ServiceName": "Amazon Bedrock",
+                "QuotaCode": code,
+                "QuotaName": f"Fake tokens per minute quota {code}",
+                "Value": float(value),
+                "Unit": "None",
+                "Adjustable": True,
+                "GlobalQuota": False,
+            }
+        }
+    )
+
+
+def get_contact_information(key: str, params: Dict[str, Any]) -> Response:
+    return JSONResponse(
+        {
+            "ContactInformation": {
+                "FullName": "Fake Account Holder",
+                "AddressLine1": "410 Terry Ave N",
+                "City": "Seattle",
+                "StateOrRegion": "WA",
+                "PostalCode": "98109",
+                "CountryCode": "US",
+                "PhoneNumber": "+12065550100",
+            }
+        }
+    )
+
+
+def list_foundation_models(key: str, params: Dict[str, Any]) -> Response:
+    models = [
+        ("anthropic.claude-sonnet-4-5-20250929-v1:0", "Claude Sonnet 4.5"),
+        ("anthropic.claude-opus-4-5-20251101-v1:0", "Claude Opus 4.5"),
+        ("anthropic.claude-haiku-4-5-20251001-v1:0", "Claude Haiku 4.5"),
+    ]
+    return JSONResponse(
+        {
+            "modelSummaries": [
+                {
+                    "modelArn": f"arn:aws:bedrock:us-east-1::foundation-model/{model_id}",
+                    "modelId": model_id,
+                    "modelName": name,
+                    "providerName": "Anthropic",
+                    "inputModalities": ["TEXT", "IMAGE"],
+                    "outputModalities": ["TEXT"],
+                    "responseStreamingSupported": True,
+                }
+                for model_id, name in models
+            ]
+        }
+    )
+
+
+HANDLERS = {
+    "sts.GetCallerIdentity": get_caller_identity,
+    "kms.Encrypt": kms_encrypt,
+    "kms.Decrypt": kms_decrypt,
+    "kms.DescribeKey": kms_describe_key,
+    "servicequotas.GetServiceQuota": get_service_quota,
+    "account.GetContactInformation": get_contact_information,
+    "bedrock.ListFoundationModels": list_foundation_models,
+}
+
+
+# ===================================================================
+# Server
+# ===================================================================
+
+
+def create_app(fake: FakeAWS) -> Starlette:
+    """ASGI app serving the fake APIs and the control endpoints."""
+
+    async def stats(request: Request) -> Response:
+        return JSONResponse(fake.snapshot())
+
+    async def reset(request: Request) -> Response:
+        fake.stats.clear()
+        return JSONResponse({"reset": True})
+
+    async def profile(request: Request) -> Response:
+        fake.load_profile(await request.json())
+        return JSONResponse({"default": fake.default, "operations": fake.operations})
+
+    methods = ["GET", "POST", "PUT", "DELETE"]
+    return Starlette(
+        routes=[
+            Route("/_fake/stats", stats, methods=["GET"]),
+            Route("/_fake/reset", reset, methods=["POST"]),
+            Route("/_fake/profile", profile, methods=["PUT"]),
+            Route("/{path:path}", fake.handle, methods=methods),
+        ]
+    )
+
+
+class FakeAWSServer:
+    """Run the fake in a background thread (for in-process benchmarks)."""
+
+    def __init__(self, fake: Optional[FakeAWS] = None, host: str = "127.0.0.1", port: int = 4599):
+        """Initialize server."""
+        self.fake = fake or FakeAWS()
+        self.server = uvicorn.Server(
+            uvicorn.Config(create_app(self.fake), host=host, port=port, log_level="warning")
+        )
+        self.endpoint_url = f"http://{host}:{port}"
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "FakeAWSServer":
+        """Start serving and wait until the socket is bound."""
+        self._thread = threading.Thread(target=self.server.run, name="fake-aws", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Fake AWS server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        """Stop serving."""
+        self.server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(5)
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4599)
+    parser.add_argument("--profile", help="JSON latency/fault profile")
+    parser.add_argument("--scale", type=float, default=1.0, help="Latency multiplier")
+    args = parser.parse_args()
+
+    profile = {}
+    if args.profile:
+        with open(args.profile) as f:
+            profile = json.load(f)
+
+    fake = FakeAWS(profile, scale=args.scale)
+    print(f"Fake AWS listening on http://{args.host}:{args.port} (latency x{args.scale})")
+    print(f"Set AWS_API_ENDPOINT_URL=http://{args.host}:{args.port} and any KMS_KEY_ID")
+    uvicorn.run(create_app(fake), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
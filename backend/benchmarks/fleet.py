@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Synthetic fleet generator: accounts and audit history at scale.
+
+Writes ``--accounts`` accounts and ``--audit-rows`` audit log items into the
+configured tables (DynamoDB Local via ``--endpoint-url``, or whatever
+DYNAMODB_ENDPOINT_URL/AWS settings point at), shaped like the app writes
+them:
+
+- accounts: a bedrock_quota map with TPM (and 1M context TPM) fields for
+  every model in the current quota config, skewed created_by (a few heavy
+  users, a long tail), mostly active status, varied regions and billing
+  countries, encrypted credential fields in the development mock format
+- audit rows: create/refresh/export/billing/delete actions over the last
+  90 days with the app's details shapes (diffs, compressed when large),
+  TTLs, IPs and user agents, against the generated accounts
+
+Every item is derived from ``(seed, kind, index)`` alone, so the same seed
+always produces the same fleet regardless of ``--workers``. Index ranges
+are split across parallel BatchWriteItem workers (one low-level client
+each); unprocessed items are retried with backoff.
+
+Usage:
+    python -m benchmarks.fleet --endpoint-url http://localhost:8001 --accounts 100000 --audit-rows 1000000
+    python -m benchmarks.fleet --accounts 10000 --audit-rows 0 --workers 16 --seed 42
+"""
+import argparse
+import base64
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+from boto3.dynamodb.types import TypeSerializer
+
+# The app reads its settings at import time
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.core.config import settings  # noqa: E402
+from app.db.audit_codec import diff_values, encode_details  # noqa: E402
+from app.db.repositories import AUDIT_LOG_RETENTION_SECONDS  # noqa: E402
+
+ACCOUNT_ID_BASE = 100000000000
+BATCH_SIZE = 25  # BatchWriteItem limit
+
+# Weighted towards the usual home regions
+REGIONS = ["us-east-1"] * 5 + ["us-west-2"] * 3 + [
+    "eu-central-1",
+    "eu-west-1",
+    "ap-northeast-1",
+    "ap-southeast-2",
+]
+COUNTRIES = [
+    ("US", "Seattle", "WA", "98101"),
+    ("US", "New York", "NY", "10001"),
+    ("US", "Austin", "TX", "78701"),
+    ("DE", "Berlin", None, "10115"),
+    ("GB", "London", None, "EC1A 1BB"),
+    ("JP", "Tokyo", None, "100-0001"),
+    ("SG", "Singapore", None, "018956"),
+    ("AU", "Sydney", "NSW", "2000"),
+    ("CN", "Shanghai", None, "200000"),
+    ("BR", "São Paulo", "SP", "01000-000"),
+]
+CREATORS = [f"user-{i:03d}" for i in range(20)] + ["dev-user-123"]
+ADMINS = ["admin-001", "admin-002", "dev-user-123"]
+TPM_VALUES = [0, 200000, 400000, 800000, 2000000]
+AUDIT_ACTIONS = [
+    ("refresh_quota", 55),
+    ("export_credentials", 20),
+    ("create_account", 10),
+    ("update_billing_address", 10),
+    ("delete_account", 5),
+]
+USER_AGENTS = [
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/126.0 Safari/537.36",
+    "python-httpx/0.27.0",
+]
+
+
+def account_id(index: int) -> str:
+    """Account ID of the fleet account at ``index``."""
+    return f"{ACCOUNT_ID_BASE + index:012d}"
+
+
+def item_rng(seed: int, kind: str, index: int) -> random.Random:
+    """Per-item generator, independent of worker partitioning."""
+    return random.Random(f"{seed}:{kind}:{index}")
+
+
+def pick_creator(rng: random.Random) -> str:
+    """Skewed creator: the first few users own most accounts."""
+    return CREATORS[min(int(rng.paretovariate(0.7)) - 1, len(CREATORS) - 1)]
+
+
+def quota_fields(models: List[Dict[str, Any]], rng: random.Random, now: int) -> Dict[str, Any]:
+    """bedrock_quota map for the configured models (field names as the dashboard reads them)."""
+    quota: Dict[str, Any] = {"last_updated": now - rng.randint(0, 7 * 86400)}
+    for model in models:
+        field_name = model["model_id"].replace("-", "_").replace(".", "_") + "_tpm"
+        tpm = rng.choice(TPM_VALUES)
+        quota[field_name] = tpm
+        if model.get("has_1m_context"):
+            quota[field_name.replace("_tpm", "_1m_tpm")] = tpm // 5
+    return quota
+
+
+def billing_address(rng: random.Random) -> Dict[str, Any]:
+    """Billing address as AWSService.get_billing_address maps it."""
+    country, city, state, postal_code = rng.choice(COUNTRIES)
+    return {
+        "country": country,
+        "state": state or "",
+        "city": city,
+        "address": f"{rng.randint(1, 999)} Main Street",
+        "postal_code": postal_code,
+    }
+
+
+def account_item(seed: int, index: int, models: List[Dict[str, Any]], now: int) -> Dict[str, Any]:
+    """Synthetic account item shaped like AWSAccountManager.create_account writes it."""
+    rng = item_rng(seed, "account", index)
+    created_at = now - rng.randint(0, 2 * 365 * 86400)
+    access_key = f"AKIA{index:016d}"
+    secret_key = "".join(rng.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=40))
+    return {
+        "account_id": account_id(index),
+        "account_name": f"Fleet Account {index}",
+        "account_email": f"aws+{index}@example.com",
+        "region": rng.choice(REGIONS),
+        # Development mode KMS mock (and the fake AWS server) accept base64
+        "access_key_encrypted": base64.b64encode(access_key.encode()).decode(),
+        "secret_key_encrypted": base64.b64encode(secret_key.encode()).decode(),
+        "encryption_key_id": "dev-mock-key",
+        "billing_address": billing_address(rng),
+        "bedrock_quota": quota_fields(models, rng, now),
+        "status": "active" if rng.random() < 0.92 else "inactive",
+        "created_at": created_at,
+        "updated_at": rng.randint(created_at, now),
+        "created_by": pick_creator(rng),
+        "metadata": {},
+    }
+
+
+def audit_item(
+    seed: int,
+    index: int,
+    accounts: int,
+    models: List[Dict[str, Any]],
+    now: int,
+    compress_threshold: int,
+) -> Dict[str, Any]:
+    """Synthetic audit item shaped like AuditLogManager.log_action writes it."""
+    rng = item_rng(seed, "audit", index)
+    actions, weights = zip(*AUDIT_ACTIONS)
+    action = rng.choices(actions, weights)[0]
+    target = rng.randrange(accounts) if accounts else index
+    timestamp = now - rng.randint(0, 89 * 86400)
+
+    if action == "refresh_quota":
+        old = quota_fields(models, rng, timestamp)
+        new = quota_fields(models, rng, timestamp)
+        details = {"quota": diff_values(old, new), "region": rng.choice(REGIONS)}
+    elif action == "update_billing_address":
+        details = {
+            "billing_address": diff_values(billing_address(rng), billing_address(rng))
+        }
+    elif action == "export_credentials":
+        details = {"reason": "admin_export"}
+    else:
+        details = {"account_name": f"Fleet Account {target}", "region": rng.choice(REGIONS)}
+
+    return {
+        "log_id": f"{seed:08x}-{index:012x}-{rng.getrandbits(64):016x}",
+        "timestamp": timestamp,
+        "user_id": rng.choice(ADMINS if action != "create_account" else ADMINS + CREATORS[:5]),
+        "action": action,
+        "resource_type": "account",
+        "resource_id": account_id(target),
+        **encode_details(details, compress_threshold),
+        "ip_address": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+        "user_agent": rng.choice(USER_AGENTS),
+        "status": "success" if rng.random() < 0.98 else "failure",
+        "ttl": timestamp + AUDIT_LOG_RETENTION_SECONDS,
+    }
+
+
+# ===================================================================
+# Writing
+# ===================================================================
+
+
+def write_range(
+    client,
+    table: str,
+    make_item: Callable[[int], Dict[str, Any]],
+    start: int,
+    stop: int,
+    max_retries: int = 8,
+) -> int:
+    """
+    Write items ``start..stop-1`` with BatchWriteItem.
+
+    Returns:
+        Number of items written
+    """
+    serializer = TypeSerializer()
+    written = 0
+    for batch_start in range(start, stop, BATCH_SIZE):
+        requests = [
+            {
+                "PutRequest": {
+                    "Item": {
+                        key: serializer.serialize(value)
+                        for key, value in make_item(index).items()
+                    }
+                }
+            }
+            for index in range(batch_start, min(batch_start + BATCH_SIZE, stop))
+        ]
+        pending = {table: requests}
+        for attempt in range(max_retries + 1):
+            response = client.batch_write_item(RequestItems=pending)
+            pending = response.get("UnprocessedItems") or {}
+            if not pending:
+                break
+            if attempt == max_retries:
+                raise RuntimeError(f"{table}: items still unprocessed after {max_retries} retries")
+            time.sleep(min(0.05 * 2**attempt, 2.0))
+        written += len(requests)
+    return written
+
+
+def write_parallel(
+    connection_kwargs: Dict[str, Any],
+    table: str,
+    make_item: Callable[[int], Dict[str, Any]],
+    count: int,
+    workers: int,
+) -> int:
+    """Split ``range(count)`` across ``workers`` threads, each with its own client."""
+    if count <= 0:
+        return 0
+    workers = max(1, min(workers, (count + BATCH_SIZE - 1) // BATCH_SIZE))
+    chunk = (count + workers - 1) // workers
+
+    def run(start: int) -> int:
+        client = boto3.client("dynamodb", **connection_kwargs)
+        return write_range(client, table, make_item, start, min(start + chunk, count))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fleet") as pool:
+        return sum(pool.map(run, range(0, count, chunk)))
+
+
+def generate_fleet(
+    connection_kwargs: Dict[str, Any],
+    models: List[Dict[str, Any]],
+    accounts: int,
+    audit_rows: int = 0,
+    seed: int = 7,
+    workers: int = 8,
+    accounts_table: Optional[str] = None,
+    audit_table: Optional[str] = None,
+    now: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Write a deterministic fleet.
+
+    Args:
+        connection_kwargs: boto3 client kwargs (DynamoDBClient.connection_kwargs)
+        models: Quota config models (for bedrock_quota fields)
+        accounts: Number of accounts
+        audit_rows: Number of audit log items
+        seed: Fleet seed
+        workers: Parallel BatchWriteItem workers
+        accounts_table: Accounts table (defaults to settings)
+        audit_table: Audit logs table (defaults to settings)
+        now: Reference time for timestamps (defaults to the current time)
+
+    Returns:
+        Dict with account_ids, counts and write timings
+    """
+    now = now or int(time.time())
+    compress_threshold = settings.audit_details_compress_threshold
+
+    start = time.perf_counter()
+    written_accounts = write_parallel(
+        connection_kwargs,
+        accounts_table or settings.dynamodb_accounts_table,
+        lambda index: account_item(seed, index, models, now),
+        accounts,
+        workers,
+    )
+    accounts_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    written_audit = write_parallel(
+        connection_kwargs,
+        audit_table or settings.dynamodb_audit_logs_table,
+        lambda index: audit_item(seed, index, accounts, models, now, compress_threshold),
+        audit_rows,
+        workers,
+    )
+    audit_seconds = time.perf_counter() - start
+
+    return {
+        "account_ids": [account_id(index) for index in range(accounts)],
+        "accounts": written_accounts,
+        "audit_rows": written_audit,
+        "accounts_seconds": round(accounts_seconds, 2),
+        "audit_seconds": round(audit_seconds, 2),
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", type=int, default=10000)
+    parser.add_argument("--audit-rows", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=8, help="Parallel BatchWriteItem workers")
+    parser.add_argument("--endpoint-url", help="DynamoDB Local URL (overrides DYNAMODB_ENDPOINT_URL)")
+    parser.add_argument("--create-tables", action="store_true", help="Create missing tables first")
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        settings.dynamodb_endpoint_url = args.endpoint_url
+
+    from app.db.dynamodb import DynamoDBClient
+    from app.db.quota_config_manager import QuotaConfigManager
+
+    dynamodb_client = DynamoDBClient()
+    if args.create_tables:
+        dynamodb_client.create_tables()
+
+    manager = QuotaConfigManager()
+    config = manager.get_config() or manager.initialize_default_config()
+
+    print(
+        f"Writing {args.accounts} accounts and {args.audit_rows} audit rows "
+        f"({len(config['models'])} models, seed {args.seed}, {args.workers} workers)"
+    )
+    result = generate_fleet(
+        dynamodb_client.connection_kwargs,
+        config["models"],
+        args.accounts,
+        args.audit_rows,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    for kind in ("accounts", "audit"):
+        count = result["accounts" if kind == "accounts" else "audit_rows"]
+        seconds = result[f"{kind}_seconds"]
+        rate = count / seconds if seconds else 0
+        print(f"  {kind:<9} {count:>9} items in {seconds:>7.1f}s ({rate:,.0f}/s)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+JSON response rendering benchmark on a large account list.
+
+Serves the same ``--accounts`` fleet-shaped accounts from a throwaway
+FastAPI app through each response path and times full requests in-process
+(TestClient):
+
+- default: response_model + models returned with the default response
+  class (FastAPI validates, then dumps; recent FastAPI versions dump to
+  bytes in Rust, older ones via dicts and ``json.dumps``)
+- encoder: no response_model, raw dicts through ``jsonable_encoder`` +
+  ``json.dumps`` (Decimals as the resource layer returns them)
+- fast-class: response_model + models returned, FastJSONResponse as the
+  route's response class (FastAPI then skips its Rust dump path, which is
+  why FastJSONResponse is not a router default)
+- fast-direct: FastJSONResponse(models) returned, as the account list does
+- fast-dicts: FastJSONResponse(raw dicts with Decimals), rendered by orjson
+  when installed (``json`` otherwise)
+
+All paths must produce the same JSON document.
+
+Usage:
+    python -m benchmarks.json_responses
+    python -m benchmarks.json_responses --accounts 10000 --requests 20 --json results/json.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# The app reads its settings at import time
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.core import responses  # noqa: E402
+from app.core.responses import FastJSONResponse  # noqa: E402
+from app.db.memory import to_dynamo  # noqa: E402
+from app.db.repositories import DEFAULT_QUOTA_MODELS, strip_credentials  # noqa: E402
+from app.schemas.account import AccountResponse  # noqa: E402
+from benchmarks.fleet import account_item  # noqa: E402
+from benchmarks.stats import summarize  # noqa: E402
+
+NOW = 1760000000
+
+
+def build_app(count: int) -> FastAPI:
+    """Throwaway app serving ``count`` accounts through every path."""
+    items = [strip_credentials(account_item(7, i, DEFAULT_QUOTA_MODELS, NOW)) for i in range(count)]
+    models = [AccountResponse(**item) for item in items]
+    # Response-shaped dicts with resource-layer Decimals
+    decimal_dicts = [to_dynamo(model.model_dump()) for model in models]
+
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[AccountResponse])
+    def default():
+        return models
+
+    @app.get("/encoder")
+    def encoder():
+        return decimal_dicts
+
+    @app.get("/fast-class", response_model=List[AccountResponse], response_class=FastJSONResponse)
+    def fast_class():
+        return models
+
+    @app.get("/fast-direct", response_model=List[AccountResponse])
+    def fast_direct():
+        return FastJSONResponse(models)
+
+    @app.get("/fast-dicts", response_model=List[AccountResponse])
+    def fast_dicts():
+        return FastJSONResponse(decimal_dicts)
+
+    return app
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=10, help="Timed requests per path")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    paths = ["default", "encoder", "fast-class", "fast-direct", "fast-dicts"]
+    client = TestClient(build_app(args.accounts))
+
+    reference = None
+    for path in paths:
+        document = json.loads(client.get(f"/{path}").content)
+        reference = reference if reference is not None else document
+        assert document == reference, f"/{path} renders a different document"
+
+    renderer = "orjson" if responses.orjson is not None else "json"
+    print(f"GET of {args.accounts} accounts, {args.requests} requests per path (dict renderer: {renderer})\n")
+    print(f"{'path':<12} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>10} {'vs default':>11}")
+
+    results: Dict[str, Any] = {"accounts": args.accounts, "renderer": renderer, "paths": {}}
+    for path in paths:
+        latencies, size = [], 0
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            t0 = time.perf_counter()
+            size = len(client.get(f"/{path}").content)
+            latencies.append(time.perf_counter() - t0)
+        summary = summarize(latencies, time.perf_counter() - start)
+        summary["bytes"] = size
+        results["paths"][path] = summary
+
+    base = results["paths"]["default"]["p50_ms"]
+    for path in paths:
+        r = results["paths"][path]
+        print(f"{path:<12} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['bytes']:>10} {base / r['p50_ms']:>10.2f}x")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
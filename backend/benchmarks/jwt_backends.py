@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+JWT backend verification throughput benchmark.
+
+Measures token verification, verification with key construction and header
+parsing for every backend in ``app.middleware.jwt_backends``. Conformance
+(valid tokens accepted, bad ones rejected) is covered by
+``tests/test_jwt_backends.py``.
+
+Usage:
+    python -m benchmarks.jwt_backends
+    python -m benchmarks.jwt_backends --iterations 5000 --backends jose,pyjwt
+    python -m benchmarks.jwt_backends --json results/jwt_backends.json
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict
+
+from app.middleware.jwt_backends import BACKENDS, get_jwt_backend
+from app.middleware.local_issuer import LocalIssuer
+
+ISSUER = "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_benchmark"
+
+
+def _rate(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def benchmark_backend(
+    backend_name: str, token: str, jwk_data: Dict[str, Any], iterations: int
+) -> Dict[str, float]:
+    """Measure operations per second for one backend."""
+    backend = get_jwt_backend(backend_name)
+    key = backend.construct_key(jwk_data)
+
+    # Warm up
+    for _ in range(min(100, iterations)):
+        backend.decode(token, key, ISSUER)
+
+    return {
+        "verify_per_sec": _rate(lambda: backend.decode(token, key, ISSUER), iterations),
+        "verify_with_key_construct_per_sec": _rate(
+            lambda: backend.decode(token, backend.construct_key(jwk_data), ISSUER),
+            iterations,
+        ),
+        "header_parse_per_sec": _rate(
+            lambda: backend.get_unverified_header(token), iterations
+        ),
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    # In-memory key (key_file="") so the benchmark never touches the key file
+    issuer = LocalIssuer(issuer=ISSUER, key_file="")
+    jwk_data = issuer.jwks["keys"][0]
+    token = issuer.mint(sub="benchmark-user", email="bench@example.com", role="admin")
+
+    results: Dict[str, Any] = {"iterations": args.iterations, "backends": {}}
+
+    for name in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        try:
+            get_jwt_backend(name)
+        except ImportError as e:
+            print(f"[{name}] skipped: {e}")
+            results["backends"][name] = {"skipped": str(e)}
+            continue
+
+        results["backends"][name] = benchmark_backend(name, token, jwk_data, args.iterations)
+
+    print()
+    print(f"{'backend':<10} {'verify/s':>12} {'verify+construct/s':>20} {'header/s':>12}")
+    for name, stats in results["backends"].items():
+        if "verify_per_sec" in stats:
+            print(
+                f"{name:<10} {stats['verify_per_sec']:>12,.0f} "
+                f"{stats['verify_with_key_construct_per_sec']:>20,.0f} "
+                f"{stats['header_parse_per_sec']:>12,.0f}"
+            )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
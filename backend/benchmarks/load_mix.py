@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Open-loop load generator with the SPA's traffic mix.
+
+Drives a running API (``uvicorn app.main:app`` locally or an ECS service)
+at a fixed arrival rate: sessions start on a Poisson schedule at
+``--rps`` regardless of how fast earlier ones finish, so a slow server
+builds a backlog instead of quietly lowering the offered load. Each
+arrival runs one scenario, picked by weight:
+
+- dashboard: GET /api/dashboard/stats (the home page polls it)
+- list: GET /api/accounts
+- detail: GET /api/accounts/{id}, then its billing and quota in parallel
+  (what the detail page fetches)
+- refresh: POST /api/accounts/{id}/quota/refresh (admin)
+- export: GET /api/accounts/{id}/credentials (admin)
+
+Requests carry real RS256 ID tokens for ``--users`` virtual users
+(``user-000``... plus admins per ``--admin-ratio``), minted by the server's
+local issuer (``LOCAL_ISSUER_ENABLED=true``) or, with ``--key-file``, from
+the shared issuer key, so the JWT verification path is part of the
+measurement. Scenarios that need an account pick one the user may see
+(admins: any; users: those they created), from the admin's account list
+fetched once at startup. Users who own no accounts only run dashboard and
+list.
+
+Reports per-endpoint p50/p95/p99, throughput and error rates, plus how
+late the scheduler started sessions (``late`` p99 above a few ms means the
+generator itself, not the server, is the bottleneck).
+
+Usage:
+    python -m benchmarks.load_mix --base-url http://localhost:8000 --rps 50 --duration 60
+    python -m benchmarks.load_mix --mix dashboard=60,list=20,detail=20 --rps 200
+    python -m benchmarks.load_mix --key-file .local-issuer-key.pem --json results/load_mix.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+from benchmarks.api_endpoints import git_revision
+from benchmarks.stats import summarize
+
+DEFAULT_MIX = {"dashboard": 40, "list": 25, "detail": 25, "refresh": 5, "export": 5}
+ADMIN_SCENARIOS = {"refresh", "export"}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse scenario weights like 'dashboard=40,list=25'.
+
+    Raises:
+        ValueError: If a scenario is unknown or a weight is invalid
+    """
+    mix = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown scenario: {name}")
+        mix[name] = float(weight)
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight for {name}")
+    if not any(mix.values()):
+        raise ValueError("Mix has no positive weights")
+    return mix
+
+
+class Recorder:
+    """Per-endpoint latencies, errors and status codes."""
+
+    def __init__(self):
+        """Initialize recorder."""
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.late: List[float] = []
+        self.skipped = 0
+
+    async def call(self, endpoint: str, request: Awaitable[httpx.Response]) -> httpx.Response | None:
+        """Await one request and record it under ``endpoint``."""
+        start = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError as e:
+            self.latencies[endpoint].append(time.perf_counter() - start)
+            self.errors[endpoint] += 1
+            self.statuses[endpoint][type(e).__name__] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        self.statuses[endpoint][str(response.status_code)] += 1
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+        return response
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """Summaries per endpoint and overall."""
+        endpoints = {}
+        for endpoint in sorted(self.latencies):
+            result = summarize(self.latencies[endpoint], elapsed, self.errors[endpoint])
+            result["statuses"] = dict(self.statuses[endpoint])
+            endpoints[endpoint] = result
+        every = [value for values in self.latencies.values() for value in values]
+        late = summarize(self.late, elapsed)
+        return {
+            "overall": summarize(every, elapsed, sum(self.errors.values())),
+            "endpoints": endpoints,
+            "sessions": len(self.late),
+            "skipped_sessions": self.skipped,
+            "late_p50_ms": late["p50_ms"],
+            "late_p99_ms": late["p99_ms"],
+        }
+
+
+# ===================================================================
+# Tokens
+# ===================================================================
+
+
+def virtual_users(count: int, admin_ratio: float) -> List[Dict[str, Any]]:
+    """Deterministic virtual users; the first ``admin_ratio`` share are admins."""
+    admins = max(1, round(count * admin_ratio))
+    users = []
+    for index in range(count):
+        role = "admin" if index < admins else "user"
+        sub = f"loadtest-admin-{index:03d}" if role == "admin" else f"user-{index:03d}"
+        users.append({"sub": sub, "email": f"{sub}@example.com", "role": role})
+    return users
+
+
+async def mint_tokens(
+    client: httpx.AsyncClient, users: List[Dict[str, Any]], key_file: str | None, expires_in: int
+) -> None:
+    """Attach a signed ID token to every virtual user."""
+    if key_file:
+        from app.middleware.local_issuer import LocalIssuer
+
+        issuer = LocalIssuer(key_file=key_file)
+        for user in users:
+            user["token"] = issuer.mint(
+                sub=user["sub"], email=user["email"], role=user["role"], expires_in=expires_in
+            )
+        return
+
+    for user in users:
+        response = await client.post(
+            "/local-issuer/token",
+            json={
+                "sub": user["sub"],
+                "email": user["email"],
+                "role": user["role"],
+                "expires_in": expires_in,
+            },
+        )
+        if response.status_code == 404:
+            raise SystemExit("Local issuer not mounted: start the API with LOCAL_ISSUER_ENABLED=true")
+        response.raise_for_status()
+        user["token"] = response.json()["id_token"]
+
+
+# ===================================================================
+# Scenarios
+# ===================================================================
+
+
+def scenarios(
+    client: httpx.AsyncClient, recorder: Recorder, rng: random.Random
+) -> Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]]:
+    """Scenario coroutines per name, each taking the virtual user."""
+
+    def headers(user):
+        return {"Authorization": f"Bearer {user['token']}"}
+
+    async def dashboard(user):
+        await recorder.call("dashboard", client.get("/api/dashboard/stats", headers=headers(user)))
+
+    async def list_accounts(user):
+        await recorder.call("list", client.get("/api/accounts", headers=headers(user)))
+
+    async def detail(user):
+        account_id = rng.choice(user["accounts"])
+        base = f"/api/accounts/{account_id}"
+        response = await recorder.call("detail", client.get(base, headers=headers(user)))
+        if response is None or response.status_code >= 400:
+            return
+        await asyncio.gather(
+            recorder.call("billing", client.get(f"{base}/billing", headers=headers(user))),
+            recorder.call("quota", client.get(f"{base}/quota", headers=headers(user))),
+        )
+
+    async def refresh(user):
+        account_id = rng.choice(user["accounts"])
+        await recorder.call(
+            "refresh",
+            client.post(f"/api/accounts/{account_id}/quota/refresh", headers=headers(user)),
+        )
+
+    async def export(user):
+        account_id = rng.choice(user["accounts"])
+        await recorder.call(
+            "export", client.get(f"/api/accounts/{account_id}/credentials", headers=headers(user))
+        )
+
+    return {
+        "dashboard": dashboard,
+        "list": list_accounts,
+        "detail": detail,
+        "refresh": refresh,
+        "export": export,
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Generate load for ``args.duration`` seconds and summarize it."""
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        users = virtual_users(args.users, args.admin_ratio)
+        await mint_tokens(client, users, args.key_file, int(args.duration) + 3600)
+        admins = [user for user in users if user["role"] == "admin"]
+
+        response = await client.get(
+            "/api/accounts", headers={"Authorization": f"Bearer {admins[0]['token']}"}
+        )
+        response.raise_for_status()
+        accounts = response.json()
+        account_ids = [account["account_id"] for account in accounts]
+        owned = defaultdict(list)
+        for account in accounts:
+            owned[account.get("created_by")].append(account["account_id"])
+        for user in users:
+            user["accounts"] = account_ids if user["role"] == "admin" else owned[user["sub"]]
+        with_accounts = [user for user in users if user["accounts"]]
+
+        mix = dict(args.mix)
+        if not account_ids:
+            print("No accounts visible: detail, refresh and export are disabled")
+            for name in ("detail", "refresh", "export"):
+                mix.pop(name, None)
+        names = [name for name, weight in mix.items() if weight > 0]
+        weights = [mix[name] for name in names]
+        runners = scenarios(client, recorder, rng)
+
+        inflight: set = set()
+
+        async def session(name: str, user: Dict[str, Any]):
+            try:
+                await runners[name](user)
+            except Exception as e:  # keep the schedule going
+                recorder.errors[name] += 1
+                recorder.statuses[name][type(e).__name__] += 1
+
+        start = time.perf_counter()
+        scheduled = start
+        deadline = start + args.duration
+        while True:
+            scheduled += rng.expovariate(args.rps)
+            if scheduled >= deadline:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            recorder.late.append(max(0.0, time.perf_counter() - scheduled))
+
+            if len(inflight) >= args.max_inflight:
+                recorder.skipped += 1
+                continue
+            name = rng.choices(names, weights)[0]
+            if name in ADMIN_SCENARIOS:
+                user = rng.choice(admins)
+            elif name == "detail":
+                user = rng.choice(with_accounts)
+            else:
+                user = rng.choice(users)
+            task = asyncio.create_task(session(name, user))
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+
+        if inflight:
+            await asyncio.wait(inflight, timeout=args.timeout)
+        elapsed = time.perf_counter() - start
+
+    report = recorder.report(elapsed)
+    report.update(
+        {
+            "target_rps": args.rps,
+            "achieved_session_rps": round(len(recorder.late) / args.duration, 1),
+            "duration": args.duration,
+            "mix": mix,
+            "accounts": len(account_ids),
+        }
+    )
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """Print the per-endpoint table."""
+    print(
+        f"\n{report['sessions']} sessions at {report['achieved_session_rps']}/s "
+        f"(target {report['target_rps']}/s, {report['skipped_sessions']} skipped, "
+        f"scheduler late p99={report['late_p99_ms']}ms)\n"
+    )
+    print(
+        f"{'endpoint':<10} {'n':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'max ms':>9} {'err %':>6}  statuses"
+    )
+    rows = list(report["endpoints"].items()) + [("overall", report["overall"])]
+    for name, r in rows:
+        statuses = " ".join(f"{k}:{v}" for k, v in sorted(r.get("statuses", {}).items()))
+        print(
+            f"{name:<10} {r['requests']:>7} {r['rps']:>8.1f} {r['p50_ms']:>9.1f} "
+            f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['max_ms']:>9.1f} "
+            f"{r['error_rate'] * 100:>6.2f}  {statuses}"
+        )
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--rps", type=float, default=20.0, help="Target session arrivals per second")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds of load")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+        help="Scenario weights",
+    )
+    parser.add_argument("--users", type=int, default=20, help="Virtual users")
+    parser.add_argument("--admin-ratio", type=float, default=0.2)
+    parser.add_argument("--key-file", help="Mint tokens from this local issuer key instead of the server")
+    parser.add_argument("--max-inflight", type=int, default=1000, help="Skip arrivals beyond this backlog")
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    try:
+        args.mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.rps <= 0:
+        parser.error("--rps must be positive")
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.json_path:
+        report.update(
+            {
+                "revision": git_revision(),
+                "timestamp": int(time.time()),
+                "python": platform.python_version(),
+                "base_url": args.base_url,
+            }
+        )
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
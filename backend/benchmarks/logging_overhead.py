@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Logging overhead per request, as seen by the request thread.
+
+Replays the log calls of a typical request (auth, quota config lookup with
+its DEBUG dump of the DynamoDB response, AWS quota calls, audit log, the
+request summary line) at LOG_LEVEL=INFO against four setups:
+
+- before: synchronous StreamHandler, eager f-strings (previous behaviour)
+- lazy: synchronous StreamHandler, %-style arguments
+- queue: QueueHandler/QueueListener, %-style arguments (current behaviour)
+- queue+json: as queue, with the JSON formatter
+
+Only the time spent in the calling thread is measured; that is what blocks
+the event loop. ``--write-delay-us`` simulates a slow stdout (a pipe to a
+log collector under back-pressure) by sleeping in every write. With an
+instant sink the queue mostly adds GIL hand-offs to the listener thread
+(visible at p99); it pays off once writes can block.
+
+Usage:
+    python -m benchmarks.logging_overhead
+    python -m benchmarks.logging_overhead --requests 20000 --write-delay-us 50
+    python -m benchmarks.logging_overhead --json results/logging_overhead.json
+"""
+import argparse
+import io
+import json
+import logging
+import logging.handlers
+import queue
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict
+
+from app.core.logging import DroppingQueueHandler, JsonFormatter
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class SlowSink(io.TextIOBase):
+    """Discarding stream that sleeps on every write."""
+
+    def __init__(self, delay: float):
+        """Initialize sink."""
+        self.delay = delay
+
+    def write(self, s: str) -> int:
+        """Discard a write after the configured delay."""
+        if self.delay:
+            time.sleep(self.delay)
+        return len(s)
+
+
+def quota_response() -> Dict[str, Any]:
+    """DynamoDB GetItem response shaped like the quota config item."""
+    return {
+        "Item": {
+            "config_id": "global-quota-config",
+            "models": [
+                {
+                    "model_id": f"anthropic.claude-model-{i}-v1:0",
+                    "model_name": f"Claude Model {i}",
+                    "quota_code": f"L-{i:08X}",
+                    "quota_code_1m": f"L-{i + 100:08X}",
+                    "enabled": True,
+                }
+                for i in range(12)
+            ],
+            "updated_at": 1760000000,
+            "updated_by": "8a7b6c5d-1234-4e56-9abc-def012345678",
+        },
+        "ResponseMetadata": {"RequestId": "X" * 52, "HTTPStatusCode": 200, "RetryAttempts": 0},
+    }
+
+
+def eager_request(logger: logging.Logger, ctx: Dict[str, Any]):
+    """Log calls of one request, formatted eagerly."""
+    logger.debug(f"Authenticated user: {ctx['user_id']} (role: {ctx['role']})")
+    logger.debug(f"[get_config] Querying table: {ctx['table']}, key: global-quota-config")
+    logger.debug(f"[get_config] DynamoDB response: {ctx['response']}")
+    logger.info(f"[get_config] Retrieved quota configuration with {len(ctx['response']['Item']['models'])} models")
+    logger.info(f"Refreshing Bedrock quota for account: {ctx['account_id']}")
+    for model in ctx["response"]["Item"]["models"]:
+        logger.debug(f"✓ Retrieved {model['model_id']} TPM quota: 400000")
+    logger.info(f"Audit log: refresh_quota on account:{ctx['account_id']} by {ctx['user_id']}")
+    logger.info(
+        f"request method=POST path=/api/accounts/{ctx['account_id']}/refresh-quota "
+        f"status=200 duration_ms={ctx['duration'] * 1000:.1f} aws_calls=14 aws_ms=212.4"
+    )
+
+
+def lazy_request(logger: logging.Logger, ctx: Dict[str, Any]):
+    """Log calls of one request, with %-style arguments."""
+    logger.debug("Authenticated user: %s (role: %s)", ctx["user_id"], ctx["role"])
+    logger.debug("[get_config] Querying table: %s, key: global-quota-config", ctx["table"])
+    logger.debug("[get_config] DynamoDB response: %s", ctx["response"])
+    logger.info(
+        "[get_config] Retrieved quota configuration with %s models",
+        len(ctx["response"]["Item"]["models"]),
+    )
+    logger.info("Refreshing Bedrock quota for account: %s", ctx["account_id"])
+    for model in ctx["response"]["Item"]["models"]:
+        logger.debug("✓ Retrieved %s TPM quota: %s", model["model_id"], 400000)
+    logger.info(
+        "Audit log: %s on %s:%s by %s", "refresh_quota", "account", ctx["account_id"], ctx["user_id"]
+    )
+    logger.info(
+        "request method=%s path=%s status=%s duration_ms=%.1f aws_calls=%d aws_ms=%.1f",
+        "POST",
+        f"/api/accounts/{ctx['account_id']}/refresh-quota",
+        200,
+        ctx["duration"] * 1000,
+        14,
+        212.4,
+    )
+
+
+def make_logger(name: str, queued: bool, formatter: logging.Formatter, sink: io.TextIOBase):
+    """Build an isolated INFO logger; returns (logger, listener or None)."""
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(formatter)
+    logger = logging.getLogger(f"benchmark.logging.{name}")
+    logger.handlers.clear()
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    if not queued:
+        logger.addHandler(handler)
+        return logger, None
+
+    queue_handler = DroppingQueueHandler(queue.Queue(100_000))
+    listener = logging.handlers.QueueListener(queue_handler.queue, handler)
+    listener.start()
+    logger.addHandler(queue_handler)
+    return logger, listener
+
+
+def run(
+    name: str,
+    request: Callable[[logging.Logger, Dict[str, Any]], None],
+    queued: bool,
+    formatter: logging.Formatter,
+    requests: int,
+    delay: float,
+) -> Dict[str, Any]:
+    """Time the log calls of ``requests`` requests for one setup."""
+    logger, listener = make_logger(name, queued, formatter, SlowSink(delay))
+    ctx = {
+        "user_id": "8a7b6c5d-1234-4e56-9abc-def012345678",
+        "role": "admin",
+        "table": "account-platform-quota-config",
+        "account_id": "123456789012",
+        "response": quota_response(),
+        "duration": 0.2431,
+    }
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        request(logger, ctx)
+        samples.append(time.perf_counter() - start)
+
+        # Let the listener keep up, as it would between real requests
+        if listener is not None and delay:
+            time.sleep(delay * 4)
+
+    if listener is not None:
+        listener.stop()
+
+    samples.sort()
+    return {
+        "setup": name,
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument(
+        "--write-delay-us", type=float, default=0.0, help="Simulated stdout latency per write"
+    )
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    args = parser.parse_args()
+
+    delay = args.write_delay_us / 1e6
+    text = logging.Formatter(TEXT_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+    setups = [
+        ("before", eager_request, False, text),
+        ("lazy", lazy_request, False, text),
+        ("queue", lazy_request, True, text),
+        ("queue+json", lazy_request, True, JsonFormatter()),
+    ]
+    results = [run(*setup, args.requests, delay) for setup in setups]
+
+    print(
+        f"Logging time per request in the calling thread "
+        f"({args.requests} requests, LOG_LEVEL=INFO, write delay {args.write_delay_us}us)\n"
+    )
+    print(f"{'setup':<12} {'mean us':>9} {'p50 us':>9} {'p99 us':>9}")
+    for r in results:
+        print(f"{r['setup']:<12} {r['mean_us']:>9.1f} {r['p50_us']:>9.1f} {r['p99_us']:>9.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                {"requests": args.requests, "write_delay_us": args.write_delay_us, "results": results},
+                f,
+                indent=2,
+            )
+        print(f"\nResults written to {args.json_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Latency summary helpers shared by the benchmarks.
+"""
+import math
+import statistics
+from typing import Any, Dict, List, Sequence
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        q: Percentile (0-100)
+
+    Returns:
+        The percentile, or 0.0 for no values
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """
+    Summarize request latencies.
+
+    Args:
+        latencies: Request latencies in seconds
+        elapsed: Wall-clock seconds the requests took
+        errors: Failed requests (included in latencies)
+
+    Returns:
+        Dict with requests, errors, throughput and p50/p95/p99/mean/max in ms
+    """
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "error_rate": round(errors / len(values), 4) if values else 0.0,
+        "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(values) * 1000, 2) if values else 0.0,
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+    }
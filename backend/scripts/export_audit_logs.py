@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Export audit logs as NDJSON straight from DynamoDB.
+
+Reads partitions concurrently and writes one JSON object per line, with a
+{"_checkpoint": ...} line after every page. To continue an interrupted
+export, pass the last checkpoint token with --resume (filters are taken
+from the token).
+
+Usage:
+    python scripts/export_audit_logs.py --start 2025-01-01 --end 2025-03-31 -o audit.ndjson
+    python scripts/export_audit_logs.py --resource-id 123456789012 --gzip -o history.ndjson.gz
+    python scripts/export_audit_logs.py --resume <token> -o audit-rest.ndjson
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.db.dynamodb import DynamoDBClient
+from app.db.models import AuditLogManager
+from app.services.audit_export import AuditLogExporter
+
+
+def parse_time(value: str) -> int:
+    """Parse epoch seconds or an ISO 8601 date/datetime (UTC if naive)."""
+    if value.isdigit():
+        return int(value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Export audit logs as NDJSON")
+    parser.add_argument("--user-id", help="Filter by acting user")
+    parser.add_argument("--action", help="Filter by action type")
+    parser.add_argument("--resource-id", help="Filter by resource ID")
+    parser.add_argument("--start", type=parse_time, help="Inclusive start (ISO 8601 or epoch)")
+    parser.add_argument("--end", type=parse_time, help="Inclusive end (ISO 8601 or epoch)")
+    parser.add_argument("--partitions", type=int, help="Time slices / scan segments")
+    parser.add_argument("--concurrency", type=int, help="Parallel readers")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the output")
+    parser.add_argument("--resume", help="Checkpoint token to continue from")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    exporter = AuditLogExporter(
+        AuditLogManager(DynamoDBClient()),
+        partitions=args.partitions,
+        concurrency=args.concurrency,
+    )
+
+    try:
+        stream = exporter.export(
+            resume=args.resume,
+            compress=args.gzip,
+            user_id=args.user_id,
+            action=args.action,
+            resource_id=args.resource_id,
+            start_time=args.start,
+            end_time=args.end,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in stream:
+            out.write(chunk)
+        out.flush()
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
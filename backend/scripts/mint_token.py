@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Mint a signed ID token from the local issuer (load testing only).
+
+The server must run with LOCAL_ISSUER_ENABLED=true and share the same
+LOCAL_ISSUER_KEY_FILE (default: .local-issuer-key.pem in the backend dir).
+
+Usage: python scripts/mint_token.py [--sub ID] [--email EMAIL] [--role admin|user] [--expires-in SECONDS]
+"""
+import argparse
+import os
+import sys
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.middleware.local_issuer import LocalIssuer
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Mint a local issuer ID token")
+    parser.add_argument("--sub", default="loadtest-admin", help="User ID (sub claim)")
+    parser.add_argument("--email", default="loadtest-admin@example.com", help="User email")
+    parser.add_argument("--role", default="admin", choices=["admin", "user"], help="custom:role claim")
+    parser.add_argument("--expires-in", type=int, default=3600, help="Token lifetime in seconds")
+    args = parser.parse_args()
+
+    issuer = LocalIssuer()
+    token = issuer.mint(
+        sub=args.sub,
+        email=args.email,
+        role=args.role,
+        expires_in=args.expires_in,
+    )
+    print(token)
+
+
+if __name__ == '__main__':
+    main()
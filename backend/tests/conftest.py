@@ -0,0 +1,17 @@
+"""
+Shared test configuration.
+
+Settings are read when ``app`` is first imported, so the test environment
+is set here, before any test module imports the app.
+"""
+import os
+
+os.environ.update(
+    ENVIRONMENT="development",
+    LOG_LEVEL="WARNING",
+    AUDIT_BUFFER_ENABLED="false",
+    AWS_ACCESS_KEY_ID="testing",
+    AWS_SECRET_ACCESS_KEY="testing",
+    AWS_DEFAULT_REGION="us-east-1",
+    AWS_REGION="us-east-1",
+)
@@ -0,0 +1,95 @@
+"""
+Account inventory export streams.
+"""
+import csv
+import io
+import json
+
+import pytest
+
+from app.core.exceptions import AWSServiceException
+from app.db.memory import InMemoryAccountRepository, MemoryStore
+from app.services.account_export import AccountInventoryExporter
+
+MODELS = [
+    {"model_id": "claude-x", "enabled": True, "has_1m_context": True},
+    {"model_id": "claude.y", "enabled": False},
+]
+
+
+class FailingRepository(InMemoryAccountRepository):
+    """Memory repository whose reads fail from the ``fail_at``-th page on."""
+
+    def __init__(self, store: MemoryStore, fail_at: int):
+        super().__init__(store)
+        self.fail_at = fail_at
+        self.reads = 0
+
+    def read_accounts_page(self, *args, **kwargs):
+        self.reads += 1
+        if self.reads >= self.fail_at:
+            raise AWSServiceException("DynamoDB unavailable")
+        return super().read_accounts_page(*args, **kwargs)
+
+
+def fill(repository, count: int):
+    for index in range(count):
+        repository._put_account(
+            {
+                "account_id": f"{100000000000 + index}",
+                "account_name": "=cmd()" if index == 0 else f"account-{index}",
+                "created_by": "user-a",
+                "billing_address": {"country": "US"},
+                "bedrock_quota": {"claude_x_tpm": index, "claude_x_1m_tpm": 2 * index},
+            }
+        )
+    return repository
+
+
+def test_ndjson_rows_and_columns():
+    exporter = AccountInventoryExporter(fill(InMemoryAccountRepository(MemoryStore()), 7), MODELS, 3)
+
+    chunks = list(exporter.export("ndjson", "admin-1", "admin"))
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    assert len(chunks) == 3
+    assert len(rows) == 7
+    assert list(rows[0])[-2:] == ["claude_x_tpm", "claude_x_1m_tpm"]
+    assert {row["billing_country"] for row in rows} == {"US"}
+
+
+def test_csv_escapes_formulas_and_keeps_header_when_empty():
+    exporter = AccountInventoryExporter(fill(InMemoryAccountRepository(MemoryStore()), 2), MODELS, 5)
+
+    table = list(csv.reader(io.StringIO(b"".join(exporter.export("csv", "x", "admin")).decode())))
+    empty = b"".join(exporter.export("csv", "nobody", "user")).decode()
+
+    assert table[0][0] == "account_id" and len(table) == 3
+    assert "'=cmd()" in [row[1] for row in table]
+    assert empty.splitlines() == [",".join(exporter.columns)]
+
+
+def test_first_page_is_read_before_streaming():
+    repository = fill(FailingRepository(MemoryStore(), fail_at=1), 5)
+    exporter = AccountInventoryExporter(repository, MODELS, 2)
+
+    with pytest.raises(AWSServiceException):
+        exporter.export("csv", "admin-1", "admin")
+
+
+def test_mid_stream_failure_aborts_the_stream():
+    repository = fill(FailingRepository(MemoryStore(), fail_at=2), 5)
+    stream = AccountInventoryExporter(repository, MODELS, 2).export("ndjson", "admin-1", "admin")
+
+    first = next(stream)
+    with pytest.raises(AWSServiceException):
+        next(stream)
+
+    assert len(first.splitlines()) == 2
+
+
+def test_unknown_format():
+    exporter = AccountInventoryExporter(InMemoryAccountRepository(MemoryStore()), MODELS)
+
+    with pytest.raises(ValueError):
+        exporter.export("xml", "admin-1", "admin")
@@ -0,0 +1,85 @@
+"""
+Buffered audit log writer (app.db.audit_writer) on moto.
+"""
+import threading
+from uuid import uuid4
+
+import pytest
+from moto import mock_aws
+
+from app.db.audit_writer import AuditLogWriter
+
+NOW = 1760000000
+
+
+@pytest.fixture
+def dynamodb_client():
+    with mock_aws():
+        from app.db.dynamodb import DynamoDBClient
+
+        client = DynamoDBClient()
+        client.create_tables()
+        yield client
+
+
+def audit_item() -> dict:
+    return {"log_id": str(uuid4()), "timestamp": NOW, "user_id": "user-a", "action": "test"}
+
+
+def written_ids(dynamodb_client) -> set:
+    table = dynamodb_client.dynamodb.Table(dynamodb_client.audit_logs_table_name)
+    response = table.scan()
+    items = response["Items"]
+    while "LastEvaluatedKey" in response:
+        response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
+        items.extend(response["Items"])
+    return {item["log_id"] for item in items}
+
+
+def test_stop_flushes_queued_items(dynamodb_client):
+    writer = AuditLogWriter(dynamodb_client, flush_interval=60)
+    writer.start()
+    items = [audit_item() for _ in range(60)]
+
+    assert all(writer.submit(item) for item in items)
+    writer.stop()
+
+    assert written_ids(dynamodb_client) == {item["log_id"] for item in items}
+    assert not writer.submit(audit_item())
+
+
+def test_submit_refused_before_start_and_when_full(dynamodb_client):
+    writer = AuditLogWriter(dynamodb_client, max_queue_size=1)
+
+    assert not writer.submit(audit_item())
+
+    writer._thread = threading.current_thread()  # accept without consuming
+    assert writer.submit(audit_item())
+    assert not writer.submit(audit_item())
+
+
+def test_items_accepted_during_stop_are_written(dynamodb_client):
+    writer = AuditLogWriter(dynamodb_client, flush_interval=0.01)
+    writer.start()
+    accepted, lock = [], threading.Lock()
+    flowing = threading.Event()
+
+    def submitter():
+        for _ in range(100):
+            item = audit_item()
+            if not writer.submit(item):
+                return
+            with lock:
+                accepted.append(item["log_id"])
+                if len(accepted) >= 100:
+                    flowing.set()
+
+    threads = [threading.Thread(target=submitter) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    assert flowing.wait(timeout=10)
+    writer.stop()
+    for thread in threads:
+        thread.join()
+
+    assert written_ids(dynamodb_client) == set(accepted)
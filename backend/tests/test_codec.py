@@ -0,0 +1,119 @@
+"""
+Wire-format codec (app.db.codec) against boto3's own type (de)serializers.
+"""
+from decimal import Decimal
+
+import pytest
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
+
+from app.db.codec import (
+    deserialize_account,
+    deserialize_item,
+    deserialize_value,
+    plain_numbers,
+    serialize_item,
+    serialize_value,
+)
+from app.db.records import AccountRecord
+
+VALUES = [
+    "text",
+    "",
+    42,
+    -7,
+    Decimal("1.5"),
+    Decimal("1E+3"),
+    True,
+    False,
+    None,
+    [1, "a", None, [Decimal("0.25")]],
+    {"country": "US", "nested": {"tpm": 200000, "flags": [True]}},
+    {"a", "b"},
+    {1, 2, 3},
+    Binary(b"\x00\x01"),
+    {Binary(b"x"), Binary(b"y")},
+]
+
+
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_serialize_matches_boto3(value):
+    assert _normalized(serialize_value(value)) == _normalized(TypeSerializer().serialize(value))
+
+
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_deserialize_matches_boto3_up_to_int_numbers(value):
+    wire = TypeSerializer().serialize(value)
+
+    assert deserialize_value(wire) == TypeDeserializer().deserialize(wire)
+    assert plain_numbers(deserialize_value(wire)) == plain_numbers(
+        TypeDeserializer().deserialize(wire)
+    )
+
+
+def test_integral_numbers_decode_to_int():
+    assert type(deserialize_value({"N": "1760000000"})) is int
+    assert deserialize_value({"N": "1.5"}) == Decimal("1.5")
+    assert type(deserialize_value({"N": "1E+3"})) is Decimal
+
+
+def test_float_rejected():
+    with pytest.raises(TypeError):
+        serialize_value(1.5)
+    with pytest.raises(TypeError):
+        serialize_item({"quota": {"tpm": 0.5}})
+
+
+def test_unknown_type_descriptor():
+    with pytest.raises(TypeError):
+        deserialize_value({"X": "?"})
+    with pytest.raises(TypeError):
+        deserialize_value({})
+
+
+def test_deserialize_item_skips_attributes():
+    item = serialize_item({"account_id": "1", "secret_key_encrypted": "x", "n": 3})
+
+    assert deserialize_item(item, skip={"secret_key_encrypted"}) == {"account_id": "1", "n": 3}
+    assert deserialize_item(item)["secret_key_encrypted"] == "x"
+
+
+def test_deserialize_account_sets_only_present_fields():
+    record = deserialize_account(
+        serialize_item(
+            {
+                "account_id": "100000000001",
+                "created_at": 1760000000,
+                "bedrock_quota": {"tpm": 200000},
+                "secret_key_encrypted": "x",
+            }
+        )
+    )
+
+    assert isinstance(record, AccountRecord)
+    assert record["account_id"] == "100000000001"
+    assert record["bedrock_quota"] == {"tpm": 200000}
+    assert record.get("billing_address") is None
+    with pytest.raises(KeyError):
+        record["billing_address"]
+    assert "secret_key_encrypted" not in record.to_dict()
+
+
+def test_plain_numbers():
+    value = {"a": Decimal("5"), "b": [Decimal("2.5"), "x"], "c": {"d": Decimal("0")}}
+
+    converted = plain_numbers(value)
+
+    assert converted == {"a": 5, "b": [Decimal("2.5"), "x"], "c": {"d": 0}}
+    assert type(converted["a"]) is int and type(converted["c"]["d"]) is int
+
+
+def _normalized(wire):
+    """Make set-typed wire values order-independent."""
+    (type_code, data), = wire.items()
+    if type_code in ("SS", "NS", "BS"):
+        return {type_code: sorted(data)}
+    if type_code == "M":
+        return {"M": {key: _normalized(item) for key, item in data.items()}}
+    if type_code == "L":
+        return {"L": [_normalized(item) for item in data]}
+    return wire
@@ -0,0 +1,33 @@
+"""
+Settings guards for test-only switches.
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"AWS_API_ENDPOINT_URL": "http://localhost:8002"},
+        {"STORAGE_BACKEND": "memory"},
+        {"LOCAL_ISSUER_ENABLED": True},
+    ],
+)
+def test_rejects_test_switches_in_production(overrides):
+    with pytest.raises(ValidationError):
+        Settings(ENVIRONMENT="production", **overrides)
+
+
+def test_local_issuer_only_in_development():
+    with pytest.raises(ValidationError):
+        Settings(ENVIRONMENT="staging", LOCAL_ISSUER_ENABLED=True)
+
+    assert Settings(ENVIRONMENT="development", LOCAL_ISSUER_ENABLED=True).local_issuer_enabled
+
+
+def test_aws_api_endpoint_allowed_outside_production():
+    settings = Settings(ENVIRONMENT="staging", AWS_API_ENDPOINT_URL="http://localhost:8002")
+
+    assert settings.aws_api_endpoint_url == "http://localhost:8002"
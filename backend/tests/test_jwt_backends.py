@@ -0,0 +1,192 @@
+"""
+JWT backend conformance.
+
+Every backend in ``app.middleware.jwt_backends`` must accept a valid Cognito
+ID token and reject every malformed, expired, mis-issued or forged one when
+used through ``CognitoJWTValidator`` (token cache disabled).
+"""
+import base64
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+from cryptography.hazmat.primitives import hashes, hmac, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from fastapi import HTTPException
+
+from app.middleware.cognito_auth import CognitoJWTValidator
+from app.middleware.jwks import JWKSProvider
+from app.middleware.jwt_backends import BACKENDS, get_jwt_backend
+from app.middleware.local_issuer import LocalIssuer
+from app.middleware.token_cache import VerifiedTokenCache
+
+ISSUER = "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_conformance"
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def mint(
+    claims: Dict[str, Any],
+    private_key: rsa.RSAPrivateKey,
+    kid: Optional[str],
+    alg: str = "RS256",
+    hmac_secret: bytes = b"",
+) -> str:
+    """
+    Sign a token (RS256, HS256 or none) with an arbitrary header.
+
+    LocalIssuer.mint only produces well-formed tokens; the cases below also
+    need malformed ones.
+    """
+    header: Dict[str, Any] = {"alg": alg, "typ": "JWT"}
+    if kid is not None:
+        header["kid"] = kid
+
+    signing_input = (
+        _b64(json.dumps(header, separators=(",", ":")).encode())
+        + "."
+        + _b64(json.dumps(claims, separators=(",", ":")).encode())
+    )
+
+    if alg == "RS256":
+        signature = private_key.sign(
+            signing_input.encode(), padding.PKCS1v15(), hashes.SHA256()
+        )
+    elif alg == "HS256":
+        mac = hmac.HMAC(hmac_secret, hashes.SHA256())
+        mac.update(signing_input.encode())
+        signature = mac.finalize()
+    else:
+        signature = b""
+
+    return f"{signing_input}.{_b64(signature)}"
+
+
+def claims(**overrides: Any) -> Dict[str, Any]:
+    now = int(time.time())
+    data = {
+        "sub": "conformance-user",
+        "email": "conformance@example.com",
+        "custom:role": "admin",
+        "token_use": "id",
+        "iss": ISSUER,
+        "iat": now,
+        "exp": now + 3600,
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture(scope="module")
+def issuer() -> LocalIssuer:
+    """Issuer whose key is in the validator's JWKS (in-memory key)."""
+    return LocalIssuer(issuer=ISSUER, key_file="")
+
+
+@pytest.fixture(scope="module")
+def other_issuer() -> LocalIssuer:
+    """Issuer with a different key."""
+    return LocalIssuer(issuer=ISSUER, key_file="")
+
+
+@pytest.fixture
+def jwks_fetches(monkeypatch) -> List[str]:
+    """URLs the JWKS provider tried to fetch (fetching is stubbed out)."""
+    fetches = []
+
+    async def fetch(self):
+        fetches.append(self.jwks_url)
+        return False
+
+    monkeypatch.setattr(JWKSProvider, "_fetch", fetch)
+    return fetches
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def validator(request, issuer, jwks_fetches) -> CognitoJWTValidator:
+    """Validator on each backend, bound to the issuer's JWKS."""
+    try:
+        backend = get_jwt_backend(request.param)
+    except ImportError as e:
+        pytest.skip(f"{request.param} not installed: {e}")
+
+    validator = CognitoJWTValidator()
+    validator.issuer = ISSUER
+    validator.backend = backend
+    validator.token_cache = VerifiedTokenCache(maxsize=0)
+    validator.jwks_provider.load(issuer.jwks)
+    return validator
+
+
+def _tampered_signature(token: str) -> str:
+    header, payload, signature = token.split(".")
+    flipped = signature[:-2] + ("A" if signature[-2] != "A" else "B") + signature[-1]
+    return f"{header}.{payload}.{flipped}"
+
+
+def _tampered_payload(token: str) -> str:
+    header, _, signature = token.split(".")
+    forged = _b64(json.dumps(claims(**{"custom:role": "superadmin"})).encode())
+    return f"{header}.{forged}.{signature}"
+
+
+def _public_pem(issuer: LocalIssuer) -> bytes:
+    return issuer.private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+
+REJECTED = {
+    "expired": lambda i, o: mint(claims(exp=int(time.time()) - 60), i.private_key, i.kid),
+    "wrong issuer": lambda i, o: mint(
+        claims(iss="https://evil.example.com/pool"), i.private_key, i.kid
+    ),
+    "missing issuer": lambda i, o: mint(
+        {k: v for k, v in claims().items() if k != "iss"}, i.private_key, i.kid
+    ),
+    "unknown kid": lambda i, o: mint(claims(), i.private_key, kid="rotated-away"),
+    "missing kid": lambda i, o: mint(claims(), i.private_key, kid=None),
+    "tampered signature": lambda i, o: _tampered_signature(
+        i.mint(sub="conformance-user", email="conformance@example.com", role="admin")
+    ),
+    "tampered payload": lambda i, o: _tampered_payload(
+        i.mint(sub="conformance-user", email="conformance@example.com", role="admin")
+    ),
+    "signed by other key": lambda i, o: mint(claims(), o.private_key, i.kid),
+    "alg none": lambda i, o: mint(claims(), i.private_key, i.kid, alg="none"),
+    "alg confusion HS256": lambda i, o: mint(
+        claims(), i.private_key, i.kid, alg="HS256", hmac_secret=_public_pem(i)
+    ),
+    "garbage": lambda i, o: "not.a.jwt",
+}
+
+
+async def test_accepts_valid_token(validator, issuer):
+    token = issuer.mint(sub="conformance-user", email="conformance@example.com", role="admin")
+
+    payload = await validator.validate_token(token)
+
+    assert payload["sub"] == "conformance-user"
+    assert payload["custom:role"] == "admin"
+
+
+@pytest.mark.parametrize("case", sorted(REJECTED))
+async def test_rejects_bad_token(validator, issuer, other_issuer, case):
+    token = REJECTED[case](issuer, other_issuer)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validator.validate_token(token)
+
+    assert exc_info.value.status_code == 401
+
+
+async def test_unknown_kid_does_not_refetch_loaded_keys(validator, issuer, jwks_fetches):
+    token = mint(claims(), issuer.private_key, kid="rotated-away")
+
+    with pytest.raises(HTTPException):
+        await validator.validate_token(token)
+
+    assert jwks_fetches == []
@@ -0,0 +1,256 @@
+"""
+Repository behaviour on both storage backends.
+
+The same cases run against the DynamoDB repositories (on moto) and the
+in-memory backend, so the memory backend stays a faithful stand-in for CI
+and benchmarks: pagination, GSI queries with sort key bounds, cursors and
+parallel scan segments.
+"""
+from uuid import uuid4
+
+import pytest
+from moto import mock_aws
+
+from app.db.memory import (
+    InMemoryAccountRepository,
+    InMemoryAuditLogRepository,
+    MemoryStore,
+)
+from app.db.records import AccountRecord
+
+NOW = 1760000000
+USERS = ["user-a", "user-b", "user-c"]
+
+
+@pytest.fixture(params=["dynamodb", "memory"])
+def repositories(request):
+    """(account repository, audit log repository) for each backend."""
+    if request.param == "memory":
+        store = MemoryStore()
+        yield InMemoryAccountRepository(store), InMemoryAuditLogRepository(store)
+        return
+
+    with mock_aws():
+        from app.db.dynamodb import DynamoDBClient
+        from app.db.models import AuditLogManager, AWSAccountManager
+
+        client = DynamoDBClient()
+        client.create_tables()
+        yield AWSAccountManager(client), AuditLogManager(client)
+
+
+def account_item(index: int) -> dict:
+    return {
+        "account_id": f"{100000000000 + index}",
+        "account_name": f"account-{index}",
+        "account_email": f"ops+{index}@example.com",
+        "region": "us-east-1",
+        "status": "active",
+        "created_by": USERS[index % len(USERS)],
+        "created_at": NOW + index,
+        "updated_at": NOW + index,
+        "billing_address": {"country": "US", "postal_code": f"{10000 + index}"},
+        "bedrock_quota": {"claude_tpm": 200000 + index, "last_checked": NOW},
+        "access_key_encrypted": "ZW5jcnlwdGVk",
+        "secret_key_encrypted": "ZW5jcnlwdGVk",
+        "encryption_key_id": "mock-key",
+    }
+
+
+def audit_item(index: int, timestamp: int, user_id: str, resource_id: str, action: str) -> dict:
+    return {
+        "log_id": str(uuid4()),
+        "timestamp": timestamp,
+        "user_id": user_id,
+        "action": action,
+        "resource_type": "account",
+        "resource_id": resource_id,
+        "details": {"index": index},
+        "ip_address": "",
+        "user_agent": "",
+        "status": "success",
+        "ttl": timestamp + 86400,
+    }
+
+
+@pytest.fixture
+def accounts(repositories):
+    account_repo, _ = repositories
+    for index in range(25):
+        account_repo._put_account(account_item(index))
+    return account_repo
+
+
+@pytest.fixture
+def audit_logs(repositories):
+    _, audit_repo = repositories
+    for index in range(40):
+        audit_repo._store(
+            audit_item(
+                index,
+                NOW + index,
+                user_id=USERS[index % 2],
+                resource_id=f"res-{index % 4}",
+                action="refresh_quota" if index % 3 else "create_account",
+            ),
+            must_persist=True,
+        )
+    return audit_repo
+
+
+def read_all_pages(read_page, limit):
+    """Follow LastEvaluatedKeys to the end; returns the list of pages."""
+    pages, start_key = [], None
+    while True:
+        records, start_key = read_page(limit=limit, start_key=start_key)
+        pages.append(records)
+        if start_key is None:
+            return pages
+
+
+def test_get_account_drops_credentials_and_returns_ints(accounts):
+    account = accounts.get_account("100000000003")
+
+    assert account["account_name"] == "account-3"
+    assert "access_key_encrypted" not in account
+    assert account["created_at"] == NOW + 3 and type(account["created_at"]) is int
+    assert account["bedrock_quota"]["claude_tpm"] == 200003
+    assert accounts.get_account("999999999999") is None
+
+
+def test_account_credentials(accounts):
+    credentials = accounts.get_account_credentials("100000000003")
+
+    assert credentials["access_key_encrypted"] == "ZW5jcnlwdGVk"
+    assert credentials["encryption_key_id"] == "mock-key"
+    assert accounts.get_account_credentials("999999999999") is None
+
+
+def test_list_accounts_admin_and_user(accounts):
+    everything = accounts.list_accounts(user_role="admin")
+    own = accounts.list_accounts("user-b", "user")
+
+    assert len(everything) == 25
+    assert all(isinstance(record, AccountRecord) for record in everything)
+    assert {record["account_id"] for record in own} == {
+        item["account_id"] for item in map(account_item, range(25)) if item["created_by"] == "user-b"
+    }
+    assert accounts.list_accounts(None, "user") == []
+
+
+@pytest.mark.parametrize("limit", [4, 5])
+@pytest.mark.parametrize("role,user_id,expected", [("admin", None, 25), ("user", "user-a", 9)])
+def test_read_accounts_page_follows_last_key(accounts, role, user_id, expected, limit):
+    pages = read_all_pages(
+        lambda **kwargs: accounts.read_accounts_page(user_id, role, **kwargs), limit=limit
+    )
+    ids = [record["account_id"] for page in pages for record in page]
+
+    assert len(ids) == expected
+    assert len(set(ids)) == expected
+    assert all(len(page) <= limit for page in pages)
+    # Ending exactly at Limit may still return a key, then an empty page
+    assert -(-expected // limit) <= len(pages) <= expected // limit + 1
+
+
+def test_iter_account_pages_matches_list(accounts):
+    pages = list(accounts.iter_account_pages("user-c", "user", page_size=3))
+
+    assert {r["account_id"] for page in pages for r in page} == {
+        r["account_id"] for r in accounts.list_accounts("user-c", "user")
+    }
+
+
+def test_billing_update_returns_previous(accounts):
+    previous = accounts.update_billing_address("100000000003", {"country": "DE"})
+
+    assert previous == {"country": "US", "postal_code": "10003"}
+    assert accounts.get_account("100000000003")["billing_address"] == {"country": "DE"}
+
+
+def test_delete_deactivates(accounts):
+    assert accounts.delete_account("100000000004")
+
+    assert accounts.get_account("100000000004")["status"] == "inactive"
+
+
+def test_user_index_bounds_newest_first(audit_logs):
+    items, cursor = audit_logs.query_logs(
+        user_id="user-a", start_time=NOW + 10, end_time=NOW + 20, limit=100
+    )
+
+    assert [item["timestamp"] for item in items] == [NOW + t for t in (20, 18, 16, 14, 12, 10)]
+    assert cursor is None
+
+
+def test_resource_index_with_filters(audit_logs):
+    items, _ = audit_logs.query_logs(
+        resource_id="res-1", user_id="user-b", action="refresh_quota", limit=100
+    )
+
+    expected = [
+        NOW + i for i in range(39, -1, -1)
+        if i % 4 == 1 and i % 2 == 1 and i % 3
+    ]
+    assert [item["timestamp"] for item in items] == expected
+    assert all(item["details"]["index"] == item["timestamp"] - NOW for item in items)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"user_id": "user-b"}, {"resource_id": "res-2"}, {}, {"start_time": NOW + 5}],
+)
+def test_cursor_round_trip(audit_logs, filters):
+    everything, _ = audit_logs.query_logs(limit=1000, **filters)
+    paged, cursor, reads = [], None, 0
+    while True:
+        items, cursor = audit_logs.query_logs(limit=3, cursor=cursor, max_reads=1, **filters)
+        paged.extend(items)
+        reads += 1
+        if cursor is None:
+            break
+
+    assert reads > 1
+    assert sorted(i["log_id"] for i in paged) == sorted(i["log_id"] for i in everything)
+    assert len({i["log_id"] for i in paged}) == len(paged)
+    if filters.get("user_id") or filters.get("resource_id"):
+        timestamps = [i["timestamp"] for i in paged]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_cursor_rejected_for_another_query(audit_logs):
+    _, cursor = audit_logs.query_logs(user_id="user-a", limit=2, max_reads=1)
+
+    with pytest.raises(ValueError):
+        audit_logs.query_logs(resource_id="res-0", cursor=cursor)
+    with pytest.raises(ValueError):
+        audit_logs.query_logs(cursor="not-a-cursor")
+
+
+def test_parallel_scan_segments_partition_table(audit_logs):
+    segments = [
+        {item["log_id"] for item in audit_logs.query_logs(
+            limit=1000, segment=segment, total_segments=4
+        )[0]}
+        for segment in range(4)
+    ]
+    everything = {item["log_id"] for item in audit_logs.query_logs(limit=1000)[0]}
+
+    assert set().union(*segments) == everything
+    assert sum(len(segment) for segment in segments) == len(everything) == 40
+
+
+def test_segment_cursor_stays_in_segment(audit_logs):
+    first, cursor = audit_logs.query_logs(limit=2, max_reads=1, segment=1, total_segments=2)
+    rest, _ = audit_logs.query_logs(limit=1000, cursor=cursor, segment=1, total_segments=2)
+    segment, _ = audit_logs.query_logs(limit=1000, segment=1, total_segments=2)
+
+    assert {i["log_id"] for i in first + rest} == {i["log_id"] for i in segment}
+    with pytest.raises(ValueError):
+        audit_logs.query_logs(limit=10, cursor=cursor, segment=0, total_segments=2)
+
+
+def test_get_user_logs_newest_first(audit_logs):
+    items = audit_logs.get_user_logs("user-b", limit=5)
+
+    assert [item["timestamp"] for item in items] == [NOW + t for t in (39, 37, 35, 33, 31)]
@@ -106,6 +106,20 @@ export class DynamoDBStack extends cdk.Stack {
       projectionType: dynamodb.ProjectionType.ALL,
     });
 
+    // GSI: resource_id-timestamp-index (for per-account audit history)
+    this.auditLogsTable.addGlobalSecondaryIndex({
+      indexName: 'resource_id-timestamp-index',
+      partitionKey: {
+        name: 'resource_id',
+        type: dynamodb.AttributeType.STRING,
+      },
+      sortKey: {
+        name: 'timestamp',
+        type: dynamodb.AttributeType.NUMBER,
+      },
+      projectionType: dynamodb.ProjectionType.ALL,
+    });
+
     // ===================================================================
     // Table 4: Quota Config Table
     // ===================================================================
@@ -96,6 +96,8 @@ export class ECSStack extends cdk.Stack {
 
     // Grant KMS permissions for encryption/decryption
     ecsProps.encryptionKey.grantEncryptDecrypt(taskRole);
+    // The /ready KMS probe calls DescribeKey
+    ecsProps.encryptionKey.grant(taskRole, 'kms:DescribeKey');
 
     // Grant permissions to call AWS services for account management
     taskRole.addToPolicy(
@@ -187,6 +189,7 @@ export class ECSStack extends cdk.Stack {
         HOST: '0.0.0.0',
         PORT: '8000',
       },
+      // Liveness only: dependency readiness (/ready) is the ALB target group check
       healthCheck: {
         command: ['CMD-SHELL', 'curl -f http://localhost:8000/health || exit 1'],
         interval: cdk.Duration.seconds(30),
@@ -117,9 +117,12 @@ export class NetworkStack extends cdk.Stack {
       protocol: elbv2.ApplicationProtocol.HTTP,
       targetType: elbv2.TargetType.IP,
 
-      // Health check configuration
+      // Health check configuration: /ready (cached DynamoDB/KMS/JWKS probes,
+      // 503 while a dependency is down) so traffic only reaches tasks that can
+      // serve it. The container health check keeps using /health (liveness), so
+      // ECS does not restart tasks during a dependency outage.
       healthCheck: {
-        path: '/health',
+        path: '/ready',
         interval: cdk.Duration.seconds(30),
         timeout: cdk.Duration.seconds(5),
         healthyThresholdCount: 2,